@@ -3,7 +3,10 @@
 list(APPEND EXTRA_DTC_FLAGS "-Wno-unique_unit_address_if_enabled")
 set(USER_C_MODULES 
     "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modadc"
+    "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modadpcm"
+    "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modahrs"
     "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modlowpwr"
     "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modpdm"
     "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modrtc"
+    "${CMAKE_CURRENT_LIST_DIR}/../../../src/cmodules/modspectrum"
 )
\ No newline at end of file
@@ -0,0 +1,46 @@
+import time
+import sys
+import gc
+from array import array
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoADC
+    adc = 0    #D0
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 or XIAO MG24.")
+
+READS = 1000
+BULK = 1000
+
+# Rate and heap use of READS calls of one read method
+def bench(name, fn):
+    gc.collect()
+    free = gc.mem_free()
+    start = time.ticks_us()
+    for _ in range(READS):
+        fn()
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("%-16s %7d reads/s  %5d bytes allocated" %
+          (name, READS * 1000000 // elapsed, free - gc.mem_free()))
+
+try:
+    adc = XiaoADC(adc)
+    buf = array("H", bytes(BULK * 2))
+    one = array("H", bytes(2))
+    # One Python call per sample
+    bench("read()", adc.read)
+    bench("read_u16()", adc.read_u16)
+    bench("read_uv()", adc.read_uv)
+    bench("read_into(1)", lambda: adc.read_into(one, 1))
+    # One Python call per block, samples back to back in a single sequence
+    gc.collect()
+    free = gc.mem_free()
+    start = time.ticks_us()
+    n = adc.read_into(buf)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("%-16s %7d samples/s %5d bytes allocated" %
+          ("read_into(%d)" % BULK, n * 1000000 // elapsed, free - gc.mem_free()))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
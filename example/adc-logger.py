@@ -0,0 +1,61 @@
+import time
+import sys
+from array import array
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoADC
+    led = "led"
+    adc = 0    #D0
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 or XIAO MG24.")
+
+RATE = 1000          # samples per second
+BLOCK = 250          # 250ms per block
+BLOCKS = 8           # 2s of buffering in the ring
+
+ready = False
+
+# Runs from the scheduler once half of the ring is full
+def on_watermark(a):
+    global ready
+    ready = True
+
+try:
+    led = XiaoPin(led, XiaoPin.OUT)
+    adc = XiaoADC(adc)
+    buf = array("H", bytes(BLOCK * 2))
+    adc.start(RATE, block=BLOCK, blocks=BLOCKS, callback=on_watermark, watermark=BLOCKS // 2)
+    last_stamp = None
+    samples = 0
+    first_stamp = None
+    while True:
+        # The main loop is free for other work while the ring fills
+        led.value(not led.value())
+        time.sleep_ms(100)
+        if not ready:
+            continue
+        ready = False
+        while True:
+            stamp = adc.read_block(buf)
+            if stamp is None:
+                break
+            if first_stamp is None:
+                first_stamp = stamp
+            samples += BLOCK
+            gap = time.ticks_diff(stamp, last_stamp) if last_stamp is not None else 0
+            last_stamp = stamp
+            print("t=%d us mean: %d min: %d max: %d block gap: %d us" %
+                  (stamp, sum(buf) // BLOCK, min(buf), max(buf), gap))
+        # Sustained rate over the whole run, from the block timestamps
+        span = time.ticks_diff(last_stamp, first_stamp)
+        if span > 0:
+            captured, overflows, pending = adc.stats()
+            print("rate: %d Hz, captured: %d, overflows: %d" %
+                  ((samples - BLOCK) * 1000000 // span, captured, overflows))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    adc.stop()
+    led.value(1)
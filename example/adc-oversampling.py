@@ -0,0 +1,32 @@
+import time
+import sys
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoADC
+    adc = 0    #D0
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 or XIAO MG24.")
+
+READS = 200
+
+# Spread of READS single reads, in microvolts
+def noise(a):
+    values = [a.read_uv() for _ in range(READS)]
+    mean = sum(values) // READS
+    var = sum((v - mean) * (v - mean) for v in values) // READS
+    return mean, var ** 0.5
+
+try:
+    # Calibrate once, then compare hardware oversampling settings
+    adc = XiaoADC(adc, resolution=12, calibrate=True, acq_time_us=10)
+    for oversampling in (0, 2, 4, 8):
+        adc.init(oversampling=oversampling)
+        start = time.ticks_us()
+        mean, sd = noise(adc)
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        print("oversampling: %3dx mean: %7d uV noise: %6.0f uV, %4d us per read" %
+              (1 << oversampling, mean, sd, elapsed // READS))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
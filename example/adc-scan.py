@@ -0,0 +1,30 @@
+import time
+import sys
+from array import array
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoADCGroup
+    en = "vbat_en"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 or XIAO MG24.")
+
+CHANNELS = (0, 1, 2, 3, 4, 5, "vbat")    # D0-D5 and the battery
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    # The channel mask is set up once, every scan is a single ADC sequence
+    group = XiaoADCGroup(CHANNELS)
+    scan = array("H", bytes(len(CHANNELS) * 2))
+    while True:
+        start = time.ticks_us()
+        group.read_into(scan)
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        print(" ".join("%s:%4d" % (name, value) for name, value in zip(CHANNELS, scan)), "(%d us)" % elapsed)
+        time.sleep(0.5)
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    en.value(0)
@@ -0,0 +1,32 @@
+import time
+import sys
+from array import array
+
+if ("nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine or
+        "ESP32C5" in sys.implementation._machine):
+    from boards.xiao import XiaoADC
+    adc = 0    #D0
+else:
+    raise Exception("This code can only run on XIAO nRF54L15, XIAO MG24 or XIAO ESP32C5.")
+
+RATE = 4000          # samples per second
+SAMPLES = 400        # 100ms waveform
+
+try:
+    adc = XiaoADC(adc)
+    buf = array("H", bytes(SAMPLES * 2))
+    while True:
+        # The whole waveform is taken in one ADC sequence, timed by the driver
+        start = time.ticks_us()
+        n = adc.read_timed(buf, RATE)
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        low = min(buf)
+        high = max(buf)
+        mean = sum(buf) // n
+        print("%d samples in %d us (%d Hz), min: %d max: %d mean: %d" %
+              (n, elapsed, n * 1000000 // elapsed, low, high, mean))
+        time.sleep(1)
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
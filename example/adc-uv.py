@@ -0,0 +1,29 @@
+import time
+import sys
+from array import array
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoADC
+    adc = 0    #D0
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 or XIAO MG24.")
+
+SAMPLES = 500
+
+try:
+    adc = XiaoADC(adc, calibrate=True)
+    raw = array("H", bytes(SAMPLES * 2))
+    uv = array("i", bytes(SAMPLES * 4))
+    while True:
+        # Sample a block, then convert all of it to microvolts in one call
+        adc.read_into(raw)
+        start = time.ticks_us()
+        adc.uv_into(raw, uv)
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        print("mean: %d uV min: %d uV max: %d uV, %d samples converted in %d us" %
+              (sum(uv) // SAMPLES, min(uv), max(uv), SAMPLES, elapsed))
+        time.sleep(1)
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
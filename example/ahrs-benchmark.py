@@ -0,0 +1,113 @@
+import time
+import sys
+import math
+from array import array
+
+if "nrf54l15" in sys.implementation._machine or "mg24" in sys.implementation._machine:
+    from AHRS import AHRS
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense and XIAO MG24 Sense.")
+
+RATE = 416
+BATCH = 256          # samples per update() call
+ROUNDS = 20
+# Optional accuracy check against the host reference. Create a short log with
+#   python3 tools/ahrs/ahrs.py simulate ahrs_log.csv --seconds 2
+# copy it to the board, run this script, copy back the quaternions and run
+#   python3 tools/ahrs/ahrs.py verify ahrs_log.csv ahrs_q.csv
+LOG_PATH = "/flash/ahrs_log.csv"
+OUT_PATH = "/flash/ahrs_q.csv"
+
+# A slow rotation about Z with gravity on Z, laid out like read_into()
+def make_samples(n):
+    samples = array("h", bytes(n * 12))
+    for i in range(n):
+        samples[6 * i + 2] = 1000
+        samples[6 * i + 5] = 16384
+    return samples
+
+# The same filter step in plain Python, for comparison
+def python_update(q, g, a, beta, dt):
+    q0, q1, q2, q3 = q
+    gx, gy, gz = g
+    ax, ay, az = a
+    qd0 = 0.5 * (-q1 * gx - q2 * gy - q3 * gz)
+    qd1 = 0.5 * (q0 * gx + q2 * gz - q3 * gy)
+    qd2 = 0.5 * (q0 * gy - q1 * gz + q3 * gx)
+    qd3 = 0.5 * (q0 * gz + q1 * gy - q2 * gx)
+    n = 1 / math.sqrt(ax * ax + ay * ay + az * az)
+    ax *= n
+    ay *= n
+    az *= n
+    s0 = 4 * q0 * q2 * q2 + 2 * q2 * ax + 4 * q0 * q1 * q1 - 2 * q1 * ay
+    s1 = 4 * q1 * q3 * q3 - 2 * q3 * ax + 4 * q0 * q0 * q1 - 2 * q0 * ay - 4 * q1 + 8 * q1 * q1 * q1 + 8 * q1 * q2 * q2 + 4 * q1 * az
+    s2 = 4 * q0 * q0 * q2 + 2 * q0 * ax + 4 * q2 * q3 * q3 - 2 * q3 * ay - 4 * q2 + 8 * q2 * q1 * q1 + 8 * q2 * q2 * q2 + 4 * q2 * az
+    s3 = 4 * q1 * q1 * q3 - 2 * q1 * ax + 4 * q2 * q2 * q3 - 2 * q2 * ay
+    n = s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3
+    if n > 0:
+        n = beta / math.sqrt(n)
+        qd0 -= n * s0
+        qd1 -= n * s1
+        qd2 -= n * s2
+        qd3 -= n * s3
+    q0 += qd0 * dt
+    q1 += qd1 * dt
+    q2 += qd2 * dt
+    q3 += qd3 * dt
+    n = 1 / math.sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3)
+    return q0 * n, q1 * n, q2 * n, q3 * n
+
+def replay():
+    try:
+        f = open(LOG_PATH)
+    except OSError:
+        return
+    ahrs = AHRS(RATE)
+    sample = array("h", bytes(12))
+    q = array("f", bytes(16))
+    count = 0
+    with f, open(OUT_PATH, "w") as out:
+        f.readline()
+        for line in f:
+            fields = line.split(",")
+            for i in range(6):
+                sample[i] = int(fields[i])
+            ahrs.update(sample)
+            ahrs.quaternion(q)
+            out.write("%.6f,%.6f,%.6f,%.6f\n" % tuple(q))
+            count += 1
+    print("Replayed %d samples from %s into %s" % (count, LOG_PATH, OUT_PATH))
+
+try:
+    samples = make_samples(BATCH)
+    ahrs = AHRS(RATE)
+
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        ahrs.update(samples)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("AHRS.update, %d per call:  %6d samples/s" % (BATCH, ROUNDS * BATCH * 1000000 // elapsed))
+
+    one = make_samples(1)
+    start = time.ticks_us()
+    for _ in range(ROUNDS * BATCH):
+        ahrs.update(one)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("AHRS.update, 1 per call:    %6d samples/s" % (ROUNDS * BATCH * 1000000 // elapsed))
+
+    q = (1.0, 0.0, 0.0, 0.0)
+    scale = 8750e-6 * math.pi / 180
+    g = (0.0, 0.0, 1000 * scale)
+    a = (0, 0, 16384)
+    start = time.ticks_us()
+    for _ in range(BATCH):
+        q = python_update(q, g, a, 0.1, 1 / RATE)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("Python filter step:         %6d samples/s" % (BATCH * 1000000 // elapsed))
+    print("Needed for %d Hz:           %6d samples/s" % (RATE, RATE))
+
+    replay()
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
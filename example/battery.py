@@ -1,26 +1,17 @@
-import time  
-from boards.xiao import XiaoPin, XiaoADC  #If you are using XIAO RA4M1, you must delete this line
+import time
+from boards.battery_monitor import BatteryMonitor
 
-adc = "vbat"
-en = "vbat_en"        
+INTERVAL_MS = 10000    # one measurement every 10s
+
+def report(monitor):
+    print("Battery Voltage: {:.4f} V, charge: {:.0f}%, divider duty cycle: {:.4f}%".format(
+        monitor.voltage_mv / 1000, monitor.soc, monitor.duty_cycle() * 100))
 
 try:
-    # Enable vbat
-    en = XiaoPin(en, XiaoPin.OUT)  
-    en.value(1) 
-    # Create an ADC object on the ADC pin
-    adc = XiaoADC(adc)  
-    while True:
-        # Read the battery voltage in microvolts and convert to volts
-        vbat = adc.read_uv() / 1000000  
-        print("Battery Voltage: {:.4f} V".format(vbat)) 
-        time.sleep(0.1)
+    # The vbat divider is only enabled for a short burst per measurement
+    monitor = BatteryMonitor(interval_ms=INTERVAL_MS)
+    monitor.run(report)
 except KeyboardInterrupt:
     print("\nProgram interrupted by user")
 except Exception as e:
     print("\nError occurred: %s" % {e})
-finally:
-    en.value(0)
-    
-
-
@@ -0,0 +1,104 @@
+import time
+from array import array
+from boards.xiao import XiaoPin, XiaoADC  #If you are using XIAO RA4M1, you must delete this line
+
+# Open-circuit voltage (mV) to state of charge (%) of a single Li-ion cell
+SOC_TABLE = (
+    (3300, 0), (3400, 5), (3500, 10), (3600, 20), (3700, 35),
+    (3800, 50), (3900, 65), (4000, 80), (4100, 90), (4200, 100),
+)
+
+# Low-duty battery monitor on "vbat"/"vbat_en". The divider is only enabled
+# for one burst per interval: enable, wait for it to settle, take an
+# oversampled burst, disable. Readings go through an exponential filter
+# before the state of charge is looked up.
+class BatteryMonitor:
+    def __init__(self, interval_ms=60000, settle_ms=5, samples=16, alpha=0.25, divider=1.0):
+        self.interval_ms = interval_ms
+        self.settle_ms = settle_ms
+        self.samples = samples
+        self.alpha = alpha
+        # Ratio of the battery voltage to the voltage the ADC sees
+        self.divider = divider
+        self.voltage_mv = None
+        self.soc = None
+        self._en = XiaoPin("vbat_en", XiaoPin.OUT)
+        self._en.value(0)
+        self._adc = XiaoADC("vbat")
+        # Zephyr boards average in hardware and convert a whole burst in C
+        self._raw = None
+        if hasattr(self._adc, "uv_into"):
+            self._adc.init(oversampling=4)
+            self._raw = array("H", bytes(samples * 2))
+            self._uv = array("i", bytes(samples * 4))
+        self._start = time.ticks_ms()
+        self._next = self._start
+        self._on_us = 0
+        self.measurements = 0
+
+    # Mean of one burst of samples in microvolts, at the ADC pin
+    def _burst_uv(self):
+        if self._raw is not None:
+            self._adc.read_into(self._raw)
+            self._adc.uv_into(self._raw, self._uv)
+            return sum(self._uv) // self.samples
+        total = 0
+        for _ in range(self.samples):
+            total += self._adc.read_uv()
+        return total // self.samples
+
+    # Take one measurement now, returns the filtered battery voltage in mV
+    def measure(self):
+        start = time.ticks_us()
+        self._en.value(1)
+        try:
+            time.sleep_ms(self.settle_ms)
+            uv = self._burst_uv()
+        finally:
+            self._en.value(0)
+        self._on_us += time.ticks_diff(time.ticks_us(), start)
+        mv = uv * self.divider / 1000
+        if self.voltage_mv is None:
+            self.voltage_mv = mv
+        else:
+            self.voltage_mv += self.alpha * (mv - self.voltage_mv)
+        self.soc = soc_from_mv(self.voltage_mv)
+        self.measurements += 1
+        return self.voltage_mv
+
+    # Measure if the interval has elapsed; call this from a main loop.
+    # Returns True when a new measurement was taken.
+    def update(self):
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self._next) < 0:
+            return False
+        self._next = time.ticks_add(now, self.interval_ms)
+        self.measure()
+        return True
+
+    # Milliseconds until the next measurement is due
+    def time_to_next(self):
+        return max(0, time.ticks_diff(self._next, time.ticks_ms()))
+
+    # Fraction of the run time the divider was enabled
+    def duty_cycle(self):
+        elapsed_us = time.ticks_diff(time.ticks_ms(), self._start) * 1000
+        return self._on_us / elapsed_us if elapsed_us > 0 else 0
+
+    # Measure forever at the configured cadence, sleeping in between
+    def run(self, callback):
+        while True:
+            if self.update():
+                callback(self)
+            time.sleep_ms(self.time_to_next())
+
+# Linear interpolation in SOC_TABLE
+def soc_from_mv(mv):
+    if mv <= SOC_TABLE[0][0]:
+        return 0
+    for i in range(1, len(SOC_TABLE)):
+        v1, s1 = SOC_TABLE[i]
+        if mv < v1:
+            v0, s0 = SOC_TABLE[i - 1]
+            return s0 + (s1 - s0) * (mv - v0) / (v1 - v0)
+    return 100
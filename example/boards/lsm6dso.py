@@ -0,0 +1,162 @@
+# --- LSM6DSO I2C address and register definitions ---
+LSM6DSO_I2C_ADDR = 0x6A         # LSM6DSO I2C device address
+LSM6DSO_REG_FIFO_CTRL1 = 0x07   # FIFO watermark, low byte
+LSM6DSO_REG_FIFO_CTRL2 = 0x08   # FIFO watermark bit 8
+LSM6DSO_REG_FIFO_CTRL3 = 0x09   # Gyroscope/accelerometer batch data rates
+LSM6DSO_REG_FIFO_CTRL4 = 0x0A   # FIFO mode
+LSM6DSO_REG_INT1_CTRL = 0x0D    # INT1 pin routing
+LSM6DSO_REG_WHO_AM_I = 0x0F     # Identification register
+LSM6DSO_VAL_WHO_AM_I = 0x6A     # Expected WHO_AM_I value
+LSM6DSO_REG_CTRL1_XL = 0x10     # Accelerometer control register
+LSM6DSO_REG_CTRL2_G = 0x11      # Gyroscope control register
+LSM6DSO_REG_CTRL3_C = 0x12      # Block data update, address auto-increment
+LSM6DSO_REG_OUTX_L_G = 0x22     # Gyroscope X low byte, accelerometer follows at 0x28
+LSM6DSO_REG_FIFO_STATUS1 = 0x3A # Words in the FIFO, low byte
+LSM6DSO_REG_FIFO_STATUS2 = 0x3B # Words in the FIFO bits 9:8 and flags
+LSM6DSO_REG_FIFO_DATA_OUT_TAG = 0x78    # Tag of the oldest word, then 6 data bytes
+
+FIFO_MODE_BYPASS = 0
+FIFO_MODE_CONTINUOUS = 6
+FIFO_WORD_SIZE = 7              # tag + X, Y, Z as 16-bit little endian
+FIFO_DEPTH = 512                # words, shared by all batched sensors
+
+# FIFO tag sensor codes (tag >> 3)
+TAG_GYRO = 0x01
+TAG_ACCEL = 0x02
+
+# FIFO_STATUS2 flags
+FIFO_WTM_IA = 0x80
+FIFO_OVR_IA = 0x40
+FIFO_FULL_IA = 0x20
+
+# ODR and batch data rate register codes, by rate in Hz
+ODR_CODES = {
+    12: 1, 26: 2, 52: 3, 104: 4, 208: 5, 416: 6, 833: 7, 1666: 8, 3332: 9, 6664: 10,
+}
+
+# Full-scale register bits and sensitivity, accel in ug/LSB, gyro in udps/LSB
+ACCEL_RANGES = {2: (0b00, 61), 4: (0b10, 122), 8: (0b11, 244), 16: (0b01, 488)}
+GYRO_RANGES = {250: (0b00, 8750), 500: (0b01, 17500), 1000: (0b10, 35000), 2000: (0b11, 70000)}
+
+# LSM6DSO driver with FIFO batching. Accel and gyro are batched into the
+# on-chip FIFO at the ODR and drained with one burst read of many words, so
+# high rates do not depend on Python polling each sample. Works with any I2C
+# object that has readfrom_mem_into/writeto_mem (XiaoI2C, SoftI2C).
+class LSM6DSO:
+    def __init__(self, i2c, addr=LSM6DSO_I2C_ADDR, odr=416, accel_range=2, gyro_range=250, max_words=128):
+        if odr not in ODR_CODES:
+            raise ValueError("odr must be one of %s" % sorted(ODR_CODES))
+        if accel_range not in ACCEL_RANGES or gyro_range not in GYRO_RANGES:
+            raise ValueError("Invalid accel or gyro range")
+        self.i2c = i2c
+        self.addr = addr
+        self.odr = odr
+        self.accel_ug = ACCEL_RANGES[accel_range][1]
+        self.gyro_udps = GYRO_RANGES[gyro_range][1]
+        self.overruns = 0
+        self.dropped = 0
+        # Preallocated buffers for register access and FIFO bursts
+        self._reg = bytearray(1)
+        self._status = bytearray(2)
+        self._fifo = bytearray(max_words * FIFO_WORD_SIZE)
+        self._fifo_mv = memoryview(self._fifo)
+        self.max_words = max_words
+
+        if self._read_reg(LSM6DSO_REG_WHO_AM_I) != LSM6DSO_VAL_WHO_AM_I:
+            raise Exception("LSM6DSO WHO_AM_I mismatch")
+        # Block data update and register address auto-increment
+        self._write_reg(LSM6DSO_REG_CTRL3_C, 0x44)
+        code = ODR_CODES[odr]
+        self._write_reg(LSM6DSO_REG_CTRL1_XL, code << 4 | ACCEL_RANGES[accel_range][0] << 2)
+        self._write_reg(LSM6DSO_REG_CTRL2_G, code << 4 | GYRO_RANGES[gyro_range][0] << 2)
+
+    def _write_reg(self, reg, value):
+        self._reg[0] = value
+        self.i2c.writeto_mem(self.addr, reg, self._reg)
+
+    def _read_reg(self, reg):
+        self.i2c.readfrom_mem_into(self.addr, reg, self._reg)
+        return self._reg[0]
+
+    # Read the latest gyro and accel sample with one 12-byte burst straight
+    # into out, an array('h') of 6 items: gyro X, Y, Z then accel X, Y, Z.
+    # The output registers are contiguous little-endian int16, the same
+    # layout as the array on these MCUs, so nothing is decoded or allocated.
+    def read_into(self, out):
+        if len(out) != 6:
+            raise ValueError("out must hold 6 items")
+        self.i2c.readfrom_mem_into(self.addr, LSM6DSO_REG_OUTX_L_G, out)
+        return out
+
+    # Batch accel and gyro into the FIFO at the ODR, in continuous mode. The
+    # watermark is in FIFO words (one per sensor sample); with int1=True the
+    # watermark flag is also routed to the INT1 pin.
+    def fifo_start(self, watermark=64, int1=False):
+        if not 1 <= watermark < FIFO_DEPTH:
+            raise ValueError("watermark must be 1 to %d" % (FIFO_DEPTH - 1))
+        # Bypass mode empties the FIFO
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL4, FIFO_MODE_BYPASS)
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL1, watermark & 0xFF)
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL2, watermark >> 8)
+        code = ODR_CODES[self.odr]
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL3, code << 4 | code)
+        self._write_reg(LSM6DSO_REG_INT1_CTRL, 0x08 if int1 else 0x00)
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL4, FIFO_MODE_CONTINUOUS)
+        self.overruns = 0
+        self.dropped = 0
+
+    def fifo_stop(self):
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL4, FIFO_MODE_BYPASS)
+        self._write_reg(LSM6DSO_REG_FIFO_CTRL3, 0x00)
+
+    # Returns (words waiting, watermark reached); counts overruns
+    def fifo_level(self):
+        self.i2c.readfrom_mem_into(self.addr, LSM6DSO_REG_FIFO_STATUS1, self._status)
+        status = self._status[1]
+        if status & FIFO_OVR_IA:
+            self.overruns += 1
+        return self._status[0] | (status & 0x03) << 8, bool(status & FIFO_WTM_IA)
+
+    # Drain up to max_words FIFO words in one burst and decode them into
+    # accel and gyro, array('h') objects holding X, Y, Z per sample.
+    # Returns (accel samples, gyro samples) written. The burst is capped at
+    # the room in both arrays together, so when one sensor's words outnumber
+    # its array the excess is already out of the FIFO; those samples are
+    # counted in dropped. Size the arrays alike to avoid that.
+    def read_fifo(self, accel, gyro):
+        words, _ = self.fifo_level()
+        words = min(words, self.max_words, len(accel) // 3 + len(gyro) // 3)
+        if words == 0:
+            return 0, 0
+        self.i2c.readfrom_mem_into(self.addr, LSM6DSO_REG_FIFO_DATA_OUT_TAG,
+                                   self._fifo_mv[:words * FIFO_WORD_SIZE])
+        return self._decode(words, accel, gyro)
+
+    def _decode(self, words, accel, gyro):
+        buf = self._fifo
+        na = 0
+        ng = 0
+        max_a = len(accel) - 2
+        max_g = len(gyro) - 2
+        for i in range(0, words * FIFO_WORD_SIZE, FIFO_WORD_SIZE):
+            tag = buf[i] >> 3
+            if tag == TAG_ACCEL and na < max_a:
+                out = accel
+                j = na
+                na += 3
+            elif tag == TAG_GYRO and ng < max_g:
+                out = gyro
+                j = ng
+                ng += 3
+            else:
+                if tag == TAG_ACCEL or tag == TAG_GYRO:
+                    self.dropped += 1
+                continue
+            # Little-endian 16-bit two's complement, without allocating
+            v = buf[i + 1] | buf[i + 2] << 8
+            out[j] = v - ((v & 0x8000) << 1)
+            v = buf[i + 3] | buf[i + 4] << 8
+            out[j + 1] = v - ((v & 0x8000) << 1)
+            v = buf[i + 5] | buf[i + 6] << 8
+            out[j + 2] = v - ((v & 0x8000) << 1)
+        return na // 3, ng // 3
@@ -0,0 +1,295 @@
+from array import array
+
+# Sentence types, returned as a bit mask by feed()
+GGA = 0x01
+RMC = 0x02
+GSA = 0x04
+VTG = 0x08
+
+# Sentence type letters packed into one int, talker ID ignored
+_GGA = 0x474741
+_RMC = 0x524D43
+_GSA = 0x475341
+_VTG = 0x565447
+
+# Most fields located in one sentence, GSA up to VDOP
+_MAX_FIELDS = 18
+
+# Streaming NMEA 0183 parser. Bytes are fed as they arrive from the UART;
+# sentence starts and ends are found with find() on the caller's buffer,
+# and a sentence is parsed in place there. Only a sentence split across
+# reads is copied, into a fixed buffer. The checksum is checked once per
+# complete sentence and the field offsets are found with find(), so Python
+# only walks the digits of the fields it decodes. There are no split()
+# lists, per-field strings or copies of whole reads.
+# Sentences with a missing or wrong *hh checksum are dropped and counted.
+#
+# Parsed values are plain ints:
+#   lat, lon               1e-6 degrees, negative for S and W
+#   hour, minute, second   UTC; day, month, year from RMC
+#   valid                  RMC status A
+#   fix, sats              GGA fix quality and satellites in use
+#   altitude               cm above mean sea level
+#   speed                  km/h x 100; course in degrees x 100
+#   fix_type, used         GSA 1 = none, 2 = 2D, 3 = 3D and satellites used
+#   pdop, hdop, vdop       dilution of precision x 100
+# A field that was empty in the last sentence carrying it is None.
+class NMEAParser:
+    def __init__(self, max_line=96):
+        self._max_line = max_line
+        # Room for a trailing CR, which is stripped once the LF arrives
+        self._part = bytearray(max_line + 1)
+        self._len = -1                          # -1 outside a sentence
+        self._line = b""
+        self._fields = array("I", bytes(4 * (_MAX_FIELDS + 1)))
+        self._nf = 0
+        self.sentences = 0
+        self.checksum_errors = 0
+        self.overflows = 0
+        self.lat = None
+        self.lon = None
+        self.hour = None
+        self.minute = None
+        self.second = None
+        self.day = None
+        self.month = None
+        self.year = None
+        self.valid = False
+        self.fix = 0
+        self.sats = 0
+        self.altitude = None
+        self.speed = None
+        self.course = None
+        self.fix_type = 1
+        self.used = 0
+        self.pdop = None
+        self.hdop = None
+        self.vdop = None
+
+    # Parse the first n bytes of buf (all of it by default), which may hold
+    # any part of one or more sentences. Returns a mask of the sentence
+    # types (GGA, RMC, GSA, VTG) that updated the values.
+    def feed(self, buf, n=None):
+        if n is None:
+            n = len(buf)
+        part = self._part
+        ln = self._len
+        updated = 0
+        pos = 0
+        while pos < n:
+            if ln < 0:
+                pos = buf.find(b"$", pos, n)
+                if pos < 0:
+                    break
+                pos += 1
+                ln = 0
+            stop = buf.find(b"\n", pos, n)
+            last = n if stop < 0 else stop
+            # A '$' before the end of the line starts the sentence again
+            restart = buf.rfind(b"$", pos, last)
+            if restart >= 0:
+                pos = restart + 1
+                ln = 0
+            k = last - pos
+            if ln + k > len(part):
+                self.overflows += 1
+                ln = -1
+                pos = last
+                continue
+            if stop < 0:
+                # Keep the start of the sentence for the next read
+                part[ln:ln + k] = buf[pos:n]
+                ln += k
+                break
+            if ln:
+                part[ln:ln + k] = buf[pos:stop]
+                updated |= self._finish(part, 0, ln + k)
+            else:
+                updated |= self._finish(buf, pos, stop)
+            ln = -1
+            pos = stop + 1
+        self._len = ln
+        return updated
+
+    # Check one sentence, line[start:end] between '$' and LF, and decode it
+    def _finish(self, line, start, end):
+        if end > start and line[end - 1] == 0x0D:     # CR
+            end -= 1
+        if end - start > self._max_line:
+            self.overflows += 1
+            return 0
+        star = line.find(b"*", start, end)
+        if star < 0 or end != star + 3:
+            self.checksum_errors += 1
+            return 0
+        cs = 0
+        for i in range(start, star):
+            cs ^= line[i]
+        if _hex(line[star + 1]) << 4 | _hex(line[star + 2]) != cs:
+            self.checksum_errors += 1
+            return 0
+        self.sentences += 1
+        if star < start + 6 or line[start + 5] != 0x2C:     # ','
+            return 0
+        kind = line[start + 2] << 16 | line[start + 3] << 8 | line[start + 4]
+        # Only the fields read below are located
+        if kind == _RMC or kind == _GGA:
+            count = 10
+        elif kind == _GSA:
+            count = 18
+        elif kind == _VTG:
+            count = 8
+        else:
+            return 0
+        # Field i runs from fields[i] up to the comma before fields[i + 1]
+        fields = self._fields
+        fields[0] = start
+        nf = 1
+        p = line.find(b",", start, star)
+        while p >= 0:
+            fields[nf] = p + 1
+            if nf == count:
+                break
+            nf += 1
+            p = line.find(b",", p + 1, star)
+        else:
+            fields[nf] = star + 1
+        self._nf = nf
+        self._line = line
+        if kind == _RMC:
+            self._parse_time(1)
+            self.valid = self._char(2) == 0x41      # 'A'
+            self.lat = self._coord(3, 2)
+            self.lon = self._coord(5, 3)
+            knots = self._fixed(7, 3)
+            self.speed = None if knots is None else knots * 1852 // 10000
+            self.course = self._fixed(8, 2)
+            date = self._fixed(9, 0)
+            if date is not None:
+                self.day = date // 10000
+                self.month = date // 100 % 100
+                self.year = 2000 + date % 100
+            return RMC
+        if kind == _GGA:
+            self._parse_time(1)
+            self.lat = self._coord(2, 2)
+            self.lon = self._coord(4, 3)
+            self.fix = self._fixed(6, 0) or 0
+            self.sats = self._fixed(7, 0) or 0
+            self.hdop = self._fixed(8, 2)
+            self.altitude = self._fixed(9, 2)
+            return GGA
+        if kind == _GSA:
+            self.fix_type = self._fixed(2, 0) or 1
+            used = 0
+            for i in range(3, min(15, nf)):
+                if fields[i + 1] - fields[i] > 1:
+                    used += 1
+            self.used = used
+            self.pdop = self._fixed(15, 2)
+            self.hdop = self._fixed(16, 2)
+            self.vdop = self._fixed(17, 2)
+            return GSA
+        if kind == _VTG:
+            self.course = self._fixed(1, 2)
+            self.speed = self._fixed(7, 2)
+            return VTG
+        return 0
+
+    # Length of field i, 0 when empty or missing
+    def _field_len(self, i):
+        if i >= self._nf:
+            return 0
+        return self._fields[i + 1] - self._fields[i] - 1
+
+    def _char(self, i):
+        if self._field_len(i) == 0:
+            return 0
+        return self._line[self._fields[i]]
+
+    # Field i as an int scaled by 10**places, extra decimals truncated
+    def _fixed(self, i, places):
+        n = self._field_len(i)
+        if n == 0:
+            return None
+        line = self._line
+        pos = self._fields[i]
+        end = pos + n
+        neg = line[pos] == 0x2D                 # '-'
+        if neg:
+            pos += 1
+        value = 0
+        frac = -1
+        while pos < end:
+            c = line[pos]
+            pos += 1
+            if c == 0x2E:                       # '.'
+                frac = 0
+            elif 0x30 <= c <= 0x39:
+                if frac < 0:
+                    value = value * 10 + c - 0x30
+                elif frac < places:
+                    value = value * 10 + c - 0x30
+                    frac += 1
+            else:
+                return None
+        if frac < 0:
+            frac = 0
+        while frac < places:
+            value *= 10
+            frac += 1
+        return -value if neg else value
+
+    # ddmm.mmmmm (dddmm.mmmmm for longitude) in field i and its hemisphere
+    # in field i + 1, converted to 1e-6 degrees
+    # The integer and fraction parts are read separately to stay within
+    # small ints.
+    def _coord(self, i, degree_digits):
+        n = self._field_len(i)
+        if n < degree_digits + 2:
+            return None
+        line = self._line
+        pos = self._fields[i]
+        end = pos + n
+        whole = 0
+        frac = 0
+        digits = -1
+        while pos < end:
+            c = line[pos]
+            pos += 1
+            if c == 0x2E:
+                digits = 0
+            elif not 0x30 <= c <= 0x39:
+                return None
+            elif digits < 0:
+                whole = whole * 10 + c - 0x30
+            elif digits < 6:
+                frac = frac * 10 + c - 0x30
+                digits += 1
+        while 0 < digits < 6:
+            frac *= 10
+            digits += 1
+        minutes = whole % 100 * 1000000 + frac
+        value = whole // 100 * 1000000 + (minutes + 30) // 60
+        c = self._char(i + 1)
+        if c == 0x53 or c == 0x57:              # 'S' or 'W'
+            value = -value
+        return value
+
+    def _parse_time(self, i):
+        t = self._fixed(i, 0)
+        if t is None:
+            return
+        self.hour = t // 10000
+        self.minute = t // 100 % 100
+        self.second = t % 100
+
+
+def _hex(c):
+    if 0x30 <= c <= 0x39:
+        return c - 0x30
+    if 0x41 <= c <= 0x46:
+        return c - 0x37
+    if 0x61 <= c <= 0x66:
+        return c - 0x57
+    return 0x100
@@ -0,0 +1,346 @@
+import struct
+
+# Records, returned as a bit mask by feed() and poll()
+NAV_PVT = 0x01      # UBX NAV-PVT
+NAV_PV = 0x02       # CASIC NAV-PV
+
+UBX_SYNC = b"\xb5\x62"
+CASIC_SYNC = b"\xba\xce"
+
+# Message class and ID pairs
+UBX_NAV_PVT = (0x01, 0x07)
+UBX_ACK_ACK = (0x05, 0x01)
+UBX_ACK_NAK = (0x05, 0x00)
+UBX_CFG_PRT = (0x06, 0x00)
+UBX_CFG_MSG = (0x06, 0x01)
+UBX_CFG_RATE = (0x06, 0x08)
+CASIC_NAV_PV = (0x01, 0x03)
+CASIC_ACK_ACK = (0x05, 0x01)
+CASIC_ACK_NAK = (0x05, 0x00)
+CASIC_CFG_MSG = (0x06, 0x01)
+
+# $PCAS01 baud rate codes of CASIC receivers such as the L76K
+PCAS_BAUDRATES = {4800: 0, 9600: 1, 19200: 2, 38400: 3, 57600: 4, 115200: 5}
+
+
+# UBX frame: sync, class, ID, little-endian length, payload, 8-bit Fletcher
+# checksum over class to the end of the payload
+def ubx_frame(msg, payload=b""):
+    frame = bytearray(8 + len(payload))
+    frame[0:2] = UBX_SYNC
+    struct.pack_into("<BBH", frame, 2, msg[0], msg[1], len(payload))
+    frame[6:6 + len(payload)] = payload
+    a = 0
+    b = 0
+    for i in range(2, 6 + len(payload)):
+        a = (a + frame[i]) & 0xFF
+        b = (b + a) & 0xFF
+    frame[-2] = a
+    frame[-1] = b
+    return frame
+
+
+# CASIC frame: sync, little-endian length, class, ID, payload (a multiple
+# of 4 bytes), then (ID << 24) + (class << 16) + length plus the payload
+# summed as 32-bit words
+def casic_frame(msg, payload=b""):
+    if len(payload) % 4:
+        raise ValueError("CASIC payload must be a multiple of 4 bytes")
+    frame = bytearray(10 + len(payload))
+    frame[0:2] = CASIC_SYNC
+    struct.pack_into("<HBB", frame, 2, len(payload), msg[0], msg[1])
+    frame[6:6 + len(payload)] = payload
+    total = (msg[1] << 24) + (msg[0] << 16) + len(payload)
+    for i in range(6, 6 + len(payload), 4):
+        total += struct.unpack_from("<I", frame, i)[0]
+    struct.pack_into("<I", frame, 6 + len(payload), total & 0xFFFFFFFF)
+    return frame
+
+
+# $PCAS text command with its NMEA checksum, e.g. pcas("PCAS02,100")
+def pcas(body):
+    cs = 0
+    for c in body.encode():
+        cs ^= c
+    return ("$%s*%02X\r\n" % (body, cs)).encode()
+
+
+# Degrees as a little-endian IEEE double at buf[offset] to 1e-7 degree int,
+# exact even where float is single precision
+def _double_e7(buf, offset):
+    bits = struct.unpack_from("<Q", buf, offset)[0]
+    exp = (bits >> 52) & 0x7FF
+    if exp == 0:
+        return 0
+    value = ((bits & 0xFFFFFFFFFFFFF) | 0x10000000000000) * 10000000
+    shift = 1075 - exp
+    if shift > 0:
+        value = (value + (1 << (shift - 1))) >> shift
+    else:
+        value <<= -shift
+    return -value if bits >> 63 else value
+
+
+# UBX NAV-PVT navigation solution, 92-byte payload. Units as sent: lon/lat
+# 1e-7 degrees, height/accuracy mm, velocity mm/s, heading 1e-5 degrees,
+# pdop x 100. fix_type 0 = none, 2 = 2D, 3 = 3D.
+class NavPVT:
+    FORMAT = "<IHBBBBBBIiBBBBiiiiIIiiiiiIIH"
+    SIZE = 92
+
+    def __init__(self):
+        self.itow = 0
+        self.year = self.month = self.day = 0
+        self.hour = self.minute = self.second = 0
+        self.valid = 0
+        self.t_acc = 0
+        self.nano = 0
+        self.fix_type = 0
+        self.flags = 0
+        self.flags2 = 0
+        self.num_sv = 0
+        self.lon = self.lat = 0
+        self.height = self.hmsl = 0
+        self.h_acc = self.v_acc = 0
+        self.vel_n = self.vel_e = self.vel_d = 0
+        self.g_speed = 0
+        self.head_mot = 0
+        self.s_acc = 0
+        self.head_acc = 0
+        self.pdop = 0
+
+    def unpack(self, buf, offset=0):
+        (self.itow, self.year, self.month, self.day, self.hour, self.minute, self.second,
+         self.valid, self.t_acc, self.nano, self.fix_type, self.flags, self.flags2,
+         self.num_sv, self.lon, self.lat, self.height, self.hmsl, self.h_acc, self.v_acc,
+         self.vel_n, self.vel_e, self.vel_d, self.g_speed, self.head_mot, self.s_acc,
+         self.head_acc, self.pdop) = struct.unpack_from(self.FORMAT, buf, offset)
+
+    # gnssFixOK flag
+    @property
+    def fix_ok(self):
+        return bool(self.flags & 0x01)
+
+
+# CASIC NAV-PV position and velocity, 80-byte payload. lon/lat are converted
+# to 1e-7 degrees like NavPVT; the rest are floats in m, m/s and degrees.
+class NavPV:
+    FORMAT = "<IBBBBBBBxf16xffffffffffff"
+    SIZE = 80
+
+    def __init__(self):
+        self.run_time = 0
+        self.pos_valid = 0
+        self.vel_valid = 0
+        self.system = 0
+        self.num_sv = 0
+        self.num_sv_gps = self.num_sv_bds = self.num_sv_gln = 0
+        self.pdop = 0.0
+        self.lon = self.lat = 0
+        self.height = 0.0
+        self.sep_geoid = 0.0
+        self.h_acc = self.v_acc = 0.0
+        self.vel_n = self.vel_e = self.vel_u = 0.0
+        self.speed_3d = self.speed_2d = 0.0
+        self.heading = 0.0
+        self.s_acc = self.c_acc = 0.0
+
+    def unpack(self, buf, offset=0):
+        (self.run_time, self.pos_valid, self.vel_valid, self.system, self.num_sv,
+         self.num_sv_gps, self.num_sv_bds, self.num_sv_gln, self.pdop,
+         self.height, self.sep_geoid, self.h_acc, self.v_acc, self.vel_n, self.vel_e,
+         self.vel_u, self.speed_3d, self.speed_2d, self.heading, self.s_acc,
+         self.c_acc) = struct.unpack_from(self.FORMAT, buf, offset)
+        self.lon = _double_e7(buf, offset + 16)
+        self.lat = _double_e7(buf, offset + 24)
+
+
+# Streaming binary frame reader. Bytes from the UART are scanned for the two
+# sync bytes, then the header and the rest of the frame are copied into a
+# fixed buffer in bulk. Frames with a bad checksum or longer than the
+# buffer are dropped and counted; text such as NMEA between frames is
+# skipped. callback, if given, is called with the reader after every record,
+# so no solution is missed when one read holds several frames.
+class _FrameReader:
+    SYNC = b""
+    TRAILER = 0
+
+    def __init__(self, max_payload=128, rxbuf=256, callback=None):
+        self._callback = callback
+        self._sync1 = self.SYNC[:1]
+        self._frame = bytearray(4 + max_payload + self.TRAILER)
+        self._rx = bytearray(rxbuf)
+        self._state = 0
+        self._pos = 0
+        self._need = 4
+        self.frames = 0
+        self.checksum_errors = 0
+        self.overflows = 0
+        self.acks = 0
+        self.naks = 0
+
+    # Parse the first n bytes of buf (all of it by default). Returns a mask
+    # of the records (NAV_PVT, NAV_PV) updated.
+    def feed(self, buf, n=None):
+        if n is None:
+            n = len(buf)
+        mv = memoryview(buf)
+        frame = self._frame
+        sync1 = self.SYNC[0]
+        sync2 = self.SYNC[1]
+        state = self._state
+        pos = self._pos
+        need = self._need
+        updated = 0
+        i = 0
+        while i < n:
+            if state == 0:
+                # Jump to the next candidate sync byte
+                i = buf.find(self._sync1, i, n)
+                if i < 0:
+                    break
+                state = 1
+                i += 1
+            elif state == 1:
+                b = buf[i]
+                if b == sync2:
+                    state = 2
+                    pos = 0
+                    need = 4
+                elif b != sync1:
+                    state = 0
+                i += 1
+            else:
+                k = min(need - pos, n - i)
+                frame[pos:pos + k] = mv[i:i + k]
+                pos += k
+                i += k
+                if pos < need:
+                    continue
+                if need == 4:
+                    need = 4 + self._length(frame) + self.TRAILER
+                    if need > len(frame):
+                        self.overflows += 1
+                        state = 0
+                    continue
+                state = 0
+                length = need - 4 - self.TRAILER
+                if self._check(frame, length):
+                    self.frames += 1
+                    record = self._dispatch(frame, length)
+                    if record and self._callback is not None:
+                        self._callback(self)
+                    updated |= record
+                else:
+                    self.checksum_errors += 1
+        self._state = state
+        self._pos = pos
+        self._need = need
+        return updated
+
+    # Read whatever the UART has buffered and parse it
+    def poll(self, uart):
+        if uart.any() == 0:
+            return 0
+        n = uart.readinto(self._rx)
+        return self.feed(self._rx, n) if n else 0
+
+
+# UBX reader for u-blox receivers, keeping the latest NAV-PVT in pvt
+class UBXReader(_FrameReader):
+    SYNC = UBX_SYNC
+    TRAILER = 2
+
+    def __init__(self, max_payload=128, rxbuf=256, callback=None):
+        super().__init__(max_payload, rxbuf, callback)
+        self.pvt = NavPVT()
+
+    def _length(self, frame):
+        return frame[2] | frame[3] << 8
+
+    def _check(self, frame, length):
+        a = 0
+        b = 0
+        for i in range(4 + length):
+            a = (a + frame[i]) & 0xFF
+            b = (b + a) & 0xFF
+        return a == frame[4 + length] and b == frame[5 + length]
+
+    def _dispatch(self, frame, length):
+        cls = frame[0]
+        msg_id = frame[1]
+        if cls == UBX_NAV_PVT[0] and msg_id == UBX_NAV_PVT[1] and length == NavPVT.SIZE:
+            self.pvt.unpack(frame, 4)
+            return NAV_PVT
+        if cls == UBX_ACK_ACK[0]:
+            if msg_id == UBX_ACK_ACK[1]:
+                self.acks += 1
+            elif msg_id == UBX_ACK_NAK[1]:
+                self.naks += 1
+        return 0
+
+    # Switch UART1 of the receiver to UBX-only output at baudrate (8N1),
+    # then enable NAV-PVT every solution at one per rate_ms. The receiver
+    # changes baud rate after CFG-PRT; reopen the XiaoUART to match.
+    @staticmethod
+    def configure(uart, baudrate, rate_ms=100):
+        uart.write(ubx_frame(UBX_CFG_RATE, struct.pack("<HHH", rate_ms, 1, 1)))
+        uart.write(ubx_frame(UBX_CFG_MSG, bytes((UBX_NAV_PVT[0], UBX_NAV_PVT[1], 1))))
+        # portID 1, 8N1, in UBX+NMEA+RTCM, out UBX
+        uart.write(ubx_frame(UBX_CFG_PRT, struct.pack("<BBHIIHHHH", 1, 0, 0, 0x08D0, baudrate,
+                                                      0x0007, 0x0001, 0, 0)))
+
+
+# CASIC reader for receivers such as the Quectel L76K on the XIAO GPS
+# module, keeping the latest NAV-PV in pv
+class CASICReader(_FrameReader):
+    SYNC = CASIC_SYNC
+    TRAILER = 4
+
+    def __init__(self, max_payload=128, rxbuf=256, callback=None):
+        super().__init__(max_payload, rxbuf, callback)
+        self.pv = NavPV()
+
+    def _length(self, frame):
+        return frame[0] | frame[1] << 8
+
+    def _check(self, frame, length):
+        if length & 3:
+            return False
+        # 32-bit sum kept as two 16-bit halves to stay within small ints
+        lo = length
+        hi = frame[3] << 8 | frame[2]
+        for i in range(4, 4 + length, 4):
+            lo += frame[i] | frame[i + 1] << 8
+            hi += frame[i + 2] | frame[i + 3] << 8
+        hi = (hi + (lo >> 16)) & 0xFFFF
+        lo &= 0xFFFF
+        e = 4 + length
+        return lo == frame[e] | frame[e + 1] << 8 and hi == frame[e + 2] | frame[e + 3] << 8
+
+    def _dispatch(self, frame, length):
+        cls = frame[2]
+        msg_id = frame[3]
+        if cls == CASIC_NAV_PV[0] and msg_id == CASIC_NAV_PV[1] and length == NavPV.SIZE:
+            self.pv.unpack(frame, 4)
+            return NAV_PV
+        if cls == CASIC_ACK_ACK[0]:
+            if msg_id == CASIC_ACK_ACK[1]:
+                self.acks += 1
+            elif msg_id == CASIC_ACK_NAK[1]:
+                self.naks += 1
+        return 0
+
+    # Turn the NMEA sentences off and NAV-PV on, one per rate_ms
+    @staticmethod
+    def configure(uart, rate_ms=100):
+        uart.write(pcas("PCAS02,%d" % rate_ms))
+        uart.write(pcas("PCAS03,0,0,0,0,0,0,0,0,0,0,,,0,0"))
+        uart.write(casic_frame(CASIC_CFG_MSG, struct.pack("<BBH", CASIC_NAV_PV[0], CASIC_NAV_PV[1], 1)))
+
+    # Command to change the receiver's baud rate; reopen the XiaoUART after
+    @staticmethod
+    def baudrate_command(baudrate):
+        if baudrate not in PCAS_BAUDRATES:
+            raise ValueError("baudrate must be one of %s" % sorted(PCAS_BAUDRATES))
+        return pcas("PCAS01,%d" % PCAS_BAUDRATES[baudrate])
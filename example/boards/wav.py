@@ -0,0 +1,37 @@
+import struct
+
+WAVE_FORMAT_PCM = 1
+
+# Streaming WAV file writer. The header is written up front with zero sizes
+# and patched once on close(), so samples can go straight to the file.
+class WavWriter:
+    def __init__(self, f, rate, channels=1, bits=16):
+        self._f = f
+        self.rate = rate
+        self.channels = channels
+        self.bits = bits
+        self.data_bytes = 0
+        self._header = bytearray(44)
+        self._pack_header()
+        f.write(self._header)
+
+    def _pack_header(self):
+        block_align = self.channels * self.bits // 8
+        struct.pack_into("<4sI4s4sIHHIIHH4sI", self._header, 0,
+                         b"RIFF", 36 + self.data_bytes, b"WAVE",
+                         b"fmt ", 16, WAVE_FORMAT_PCM, self.channels, self.rate,
+                         self.rate * block_align, block_align, self.bits,
+                         b"data", self.data_bytes)
+
+    # Append sample data (any buffer), returns the number of bytes written
+    def write(self, data):
+        n = self._f.write(data)
+        self.data_bytes += n
+        return n
+
+    # Patch the RIFF and data sizes into the header and close the file
+    def close(self):
+        self._pack_header()
+        self._f.seek(0)
+        self._f.write(self._header)
+        self._f.close()
@@ -1,8 +1,9 @@
 from sys import implementation, platform
 from machine import Pin, PWM, SPI, UART
+from micropython import schedule
 
 if "nrf54l15" in implementation._machine:
-    from ADC import ADC
+    from ADC import ADC, ADCGroup
     from PDM import PDM
     from LowPWR import LowPWR
     from RTC import RTC
@@ -12,7 +13,7 @@ elif "ESP32C5" in implementation._machine:
     from machine import ADC, RTC, I2C
     from boards.xiao_esp32c5 import xiao_esp32c5 as xiao
 elif "mg24" in implementation._machine:
-    from ADC import ADC
+    from ADC import ADC, ADCGroup
     from RTC import RTC
     from machine import I2C
     from boards.xiao_mg24 import xiao_mg24 as xiao
@@ -28,11 +29,49 @@ class XiaoPin(Pin):
             raise ValueError("Invalid pin")
         
 class XiaoADC(ADC):
-    def __init__(self, adc_num):
+    def __init__(self, adc_num, **kwargs):
+        if "ESP32C5" in implementation._machine:
+            # Always set the attenuation, so read_timed() can use the same one
+            kwargs["atten"] = kwargs.get("atten", ADC.ATTN_11DB)
         try:
-            super().__init__(xiao.adc(adc_num))
+            super().__init__(xiao.adc(adc_num), **kwargs)
         except:
             raise ValueError("Invalid adc")
+        if "ESP32C5" in implementation._machine:
+            self._pin = xiao.adc(adc_num)
+            self._atten = kwargs["atten"]
+            self._dma = None
+
+    if "ESP32C5" in implementation._machine:
+        def atten(self, atten):
+            super().atten(atten)
+            self._atten = atten
+            if self._dma is not None:
+                self._dma.deinit()
+                self._dma = None
+
+        # Timed block sampling through the continuous (DMA) ADC driver, same
+        # call as on the Zephyr boards and at the same attenuation as
+        # read_u16()/read_uv(). Needs firmware built with modadcdma.
+        # The hardware only paces between SOC_ADC_SAMPLE_FREQ_THRES_LOW and
+        # _HIGH, about 611..83333 Hz, where Zephyr takes 1..1000000 Hz.
+        def read_timed(self, buf, rate):
+            if self._dma is None:
+                try:
+                    from ADCDMA import ADCDMA
+                except ImportError:
+                    raise OSError("read_timed needs firmware built with the ADCDMA module")
+                self._dma = ADCDMA(self._pin, atten=self._atten)
+            return self._dma.read_timed(buf, rate)
+
+if "nrf54l15" in implementation._machine or "mg24" in implementation._machine:
+    # Samples several ADC pins in one hardware scan, e.g. XiaoADCGroup((0, 1, "vbat"))
+    class XiaoADCGroup(ADCGroup):
+        def __init__(self, adc_nums):
+            try:
+                super().__init__([xiao.adc(adc_num) for adc_num in adc_nums])
+            except:
+                raise ValueError("Invalid adc group")
 
 class XiaoPWM(PWM):
     def __init__(self, pwm_num):
@@ -84,19 +123,113 @@ else:
                 except:
                     raise ValueError("Invalid spi")
                 
+# Extra keyword arguments go to machine.UART, e.g. rxbuf=2048, txbuf=512 so
+# that high baud rates do not overflow the receive buffer while Python is busy.
 class XiaoUART(UART):
     if platform == "esp32":
-        def __init__(self, uart_num, baudrate_num, tx_num, rx_num):
+        def __init__(self, uart_num, baudrate_num, tx_num, rx_num, **kwargs):
             try:
-                super().__init__(xiao.uart(uart_num), baudrate=baudrate_num, tx=xiao.pin(tx_num), rx=xiao.pin(rx_num))
+                super().__init__(xiao.uart(uart_num), baudrate=baudrate_num, tx=xiao.pin(tx_num), rx=xiao.pin(rx_num), **kwargs)
             except:
                 raise ValueError("Invalid uart")
+            self._rx_init(kwargs)
     else:
-       def __init__(self, uart_num, baudrate_num, tx_num, rx_num):
+       def __init__(self, uart_num, baudrate_num, tx_num, rx_num, **kwargs):
             try:
-                super().__init__(xiao.uart(uart_num), baudrate=baudrate_num)
+                super().__init__(xiao.uart(uart_num), baudrate=baudrate_num, **kwargs)
             except:
                 raise ValueError("Invalid uart")
+            self._rx_init(kwargs)
+
+    def _rx_init(self, kwargs):
+        self._rxbuf = kwargs.get("rxbuf", 0)
+        self._timeout = kwargs.get("timeout")
+        self._handler = None
+        self._timer = None
+        self._dispatch_ref = self._dispatch
+        self._poll_ref = self._poll
+        self._idle = True
+        self._pending = 0
+        self._stream = None
+        self.rx_full_events = 0
+
+    # asyncio stream over this UART. The object is both the StreamReader and
+    # the StreamWriter: await readline(), readexactly(n) or read(n), and
+    # write() then await drain(), which waits while the TX buffer is full.
+    # Tasks sleep in the event loop's poller until the UART is ready, so
+    # several UARTs and other tasks share one loop without busy-waiting.
+    # The UART must be opened with timeout=0 so a read never holds up the
+    # loop; anything else raises ValueError.
+    def stream(self):
+        if self._timeout != 0:
+            raise ValueError("stream() needs XiaoUART(..., timeout=0)")
+        if self._stream is None:
+            import asyncio
+            self._stream = asyncio.StreamReader(self)
+        return self._stream
+
+    # Call handler(uart) from the scheduler when data has arrived, so the
+    # main loop does not have to poll any(). trigger "idle" fires once the
+    # line goes quiet after a burst (a whole NMEA sentence, a modem reply),
+    # "rx" on every received chunk. Uses UART.irq() where the port has the
+    # trigger, otherwise a virtual Timer checks any() every poll_ms; ports
+    # with neither (RA4M1) raise ValueError. handler None turns it off.
+    def rx_callback(self, handler, trigger="idle", poll_ms=10):
+        if trigger not in ("idle", "rx"):
+            raise ValueError("trigger must be 'idle' or 'rx'")
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+        self._handler = handler
+        self._idle = trigger == "idle"
+        flag = getattr(UART, "IRQ_RXIDLE" if trigger == "idle" else "IRQ_RX", None)
+        if handler is None:
+            if flag is not None:
+                self.irq(handler=None)
+            return
+        if flag is not None:
+            try:
+                self.irq(handler=self._dispatch, trigger=flag)
+                return
+            except:
+                pass
+        try:
+            from machine import Timer
+            timer = Timer(-1)
+        except:
+            raise ValueError("rx_callback needs UART.irq or a virtual Timer on this port")
+        timer.init(mode=Timer.PERIODIC, period=poll_ms, callback=self._poll_ref)
+        self._timer = timer
+
+    # Timer callback, may run as a hard interrupt: no allocation here. For
+    # "idle", data counts as complete once any() stops growing for a period.
+    def _poll(self, timer):
+        n = self.any()
+        last = self._pending
+        self._pending = n
+        if n == 0:
+            return
+        # A half-full buffer is handed over without waiting for idle
+        if self._idle and n != last and not (self._rxbuf and n >= self._rxbuf // 2):
+            return
+        try:
+            schedule(self._dispatch_ref, self)
+        except RuntimeError:
+            pass
+
+    # rx_full_events is an estimate, not the driver's overrun count (no port
+    # exposes one): it counts callbacks that found the receive buffer full,
+    # when bytes may have been dropped. It needs rxbuf, and stays 0 without
+    # rx_callback.
+    def _dispatch(self, uart):
+        if self._rxbuf and self.any() >= self._rxbuf - 1:
+            self.rx_full_events += 1
+        if self._handler is not None:
+            self._handler(self)
+
+    def deinit(self):
+        self.rx_callback(None)
+        super().deinit()
 
 
 class XiaoRTC(RTC):
@@ -126,6 +259,16 @@ if "nrf54l15" in implementation._machine:
                 super().__init__(xiao.pdm(pdm_num))
             except:
                 raise ValueError("Invalid pdm")
+            self._stream = None
+
+        # Awaitable readinto(), yields to other tasks until a block is captured.
+        # The poller sees this XiaoPDM instance; the PDM module's ioctl takes
+        # the native object out of it, so the subclass polls like PDM itself.
+        async def areadinto(self, buf):
+            if self._stream is None:
+                import asyncio
+                self._stream = asyncio.StreamReader(self)
+            return await self._stream.readinto(buf)
             
     class XiaoLowPWR(LowPWR):
         def __init__(self):
@@ -0,0 +1,48 @@
+import sys
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoPDM
+    from ADPCM import ADPCM
+    en = "mic_en"
+    pdm = "pdm0"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense.")
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 3200    # 100ms of 16-bit mono audio
+RECORD_TIME_S = 8     # 64KB of ADPCM, fits the littlefs partition
+RECORD_PATH = "/flash/rec.adpcm"
+
+# Decode on the host with:
+#   python3 tools/adpcm/adpcm.py decode rec.adpcm rec.wav --rate 16000
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    pdm = XiaoPDM(pdm)
+    pdm.configure(rate=SAMPLE_RATE, width=16, channels=1, block_size=CHUNK_SIZE, block_count=6)
+    encoder = ADPCM()
+    buf = bytearray(CHUNK_SIZE)
+    mv = memoryview(buf)
+    chunks = RECORD_TIME_S * SAMPLE_RATE * 2 // CHUNK_SIZE
+    written = 0
+    f = open(RECORD_PATH, "wb")
+    print("Recording %d seconds to %s" % (RECORD_TIME_S, RECORD_PATH))
+    pdm.start()
+    try:
+        while chunks > 0:
+            if pdm.readinto(buf) == 0:
+                continue
+            # Compress the block in place, 4 bits per sample
+            n = encoder.encode_into(buf, buf)
+            written += f.write(mv[:n])
+            chunks -= 1
+    finally:
+        pdm.stop()
+        f.close()
+    print("Wrote %d bytes, captured: %d, dropped: %d, overruns: %d" % ((written,) + pdm.stats()))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    en.value(0)
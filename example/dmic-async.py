@@ -0,0 +1,49 @@
+import asyncio
+import sys
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoPDM
+    led = "led"
+    en = "mic_en"
+    pdm = "pdm0"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense.")
+
+BLOCK_SIZE = 1600    # 50ms of 16-bit mono audio at 16kHz
+
+# Capture audio without blocking the event loop
+async def capture():
+    buf = bytearray(BLOCK_SIZE)
+    blocks = 0
+    while True:
+        n = await pdm.areadinto(buf)
+        if n == 0:
+            continue
+        blocks += 1
+        if blocks % 20 == 0:
+            rms, peak = pdm.level()
+            print("blocks: %d rms: %d peak: %d dropped: %d" % (blocks, rms, peak, pdm.stats()[1]))
+
+# Other work sharing the CPU with the audio capture
+async def blink():
+    while True:
+        led.value(not led.value())
+        await asyncio.sleep_ms(250)
+
+try:
+    led = XiaoPin(led, XiaoPin.OUT)
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    pdm = XiaoPDM(pdm)
+    pdm.configure(rate=16000, width=16, channels=1, block_size=BLOCK_SIZE)
+    pdm.start()
+    asyncio.create_task(blink())
+    asyncio.run(capture())
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    pdm.stop()
+    led.value(1)
+    en.value(0)
@@ -0,0 +1,37 @@
+import time
+import sys
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoPDM
+    en = "mic_en"
+    pdm = "pdm0"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense.")
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 640     # 20ms of 16-bit mono audio
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    pdm = XiaoPDM(pdm)
+    pdm.configure(rate=SAMPLE_RATE, width=16, channels=1, block_size=BLOCK_SIZE)
+    # Remove the microphone DC offset and apply 4x gain in C, before the
+    # samples reach Python
+    pdm.dsp(dc_block=True, gain=4.0)
+    pdm.start()
+    while True:
+        # measure() consumes one block and only returns its level
+        level = pdm.measure()
+        if level is None:
+            continue
+        rms, peak = level
+        bar = "#" * (rms * 40 // 32768)
+        print("rms: %5d peak: %5d %s" % (rms, peak, bar))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    pdm.stop()
+    en.value(0)
@@ -1,9 +1,10 @@
+import os
 import time
 import sys
 
 if "nrf54l15" in sys.implementation._machine:
-    import ubinascii
     from boards.xiao import XiaoPin, XiaoPDM
+    from boards.wav import WavWriter
     led = "led"  
     button = "sw"  
     en = "mic_en"
@@ -11,56 +12,67 @@ if "nrf54l15" in sys.implementation._machine:
 else:
     raise Exception("This code can only run on XIAO nRF54L15 Sence.")
 
-def record_audio():
-    # Configure PDM
-    pdm.configure(
+def record_audio(path):
+    # Configure PDM, the slab pool is sized from block_size and block_count
+    latency_ms = pdm.configure(
         rate=SAMPLE_RATE,
         width=SAMPLE_WIDTH,
         channels=CHANNELS,
-        block_size=CHUNK_SIZE
+        block_size=CHUNK_SIZE,
+        block_count=BLOCK_COUNT
     )
     
+    # Limit the recording to the free space on the littlefs partition
+    st = os.statvfs("/flash")
+    free_bytes = st[0] * st[3] - 4096
+    total_chunks = min(TOTAL_CHUNKS, free_bytes // CHUNK_SIZE)
+    
     # Print configuration using compatible format
     print("\n=== Starting Audio Recording ===")
     print("Configuration: %dHz, %d-bit, %s" % (SAMPLE_RATE, SAMPLE_WIDTH, 'Mono' if CHANNELS == 1 else 'Stereo'))
     print("Chunk size: %d bytes (%dms)" % (CHUNK_SIZE, CHUNK_DURATION_MS))
-    print("Total recording time: %d seconds" % RECORD_TIME_S)
-    print("Total chunks to capture: %d" % TOTAL_CHUNKS)
+    print("Buffering: %d blocks (%dms)" % (BLOCK_COUNT, latency_ms))
+    print("Recording to %s: %d chunks (%d ms)" % (path, total_chunks, total_chunks * CHUNK_DURATION_MS))
     
-    # Start recording
-    start_time = time.ticks_ms()
+    # The WAV header is patched with the final sizes when the file is closed
+    wav = WavWriter(open(path, "wb"), SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH)
+    filled = 0
+    chunks = 0
+    write_us = 0
+    max_stall_us = 0
     
-    # Record all chunks
-    for i in range(TOTAL_CHUNKS):
-        # Start PDM capture
-        pdm.start()
-        
-        # Read one chunk of audio data
-        data = pdm.read()
-        
-        # Calculate progress
-        elapsed_ms = time.ticks_diff(time.ticks_ms(), start_time)
-        progress = min(100, (elapsed_ms / (RECORD_TIME_S * 1000)) * 100)
-        
-        # Print chunk summary using your specified format for the main line
-        print("%d - got buffer of %d bytes" % (i+1, len(data)))  
-        
-        # Additional debug information with compatible formatting
-        print("  Progress: %.1f%%" % progress)
-        
-        # Print entire data buffer as hex representation
-        # if len(data) > 0:
-        #     hex_data = ubinascii.hexlify(data).decode()
-        #     print("  Hex data: %s" % hex_data)
-        
+    # Start recording, the DMIC keeps capturing until stop()
+    start_time = time.ticks_ms()
+    pdm.start()
+    try:
+        while chunks < total_chunks:
+            # Read the next chunk straight into the preallocated write buffer
+            n = pdm.readinto(write_buf, filled)
+            if n == 0:
+                continue
+            filled += n
+            chunks += 1
+            # Flush once the write buffer cannot take another chunk
+            if filled + CHUNK_SIZE > len(write_buf) or chunks == total_chunks:
+                t = time.ticks_us()
+                wav.write(write_mv[:filled])
+                stall_us = time.ticks_diff(time.ticks_us(), t)
+                write_us += stall_us
+                max_stall_us = max(max_stall_us, stall_us)
+                filled = 0
+    finally:
         # Stop PDM capture
         pdm.stop()
+        wav.close()
+    elapsed_ms = time.ticks_diff(time.ticks_ms(), start_time)
     
     # Print completion message with compatible formatting
-    total_bytes = TOTAL_CHUNKS * CHUNK_SIZE
+    captured, dropped, overruns = pdm.stats()
     print("\n=== Recording Complete ===")
-    print("Total data captured: %d bytes" % total_bytes)
-    print("Equivalent to %.2f seconds of audio" % (total_bytes / (SAMPLE_RATE * BYTES_PER_SAMPLE)))
+    print("Total data written: %d bytes" % wav.data_bytes)
+    print("Equivalent to %.2f seconds of audio in %.2f seconds" % (wav.data_bytes / (SAMPLE_RATE * BYTES_PER_SAMPLE * CHANNELS), elapsed_ms / 1000))
+    print("Write throughput: %.1f KB/s, longest write stall: %d ms" % (wav.data_bytes / 1.024 / max(1, write_us // 1000), max_stall_us // 1000))
+    print("Captured: %d blocks, dropped: %d, overruns: %d" % (captured, dropped, overruns))
 
 try:
     # Initialize hardware resources
@@ -74,9 +86,15 @@ try:
     CHANNELS = 1         # Mono recording
     BYTES_PER_SAMPLE = 2 # 16-bit = 2 bytes
     CHUNK_DURATION_MS = 100  # Duration of each audio chunk in ms
-    CHUNK_SIZE = (SAMPLE_RATE * BYTES_PER_SAMPLE * CHUNK_DURATION_MS) // 1000  # Bytes per chunk
+    CHUNK_SIZE = (SAMPLE_RATE * BYTES_PER_SAMPLE * CHANNELS * CHUNK_DURATION_MS) // 1000  # Bytes per chunk
+    BLOCK_COUNT = 6      # Chunks buffered between the DMIC and Python, covers flash write stalls
+    CHUNKS_PER_WRITE = 4 # Chunks collected before each flash write
     RECORD_TIME_S = 10   # Total recording time in seconds
     TOTAL_CHUNKS = (RECORD_TIME_S * 1000) // CHUNK_DURATION_MS  # Total chunks to record
+    RECORD_PATH = "/flash/rec.wav"
+    # Preallocated write buffer, chunks are read into it in place
+    write_buf = bytearray(CHUNK_SIZE * CHUNKS_PER_WRITE)
+    write_mv = memoryview(write_buf)
     # Initialize LED state and enable PDM
     led.value(1)
     en.value(1)
@@ -84,7 +102,7 @@ try:
         # Check if button is pressed (active low)
         if button.value() == 0:
             led.value(0)
-            record_audio()
+            record_audio(RECORD_PATH)
             led.value(1)
             print("\nPress button to start another recording...")
             while button.value() == 1:
@@ -97,8 +115,3 @@ except Exception as e:
 finally:
     led.value(1)
     en.value(0)
-
-    
-    
-
-
@@ -0,0 +1,54 @@
+import time
+import sys
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoPDM
+    led = "led"
+    en = "mic_en"
+    pdm = "pdm0"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense.")
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 640     # 20ms of 16-bit mono audio
+THRESHOLD = 500      # block RMS that counts as sound
+PREROLL = 5          # 100ms of audio from before the trigger
+HANGOVER = 25        # keep capturing for 500ms after the last sound
+
+# Runs from the scheduler each time sound is detected
+def on_voice(p):
+    led.value(0)
+    print("Sound detected")
+
+try:
+    led = XiaoPin(led, XiaoPin.OUT)
+    led.value(1)
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    pdm = XiaoPDM(pdm)
+    pdm.dsp(dc_block=True)
+    pdm.vad(threshold=THRESHOLD, preroll=PREROLL, hangover=HANGOVER, callback=on_voice)
+    # The pool needs room for the pre-roll on top of the usual blocks
+    pdm.configure(rate=SAMPLE_RATE, width=16, channels=1, block_size=BLOCK_SIZE, block_count=PREROLL + 6)
+    buf = bytearray(BLOCK_SIZE)
+    pdm.start()
+    while True:
+        # Sleeps in C until the detector opens, silence never reaches Python
+        if pdm.readinto(buf) == 0:
+            continue
+        start = time.ticks_ms()
+        blocks = 1
+        while pdm.voice()[0] or pdm.any():
+            if pdm.readinto(buf) > 0:
+                blocks += 1
+        led.value(1)
+        print("Event: %d blocks (%d ms), rms of last block: %d, events: %d" %
+              (blocks, time.ticks_diff(time.ticks_ms(), start), pdm.level()[0], pdm.voice()[1]))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    pdm.stop()
+    led.value(1)
+    en.value(0)
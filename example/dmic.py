@@ -11,12 +11,16 @@ else:
 print("PCM output rate: 16000, channels: 1")
 pdm = XiaoPDM(pdm_ch)
 pdm.configure(rate=16000, width=16, channels=1, block_size=320)
+# Preallocated buffer, filled in place by readinto() without heap allocation
+buf = bytearray(320)
 
+# Capture runs continuously between start() and stop(), so blocks are gap-free
+pdm.start()
 for i in range(8):
-    pdm.start()
-    data = pdm.read()
-    print("%d - got buffer of %d bytes" % (i+1, len(data)))
-    pdm.stop()
+    n = pdm.readinto(buf)
+    print("%d - got buffer of %d bytes" % (i+1, n))
+pdm.stop()
+print("captured: %d, dropped: %d, overruns: %d" % pdm.stats())
 
 time.sleep(1)
 
@@ -24,11 +28,15 @@ time.sleep(1)
 print("PCM output rate: 16000, channels: 2")
 pdm = XiaoPDM(pdm_ch)
 pdm.configure(rate=16000, width=16, channels=2, block_size=640)
+# One buffer per channel, readinto_channels() de-interleaves L/R in C
+left = bytearray(320)
+right = bytearray(320)
 
+pdm.start()
 for i in range(8):
-    pdm.start()
-    data = pdm.read()
-    print("%d - got buffer of %d bytes" % (i+1, len(data)))
-    pdm.stop()
+    n = pdm.readinto_channels((left, right))
+    print("%d - got %d samples per channel" % (i+1, n))
+pdm.stop()
+print("captured: %d, dropped: %d, overruns: %d" % pdm.stats())
 
 
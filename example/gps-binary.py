@@ -0,0 +1,54 @@
+import time
+from boards.xiao import XiaoUART
+from boards.ubx import UBXReader, CASICReader
+
+uart = "uart1"
+baudrate = 9600     # receiver default
+fast_baudrate = 115200
+tx = 6              # D6
+rx = 7              # D7
+PROTOCOL = "casic"  # "casic" for the L76K on the XIAO GPS module, "ubx" for u-blox
+RATE_MS = 100       # 10 Hz solutions
+
+count = 0
+
+# Called for every solution, print one per second
+def on_record(reader):
+    global count
+    count += 1
+    if count % (1000 // RATE_MS):
+        return
+    if PROTOCOL == "ubx":
+        rec = reader.pvt
+        fix = rec.fix_ok
+        speed = rec.g_speed // 10        # cm/s
+    else:
+        rec = reader.pv
+        fix = rec.pos_valid >= 6          # 6: 2D, 7: 3D, 8: GNSS + DR
+        speed = int(rec.speed_2d * 100)
+    print("fix: {} sats: {:2d} lat: {:.7f} lon: {:.7f} speed: {} cm/s frames: {} errors: {}".format(
+        fix, rec.num_sv, rec.lat / 1e7, rec.lon / 1e7, speed, reader.frames, reader.checksum_errors))
+
+try:
+    # Switch the receiver to binary output at a rate text NMEA could not sustain
+    port = XiaoUART(uart, baudrate, tx, rx)
+    if PROTOCOL == "ubx":
+        UBXReader.configure(port, fast_baudrate, RATE_MS)
+        reader = UBXReader(callback=on_record)
+    else:
+        port.write(CASICReader.baudrate_command(fast_baudrate))
+        reader = CASICReader(callback=on_record)
+    time.sleep_ms(100)
+    port.deinit()
+    port = XiaoUART(uart, fast_baudrate, tx, rx)
+    if PROTOCOL == "casic":
+        CASICReader.configure(port, RATE_MS)
+    while True:
+        if reader.poll(port) == 0:
+            time.sleep_ms(10)
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    port.deinit()
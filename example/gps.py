@@ -1,125 +1,61 @@
 import time
+from boards.xiao import XiaoUART
+from boards.nmea import NMEAParser, RMC
 
 uart = "uart1"
 baudrate = 9600
 tx = 6              # D6
 rx = 7              # D7
+TIMEZONE = 8        # hours added to UTC for display
 
-# Coordinate structure
-class Coordinates:
-    def __init__(self, Lon=0.0, Lat=0.0):
-        self.Lon = Lon
-        self.Lat = Lat
-
-# GPS data structure
-class GNRMC:
-    def __init__(self):
-        self.Lon = 0.0      # GPS Longitude
-        self.Lat = 0.0      # GPS Latitude
-        self.Lon_area = ''  # E or W
-        self.Lat_area = ''  # N or S
-        self.Time_H = 0     # Time Hour
-        self.Time_M = 0     # Time Minute
-        self.Time_S = 0     # Time Second
-        self.Status = 0     # 1: Successful positioning, 0: Positioning failed
-
-# Parse GNRMC NMEA sentence
-def parse_gnrmc(nmea_sentence):
-    gps = GNRMC()
-    
-    if not nmea_sentence.startswith(b'$GNRMC') and not nmea_sentence.startswith(b'$PNRMC'):
-        return gps
-    
-    try:
-        # Convert to string and split by commas
-        sentence_str = nmea_sentence.decode('ascii', 'ignore')
-        fields = sentence_str.split(',')
-        
-        if len(fields) < 12:
-            return gps
-        
-        # Parse time field (HHMMSS.sss)
-        if fields[1]:
-            time_str = fields[1]
-            if '.' in time_str:
-                time_str = time_str.split('.')[0]
-            if len(time_str) >= 6:
-                gps.Time_H = int(time_str[0:2]) + 8  # GMT+8
-                gps.Time_M = int(time_str[2:4])
-                gps.Time_S = int(time_str[4:6])
-                if gps.Time_H >= 24:
-                    gps.Time_H -= 24
-        
-        # Parse status
-        gps.Status = 1 if fields[2] == 'A' else 0
-        
-        if gps.Status == 1:
-            # Parse latitude (DDMM.MMMMM)
-            if fields[3] and fields[4]:
-                lat_str = fields[3]
-                if '.' in lat_str:
-                    degrees = float(lat_str[0:2])
-                    minutes = float(lat_str[2:])
-                    gps.Lat = degrees + minutes / 60.0
-                    gps.Lat_area = fields[4]
-            
-            # Parse longitude (DDDMM.MMMMM)
-            if fields[5] and fields[6]:
-                lon_str = fields[5]
-                if '.' in lon_str:
-                    degrees = float(lon_str[0:3])
-                    minutes = float(lon_str[3:])
-                    gps.Lon = degrees + minutes / 60.0
-                    gps.Lon_area = fields[6]
-                    
-    except Exception as e:
-        print("Parse error:", e)
-    
-    return gps
+# Format 1e-6 degree ints without going through float
+def format_coord(value, pos, neg):
+    area = pos if value >= 0 else neg
+    value = abs(value)
+    return "{}.{:06d} {}".format(value // 1000000, value % 1000000, area)
 
 # Print formatted GPS data
 def print_gps_data(gps):
     print("\n--- GPS Data ---")
-    print("Time (GMT+8): {:02d}:{:02d}:{:02d}".format(gps.Time_H, gps.Time_M, gps.Time_S))
-    if gps.Status == 1:
-        print("Latitude (WGS-84): {:.6f} {}".format(gps.Lat, gps.Lat_area))
-        print("Longitude (WGS-84): {:.6f} {}".format(gps.Lon, gps.Lon_area))
+    if gps.hour is not None:
+        print("Time (GMT+{}): {:02d}:{:02d}:{:02d}".format(TIMEZONE, (gps.hour + TIMEZONE) % 24, gps.minute, gps.second))
+    if gps.valid and gps.lat is not None:
+        print("Latitude (WGS-84): {}".format(format_coord(gps.lat, "N", "S")))
+        print("Longitude (WGS-84): {}".format(format_coord(gps.lon, "E", "W")))
+        if gps.altitude is not None:
+            # Signed cm, split on the absolute value so -50 shows as -0.50
+            alt = abs(gps.altitude)
+            sign = "-" if gps.altitude < 0 else ""
+            print("Altitude: %s%d.%02d m, satellites: %d" % (sign, alt // 100, alt % 100, gps.sats))
         print("GPS positioning successful.")
     else:
         print("GPS positioning failed or no valid data.")
+    print("Sentences: {}, checksum errors: {}".format(gps.sentences, gps.checksum_errors))
+
+# Fixed read buffer, sentences are assembled inside the parser
+buf = bytearray(128)
+gps = NMEAParser()
+
+# Runs when the receiver goes quiet after a burst of sentences
+def on_rx(port):
+    while port.any():
+        n = port.readinto(buf)
+        if not n:
+            break
+        # Print once per fix epoch, when the RMC sentence arrives
+        if gps.feed(buf, n) & RMC:
+            print_gps_data(gps)
 
 try:
-    # Init UART
-    uart = XiaoUART(uart, baudrate, tx, rx)
-    # Buffer to accumulate complete messages
-    buffer = bytearray()
+    # Init UART with room for a whole burst of sentences
+    uart = XiaoUART(uart, baudrate, tx, rx, rxbuf=1024)
+    uart.rx_callback(on_rx)
     while True:
-        available = uart.any()
-        if available > 0:
-            # Read all available bytes
-            data = uart.read(available)
-            buffer.extend(data)
-            # Check if we have a complete line (ends with newline)
-            if b'\n' in buffer:
-                # Find the newline position
-                newline_pos = buffer.find(b'\n')
-                # Extract the complete message
-                complete_message = buffer[:newline_pos + 1]
-                # Remove the processed part from buffer
-                buffer = buffer[newline_pos + 1:]
-                # Parse GNRMC sentences
-                if complete_message.startswith(b'$GNRMC') or complete_message.startswith(b'$PNRMC'):
-                    gps_data = parse_gnrmc(complete_message)
-                    print_gps_data(gps_data)
+        # The main loop is free for other work
+        time.sleep(1)
 except KeyboardInterrupt:
     print("\nProgram interrupted by user")
 except Exception as e:
     print("\nError occurred: %s" % {e})
 finally:
     uart.deinit()
-    
-    
-
-
-
-
@@ -0,0 +1,63 @@
+import time
+import sys
+from array import array
+
+sda = "imu_sda"
+scl = "imu_scl"
+i2c = "i2c1"
+en = "imu_en"
+frq = 400000
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoI2C
+    i2c = XiaoI2C(i2c, sda, scl, frq)
+elif "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoPin
+    from boards.xiao_mg24 import xiao_mg24 as xiao
+    from machine import SoftI2C, Pin
+    i2c = SoftI2C(Pin(xiao.pin(scl)), Pin(xiao.pin(sda)), freq=frq)
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense and XIAO MG24 Sense.")
+
+from boards.lsm6dso import LSM6DSO
+from AHRS import AHRS
+
+ODR = 416            # accel and gyro samples per second
+WATERMARK = 52       # FIFO words, 1/16 s of accel + gyro
+MAX_SAMPLES = 64     # per sensor per burst
+PRINT_MS = 250
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    time.sleep_ms(10)
+    imu = LSM6DSO(i2c, odr=ODR, gyro_range=500, max_words=2 * MAX_SAMPLES)
+    ahrs = AHRS(ODR, gyro_udps=imu.gyro_udps, beta=0.1)
+    accel = array("h", bytes(MAX_SAMPLES * 6))
+    gyro = array("h", bytes(MAX_SAMPLES * 6))
+    q = array("f", bytes(16))
+    imu.fifo_start(watermark=WATERMARK)
+    last = time.ticks_ms()
+    while True:
+        words, watermark = imu.fifo_level()
+        if not watermark:
+            time.sleep_ms(5)
+            continue
+        na, ng = imu.read_fifo(accel, gyro)
+        # Fuse every sample of the burst in one call
+        ahrs.update(gyro, accel, min(na, ng))
+        if time.ticks_diff(time.ticks_ms(), last) >= PRINT_MS:
+            last = time.ticks_ms()
+            ahrs.quaternion(q)
+            print("roll: %7.2f pitch: %7.2f yaw: %7.2f  q: %.3f %.3f %.3f %.3f" %
+                  (ahrs.euler() + tuple(q)))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    try:
+        imu.fifo_stop()
+    except:
+        pass
+    en.value(0)
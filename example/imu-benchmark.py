@@ -0,0 +1,69 @@
+import time
+import sys
+import gc
+from array import array
+
+sda = "imu_sda"
+scl = "imu_scl"
+i2c = "i2c1"
+en = "imu_en"
+frq = 400000
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoI2C
+    i2c = XiaoI2C(i2c, sda, scl, frq)
+elif "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoPin
+    from boards.xiao_mg24 import xiao_mg24 as xiao
+    from machine import SoftI2C, Pin
+    i2c = SoftI2C(Pin(xiao.pin(scl)), Pin(xiao.pin(sda)), freq=frq)
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense and XIAO MG24 Sense.")
+
+from boards.lsm6dso import LSM6DSO, LSM6DSO_I2C_ADDR
+
+SAMPLES = 500
+
+# The previous approach: two reads and a decode with branches per sample
+def read_separate(imu):
+    accel = i2c.readfrom_mem(LSM6DSO_I2C_ADDR, 0x28, 6)
+    gyro = i2c.readfrom_mem(LSM6DSO_I2C_ADDR, 0x22, 6)
+    ax = (accel[1] << 8) | accel[0]
+    ay = (accel[3] << 8) | accel[2]
+    az = (accel[5] << 8) | accel[4]
+    if ax > 32767: ax -= 65536
+    if ay > 32767: ay -= 65536
+    if az > 32767: az -= 65536
+    gx = (gyro[1] << 8) | gyro[0]
+    gy = (gyro[3] << 8) | gyro[2]
+    gz = (gyro[5] << 8) | gyro[4]
+    if gx > 32767: gx -= 65536
+    if gy > 32767: gy -= 65536
+    if gz > 32767: gz -= 65536
+    return ax, ay, az, gx, gy, gz
+
+def bench(name, fn):
+    gc.collect()
+    free = gc.mem_free()
+    start = time.ticks_us()
+    for _ in range(SAMPLES):
+        fn()
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print("%-22s %5d samples/s  %6d bytes allocated" %
+          (name, SAMPLES * 1000000 // elapsed, free - gc.mem_free()))
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    time.sleep_ms(10)
+    imu = LSM6DSO(i2c, odr=1666)
+    data = array("h", bytes(12))
+    print("%s, I2C at %d Hz" % (sys.implementation._machine, frq))
+    bench("2x readfrom_mem", lambda: read_separate(imu))
+    bench("read_into (12 bytes)", lambda: imu.read_into(data))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    en.value(0)
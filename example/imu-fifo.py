@@ -0,0 +1,62 @@
+import time
+import sys
+from array import array
+
+sda = "imu_sda"
+scl = "imu_scl"
+i2c = "i2c1"
+en = "imu_en"
+frq = 400000
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoI2C
+    i2c = XiaoI2C(i2c, sda, scl, frq)
+elif "mg24" in sys.implementation._machine:
+    from boards.xiao import XiaoPin
+    from boards.xiao_mg24 import xiao_mg24 as xiao
+    from machine import SoftI2C, Pin
+    i2c = SoftI2C(Pin(xiao.pin(scl)), Pin(xiao.pin(sda)), freq=frq)
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense and XIAO MG24 Sense.")
+
+from boards.lsm6dso import LSM6DSO
+
+ODR = 416            # accel and gyro samples per second
+WATERMARK = 104      # FIFO words, 1/8 s of accel + gyro
+MAX_SAMPLES = 128    # per sensor per burst
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    time.sleep_ms(10)
+    imu = LSM6DSO(i2c, odr=ODR, max_words=2 * MAX_SAMPLES)
+    accel = array("h", bytes(MAX_SAMPLES * 6))
+    gyro = array("h", bytes(MAX_SAMPLES * 6))
+    imu.fifo_start(watermark=WATERMARK)
+    start = time.ticks_ms()
+    total = 0
+    while True:
+        words, watermark = imu.fifo_level()
+        if not watermark:
+            time.sleep_ms(10)
+            continue
+        na, ng = imu.read_fifo(accel, gyro)
+        total += na
+        if na == 0 or ng == 0:
+            continue
+        elapsed = time.ticks_diff(time.ticks_ms(), start)
+        # Latest sample of the burst in raw units, and the sustained rate
+        print("burst: %3d accel %3d gyro, accel: %6d %6d %6d gyro: %6d %6d %6d, %d Hz, overruns: %d, dropped: %d" %
+              (na, ng, accel[3 * na - 3], accel[3 * na - 2], accel[3 * na - 1],
+               gyro[3 * ng - 3], gyro[3 * ng - 2], gyro[3 * ng - 1],
+               total * 1000 // elapsed, imu.overruns, imu.dropped))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    try:
+        imu.fifo_stop()
+    except:
+        pass
+    en.value(0)
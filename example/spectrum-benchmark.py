@@ -0,0 +1,53 @@
+import time
+import sys
+from array import array
+
+if "nrf54l15" in sys.implementation._machine:
+    from boards.xiao import XiaoPin, XiaoPDM
+    from Spectrum import Spectrum
+    en = "mic_en"
+    pdm = "pdm0"
+else:
+    raise Exception("This code can only run on XIAO nRF54L15 Sense.")
+
+SAMPLE_RATE = 16000
+SIZES = (128, 256, 512, 1024)
+BANDS = 20
+FRAMES = 50
+
+try:
+    en = XiaoPin(en, XiaoPin.OUT)
+    en.value(1)
+    pdm = XiaoPDM(pdm)
+    for n in SIZES:
+        spectrum = Spectrum(n, bands=BANDS, rate=SAMPLE_RATE)
+        samples = bytearray(n * 2)
+        power = array("I", bytes(n * 2))
+        bands = array("I", bytes(BANDS * 4))
+        # Use a real microphone block so the timing covers typical data
+        pdm.configure(rate=SAMPLE_RATE, width=16, channels=1, block_size=n * 2)
+        pdm.start()
+        while pdm.readinto(samples) == 0:
+            pass
+        pdm.stop()
+
+        start = time.ticks_us()
+        for _ in range(FRAMES):
+            spectrum.power_into(samples, power)
+        power_us = time.ticks_diff(time.ticks_us(), start)
+
+        start = time.ticks_us()
+        for _ in range(FRAMES):
+            spectrum.bands_into(samples, bands)
+        bands_us = time.ticks_diff(time.ticks_us(), start)
+
+        # A frame arrives every n / SAMPLE_RATE seconds
+        print("n=%4d power: %6.1f frames/s  bands: %6.1f frames/s  realtime: %5.1f frames/s" %
+              (n, FRAMES * 1000000 / power_us, FRAMES * 1000000 / bands_us, SAMPLE_RATE / n))
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
+finally:
+    pdm.stop()
+    en.value(0)
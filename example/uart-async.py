@@ -0,0 +1,106 @@
+import asyncio
+import time
+from boards.xiao import XiaoUART
+
+# Connect D6 (TX) to D7 (RX) with a jumper wire
+uart = "uart1"
+baudrate = 460800
+tx = 6              # D6
+rx = 7              # D7
+TICK_MS = 10        # period of the latency probe
+RUN_MS = 5000       # duration of each phase
+FRAME = 32          # bytes per fixed-size record
+
+stats = {"lines": 0, "frames": 0, "bytes": 0, "bad": 0}
+
+# Measures how late the event loop wakes a task that sleeps TICK_MS
+async def probe(duration_ms):
+    late_max = 0
+    late_sum = 0
+    count = 0
+    end = time.ticks_add(time.ticks_ms(), duration_ms)
+    while time.ticks_diff(end, time.ticks_ms()) > 0:
+        start = time.ticks_us()
+        await asyncio.sleep_ms(TICK_MS)
+        late = time.ticks_diff(time.ticks_us(), start) - TICK_MS * 1000
+        late_max = max(late_max, late)
+        late_sum += late
+        count += 1
+    return late_sum // count, late_max
+
+# Line traffic, like NMEA or AT command replies
+async def send_lines(s):
+    seq = 0
+    while True:
+        s.write(b"$SEQ,%d,0123456789ABCDEF0123456789ABCDEF\n" % seq)
+        await s.drain()
+        seq += 1
+
+async def read_lines(s):
+    seq = 0
+    while True:
+        line = await s.readline()
+        stats["bytes"] += len(line)
+        if not line.startswith(b"$SEQ,%d," % seq):
+            stats["bad"] += 1
+            try:
+                seq = int(line.split(b",")[1])
+            except (IndexError, ValueError):
+                continue
+        stats["lines"] += 1
+        seq += 1
+
+# Fixed-size binary records, like UBX frames or RS-485 packets
+async def send_frames(s):
+    frame = bytearray(FRAME)
+    seq = 0
+    while True:
+        frame[0] = seq & 0xFF
+        s.write(frame)
+        await s.drain()
+        seq += 1
+
+async def read_frames(s):
+    seq = 0
+    while True:
+        frame = await s.readexactly(FRAME)
+        stats["bytes"] += len(frame)
+        if frame[0] != seq & 0xFF:
+            stats["bad"] += 1
+            seq = frame[0]
+        stats["frames"] += 1
+        seq += 1
+
+async def phase(name, port, s, sender, reader):
+    for key in stats:
+        stats[key] = 0
+    tasks = []
+    if sender is not None:
+        tasks = [asyncio.create_task(reader(s)), asyncio.create_task(sender(s))]
+    avg, worst = await probe(RUN_MS)
+    for t in tasks:
+        t.cancel()
+    # Let the line go quiet and drop what is left so the next phase starts aligned
+    await asyncio.sleep_ms(50)
+    while port.any():
+        port.read()
+    print("%-8s loop latency avg %5d us max %6d us  %6d bytes/s  lines %5d frames %5d bad %d" %
+          (name, avg, worst, stats["bytes"] * 1000 // RUN_MS, stats["lines"], stats["frames"], stats["bad"]))
+
+async def main():
+    port = XiaoUART(uart, baudrate, tx, rx, timeout=0, rxbuf=2048, txbuf=1024)
+    s = port.stream()
+    try:
+        print("%d baud, %d ms probe" % (baudrate, TICK_MS))
+        await phase("idle", port, s, None, None)
+        await phase("lines", port, s, send_lines, read_lines)
+        await phase("frames", port, s, send_frames, read_frames)
+    finally:
+        port.deinit()
+
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
@@ -0,0 +1,75 @@
+import time
+from boards.xiao import XiaoUART
+
+# Connect D6 (TX) to D7 (RX) with a jumper wire
+uart = "uart1"
+tx = 6              # D6
+rx = 7              # D7
+BAUDRATES = (115200, 460800, 921600)
+TOTAL = 16384       # bytes sent per test
+CHUNK = 256         # bytes per write()
+RXBUF = 2048
+BUSY_MS = 20        # main loop stall between writes, as if doing other work
+
+received = 0
+gaps = 0
+expected = 0
+buf = bytearray(CHUNK)
+
+# Drain everything the UART holds and count breaks in the byte sequence
+def on_rx(port):
+    global received, gaps, expected
+    while True:
+        n = port.readinto(buf)
+        if not n:
+            return
+        for i in range(n):
+            if buf[i] != expected:
+                gaps += 1
+            expected = (buf[i] + 1) & 0xFF
+        received += n
+
+def run(baudrate, rxbuf, use_callback):
+    global received, gaps, expected
+    received = 0
+    gaps = 0
+    expected = 0
+    kwargs = {"rxbuf": rxbuf} if rxbuf else {}
+    port = XiaoUART(uart, baudrate, tx, rx, timeout=0, **kwargs)
+    try:
+        if use_callback:
+            port.rx_callback(on_rx, trigger="rx", poll_ms=2)
+        data = bytearray(CHUNK)
+        start = time.ticks_ms()
+        for offset in range(0, TOTAL, CHUNK):
+            for i in range(CHUNK):
+                data[i] = (offset + i) & 0xFF
+            port.write(data)
+            # Without the callback, bytes are only read between stalls
+            time.sleep_ms(BUSY_MS)
+            if not use_callback:
+                on_rx(port)
+        # Wait for the tail to arrive
+        deadline = time.ticks_add(time.ticks_ms(), 500)
+        while received < TOTAL and time.ticks_diff(deadline, time.ticks_ms()) > 0:
+            if not use_callback:
+                on_rx(port)
+            time.sleep_ms(5)
+        elapsed = time.ticks_diff(time.ticks_ms(), start)
+        # full: callbacks that found the receive buffer full, an estimate
+        # of overruns that needs rxbuf and the callback
+        print("%7d baud  rxbuf %5s  %-8s  %6d bytes/s  lost %5d  gaps %4d  full %d" %
+              (baudrate, rxbuf or "default", "callback" if use_callback else "polled",
+               received * 1000 // elapsed, TOTAL - received, gaps, port.rx_full_events))
+    finally:
+        port.deinit()
+
+try:
+    for baudrate in BAUDRATES:
+        run(baudrate, 0, False)
+        run(baudrate, RXBUF, False)
+        run(baudrate, RXBUF, True)
+except KeyboardInterrupt:
+    print("\nProgram interrupted by user")
+except Exception as e:
+    print("\nError occurred: %s" % {e})
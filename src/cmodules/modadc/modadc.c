@@ -27,14 +27,17 @@
 #include "py/runtime.h"
 #include "py/obj.h"
 #include "py/mphal.h"
+#include "py/binary.h"
 #include "zephyr_device.h"
 
 #include <inttypes.h>
 #include <stddef.h>
 #include <stdint.h>
+#include <string.h>
 #include <zephyr/device.h>
 #include <zephyr/devicetree.h>
 #include <zephyr/kernel.h>
+#include <zephyr/sys/barrier.h>
 #include <zephyr/sys/printk.h>
 #include <zephyr/sys/util.h>
 #include <zephyr/drivers/adc.h>
@@ -54,24 +57,87 @@ static const struct adc_dt_spec adc_channels[] = {
 
 #define NUM_CHANNELS ARRAY_SIZE(adc_channels)
 
-static uint16_t sample_buffer;
-
-static struct adc_sequence adc_sequence = {
-    .options = NULL,
-    .channels = 0,
-    .buffer = &sample_buffer,
-    .buffer_size = sizeof(sample_buffer),
-    .resolution = 12,
-    .oversampling = 0,
-    .calibrate = false,
-};
+// Background acquisition state, see start(). The ring has one slot more
+// than the blocks it holds: the sampling thread always owns the slot at
+// head, so it never writes a block Python has not read yet.
+typedef struct _adc_bg_t {
+    struct adc_sequence_options options;
+    struct adc_sequence sequence;
+    uint16_t *ring;
+    uint32_t *stamps;
+    size_t block;
+    size_t slots;
+    size_t watermark;
+    volatile uint32_t head;
+    volatile uint32_t tail;
+    volatile bool active;
+    // Set while a watermark callback is queued, cleared when it runs.
+    volatile bool scheduled;
+    uint32_t captured;
+    uint32_t overflows;
+    mp_obj_t callback;
+} adc_bg_t;
 
 typedef struct _adc_obj_t {
     mp_obj_base_t base;
     const char *name;
     const struct adc_dt_spec *spec;
+    adc_bg_t *bg;
+    // Per-object settings, see init(). They start from the devicetree.
+    struct adc_channel_cfg channel_cfg;
+    uint8_t resolution;
+    uint8_t oversampling;
+    bool calibrate;
+    // Single-sample sequence, set up once so reads only run it. Each object
+    // has its own, so reads from scheduled callbacks cannot clobber another
+    // object's sample.
+    struct adc_sequence sequence;
+    uint16_t sample;
+    // Microvolt conversion, uv = (raw * fullscale_uv) >> scale_shift, kept
+    // up to date with the gain and resolution. 0 when the reference voltage
+    // is unknown.
+    int32_t fullscale_uv;
+    uint8_t scale_shift;
 } adc_obj_t;
 
+// Gains accepted by init(), as numerator and denominator.
+typedef struct _adc_gain_t {
+    enum adc_gain gain;
+    uint8_t num;
+    uint8_t den;
+} adc_gain_t;
+
+static const adc_gain_t adc_gains[] = {
+    { ADC_GAIN_1_6, 1, 6 },
+    { ADC_GAIN_1_5, 1, 5 },
+    { ADC_GAIN_1_4, 1, 4 },
+    { ADC_GAIN_1_3, 1, 3 },
+    { ADC_GAIN_2_5, 2, 5 },
+    { ADC_GAIN_1_2, 1, 2 },
+    { ADC_GAIN_2_3, 2, 3 },
+    { ADC_GAIN_4_5, 4, 5 },
+    { ADC_GAIN_1, 1, 1 },
+    { ADC_GAIN_2, 2, 1 },
+    { ADC_GAIN_3, 3, 1 },
+    { ADC_GAIN_4, 4, 1 },
+    { ADC_GAIN_6, 6, 1 },
+    { ADC_GAIN_8, 8, 1 },
+    { ADC_GAIN_12, 12, 1 },
+    { ADC_GAIN_16, 16, 1 },
+    { ADC_GAIN_24, 24, 1 },
+    { ADC_GAIN_32, 32, 1 },
+    { ADC_GAIN_64, 64, 1 },
+    { ADC_GAIN_128, 128, 1 },
+};
+
+#define MAX_RESOLUTION 16
+#define MAX_OVERSAMPLING 8
+
+#define BG_STACK_SIZE 1024
+#define BG_PRIORITY K_PRIO_COOP(CONFIG_NUM_COOP_PRIORITIES - 1)
+K_THREAD_STACK_DEFINE(bg_stack, BG_STACK_SIZE);
+static struct k_thread bg_thread;
+
 extern const mp_obj_type_t adc_type;
 
 static void adc_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
@@ -79,8 +145,11 @@ static void adc_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t
     mp_printf(print, "ADC(%s.%d)", self->name, self->spec->channel_id);
 }
 
+static void adc_init_helper(adc_obj_t *self, size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args);
+static void adc_update_scale(adc_obj_t *self);
+
 static mp_obj_t adc_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
-    mp_arg_check_num(n_args, n_kw, 1, MP_OBJ_FUN_ARGS_MAX, true);
+    mp_arg_check_num(n_args, n_kw, 1, 1, true);
 
     adc_obj_t *self = NULL;
     if (mp_obj_is_type(args[0], &adc_type)) {
@@ -113,52 +182,199 @@ static mp_obj_t adc_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_
             mp_raise_msg_varg(&mp_type_ValueError, "Could not setup ADC %s channel %d (err=%d)", dev_name, channel_id, err);
         }
 
-        self = mp_obj_malloc(adc_obj_t, &adc_type);
+        self = mp_obj_malloc_with_finaliser(adc_obj_t, &adc_type);
         self->spec = wanted_adc_channel;
         self->name = dev_name;
+        self->bg = NULL;
+        self->channel_cfg = wanted_adc_channel->channel_cfg;
+        self->resolution = wanted_adc_channel->resolution;
+        self->oversampling = wanted_adc_channel->oversampling;
+        self->calibrate = false;
+        adc_sequence_init_dt(wanted_adc_channel, &self->sequence);
+        self->sequence.options = NULL;
+        self->sequence.buffer = &self->sample;
+        self->sequence.buffer_size = sizeof(self->sample);
+        self->sequence.resolution = self->resolution;
+        self->sequence.oversampling = self->oversampling;
+        self->sequence.calibrate = false;
+        adc_update_scale(self);
     } else {
         mp_raise_ValueError("ADC must be initialized with a tuple of (adcblock, channel) or an ADC object");
     }
 
+    if (n_kw > 0) {
+        mp_map_t kw_args;
+        mp_map_init_fixed_table(&kw_args, n_kw, args + n_args);
+        adc_init_helper(self, 0, NULL, &kw_args);
+    }
+
     return MP_OBJ_FROM_PTR(self);
 }
 
-static mp_uint_t adc_read_raw_value(const struct adc_dt_spec *spec) {
-    int err = adc_sequence_init_dt(spec, &adc_sequence);
+// Set up a sequence for this object's channel with its resolution and
+// oversampling. A calibration requested by init() is done on the first
+// sequence only.
+static void adc_sequence_setup(adc_obj_t *self, struct adc_sequence *sequence) {
+    const struct adc_dt_spec *spec = self->spec;
+    int err = adc_sequence_init_dt(spec, sequence);
     if (err < 0) {
         mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d invalid (err=%d)", spec->dev->name, spec->channel_id, err);
     }
+    sequence->resolution = self->resolution;
+    sequence->oversampling = self->oversampling;
+    sequence->calibrate = self->calibrate;
+    self->calibrate = false;
+}
+
+static mp_uint_t adc_read_raw_value(adc_obj_t *self) {
+    const struct adc_dt_spec *spec = self->spec;
+    self->sequence.calibrate = self->calibrate;
+    self->calibrate = false;
 
-    err = adc_read_dt(spec, &adc_sequence);
+    int err = adc_read_dt(spec, &self->sequence);
     if (err < 0) {
         mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d read failed (err=%d)", spec->dev->name, spec->channel_id, err);
     }
 
-    return (mp_uint_t)sample_buffer;
+    return (mp_uint_t)self->sample;
+}
+
+// Precompute the microvolt scale for this object's reference, gain and
+// resolution, the same conversion adc_raw_to_millivolts_dt() does without
+// rounding to whole millivolts first.
+static void adc_update_scale(adc_obj_t *self) {
+    const struct adc_dt_spec *spec = self->spec;
+    uint16_t vref_mv = self->channel_cfg.reference == ADC_REF_INTERNAL ? adc_ref_internal(spec->dev) : spec->vref_mv;
+    int32_t fullscale_uv = (int32_t)vref_mv * 1000;
+    if (vref_mv == 0 || adc_gain_invert(self->channel_cfg.gain, &fullscale_uv) < 0) {
+        fullscale_uv = 0;
+    }
+    self->fullscale_uv = fullscale_uv;
+    self->scale_shift = self->channel_cfg.differential ? self->resolution - 1 : self->resolution;
+}
+
+static inline int32_t adc_raw_to_uv(adc_obj_t *self, int32_t raw) {
+    return (int32_t)(((int64_t)raw * self->fullscale_uv + ((1 << self->scale_shift) >> 1)) >> self->scale_shift);
+}
+
+static void adc_check_scale(adc_obj_t *self) {
+    if (self->fullscale_uv == 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d uv conversion failed (no reference voltage)",
+            self->name, self->spec->channel_id);
+    }
 }
 
 static mp_int_t adc_read_u16(adc_obj_t *self) {
-    mp_uint_t raw = adc_read_raw_value(self->spec);
-    mp_int_t bits = self->spec->resolution;
-    mp_uint_t u16 = raw << (16 - bits) | raw >> (2 * bits - 16);
-    return u16;
+    mp_uint_t raw = adc_read_raw_value(self);
+    mp_int_t bits = self->resolution;
+    // Replicate the sample bits down to bit 0, so full scale reads 65535
+    // at any resolution without a negative shift below 8 bits.
+    mp_uint_t u16 = 0;
+    for (mp_int_t s = 16 - bits; s > -bits; s -= bits) {
+        u16 |= s >= 0 ? raw << s : raw >> -s;
+    }
+    return u16 & 0xFFFF;
 }
 
 static mp_int_t adc_read_uv(adc_obj_t *self) {
-    int32_t raw = (int32_t)adc_read_raw_value(self->spec);
-    int err = adc_raw_to_millivolts_dt(self->spec, &raw);
-    if (err < 0) {
-        mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d uv conversion failed (err=%d)",
-            self->name, self->spec->channel_id, err);
-    }
-    return (mp_int_t)raw * 1000UL;
+    adc_check_scale(self);
+    mp_uint_t raw = adc_read_raw_value(self);
+    // Differential channels return signed samples.
+    int32_t value = self->channel_cfg.differential ? (int16_t)raw : (int32_t)raw;
+    return adc_raw_to_uv(self, value);
 }
 
 static mp_int_t adc_read_value(adc_obj_t *self) {
-    mp_uint_t raw = adc_read_raw_value(self->spec);
+    mp_uint_t raw = adc_read_raw_value(self);
     return (mp_int_t)raw;
 }
 
+// init(*, resolution, oversampling, gain, acq_time_us, calibrate=False)
+// changes the settings of this ADC object; arguments left out keep their
+// value. resolution and oversampling (2**n samples averaged in hardware)
+// apply to this object's reads only. gain and acq_time_us reconfigure the
+// hardware channel. calibrate=True runs the ADC self-calibration on the
+// next read. The same keywords are accepted by the constructor.
+static void adc_init_helper(adc_obj_t *self, size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_resolution, ARG_oversampling, ARG_gain, ARG_acq_time_us, ARG_calibrate };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_resolution, MP_ARG_KW_ONLY | MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_oversampling, MP_ARG_KW_ONLY | MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_gain, MP_ARG_KW_ONLY | MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_acq_time_us, MP_ARG_KW_ONLY | MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_calibrate, MP_ARG_KW_ONLY | MP_ARG_BOOL, {.u_bool = false} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    if (self->bg != NULL && self->bg->active) {
+        mp_raise_msg(&mp_type_OSError, "ADC background sampling active, call stop() first");
+    }
+
+    uint8_t resolution = self->resolution;
+    if (args[ARG_resolution].u_obj != mp_const_none) {
+        mp_int_t value = mp_obj_get_int(args[ARG_resolution].u_obj);
+        if (value < 1 || value > MAX_RESOLUTION) {
+            mp_raise_msg_varg(&mp_type_ValueError, "resolution must be 1 to %d bits", MAX_RESOLUTION);
+        }
+        resolution = value;
+    }
+
+    uint8_t oversampling = self->oversampling;
+    if (args[ARG_oversampling].u_obj != mp_const_none) {
+        mp_int_t value = mp_obj_get_int(args[ARG_oversampling].u_obj);
+        if (value < 0 || value > MAX_OVERSAMPLING) {
+            mp_raise_msg_varg(&mp_type_ValueError, "oversampling must be 0 to %d", MAX_OVERSAMPLING);
+        }
+        oversampling = value;
+    }
+
+    struct adc_channel_cfg channel_cfg = self->channel_cfg;
+    if (args[ARG_gain].u_obj != mp_const_none) {
+        mp_float_t value = mp_obj_get_float(args[ARG_gain].u_obj);
+        const adc_gain_t *match = NULL;
+        for (size_t i = 0; i < ARRAY_SIZE(adc_gains); i++) {
+            mp_float_t gain = (mp_float_t)adc_gains[i].num / adc_gains[i].den;
+            if (value > gain * MICROPY_FLOAT_CONST(0.999) && value < gain * MICROPY_FLOAT_CONST(1.001)) {
+                match = &adc_gains[i];
+                break;
+            }
+        }
+        if (match == NULL) {
+            mp_raise_ValueError("unsupported gain");
+        }
+        channel_cfg.gain = match->gain;
+    }
+    if (args[ARG_acq_time_us].u_obj != mp_const_none) {
+        mp_int_t value = mp_obj_get_int(args[ARG_acq_time_us].u_obj);
+        if (value < 0 || value > ADC_ACQ_TIME_MAX) {
+            mp_raise_msg_varg(&mp_type_ValueError, "acq_time_us must be 0 to %d", ADC_ACQ_TIME_MAX);
+        }
+        channel_cfg.acquisition_time = value == 0 ? ADC_ACQ_TIME_DEFAULT : ADC_ACQ_TIME(ADC_ACQ_TIME_MICROSECONDS, value);
+    }
+
+    if (channel_cfg.gain != self->channel_cfg.gain || channel_cfg.acquisition_time != self->channel_cfg.acquisition_time) {
+        int err = adc_channel_setup(self->spec->dev, &channel_cfg);
+        if (err < 0) {
+            mp_raise_msg_varg(&mp_type_ValueError, "Could not setup ADC %s channel %d (err=%d)",
+                self->name, self->spec->channel_id, err);
+        }
+        self->channel_cfg = channel_cfg;
+    }
+    self->resolution = resolution;
+    self->oversampling = oversampling;
+    self->calibrate = self->calibrate || args[ARG_calibrate].u_bool;
+    self->sequence.resolution = resolution;
+    self->sequence.oversampling = oversampling;
+    adc_update_scale(self);
+}
+
+static mp_obj_t adc_init_fun(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    adc_init_helper(MP_OBJ_TO_PTR(pos_args[0]), n_args - 1, pos_args + 1, kw_args);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(adc_init_fun_obj, 1, adc_init_fun);
+
 static mp_obj_t adc_read_u16_fun(mp_obj_t self_in) {
     adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
     return mp_obj_new_int(adc_read_u16(self));
@@ -177,10 +393,349 @@ static mp_obj_t adc_read_value_fun(mp_obj_t self_in) {
 }
 MP_DEFINE_CONST_FUN_OBJ_1(adc_read_value_fun_obj, adc_read_value_fun);
 
+// read_into(buf[, n]) fills buf, an array('H') or array('h'), with n raw
+// samples (default: as many as fit) taken back to back in one ADC sequence.
+// Nothing is allocated, so it can be used from scheduled callbacks. Returns
+// the number of samples.
+static mp_obj_t adc_read_into_fun(size_t n_args, const mp_obj_t *args) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[1], &bufinfo, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', bufinfo.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError("buffer must be an array of 16-bit items");
+    }
+    size_t count = bufinfo.len / sizeof(uint16_t);
+    if (n_args > 2) {
+        mp_int_t n = mp_obj_get_int(args[2]);
+        if (n < 0 || (size_t)n > count) {
+            mp_raise_ValueError("n larger than buffer");
+        }
+        count = n;
+    }
+    if (count == 0) {
+        return MP_OBJ_NEW_SMALL_INT(0);
+    }
+    if (count > UINT16_MAX + 1) {
+        mp_raise_msg_varg(&mp_type_ValueError, "at most %d samples per read", UINT16_MAX + 1);
+    }
+
+    // Reuse the object's sequence, pointed at the caller's buffer for the
+    // duration of the read.
+    struct adc_sequence_options options = {
+        .interval_us = 0,
+        .extra_samplings = count - 1,
+    };
+    struct adc_sequence *sequence = &self->sequence;
+    sequence->options = &options;
+    sequence->buffer = bufinfo.buf;
+    sequence->buffer_size = count * sizeof(uint16_t);
+    sequence->calibrate = self->calibrate;
+    self->calibrate = false;
+
+    int err = adc_read_dt(self->spec, sequence);
+    sequence->options = NULL;
+    sequence->buffer = &self->sample;
+    sequence->buffer_size = sizeof(self->sample);
+    if (err < 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d read failed (err=%d)", self->name, self->spec->channel_id, err);
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(count);
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(adc_read_into_fun_obj, 2, 3, adc_read_into_fun);
+
+// uv_into(raw, out) converts raw samples, an array('H') or array('h') as
+// filled by the read methods, to microvolts in out, an array('i'), in one
+// pass with the cached scale. Returns the number of values converted.
+static mp_obj_t adc_uv_into_fun(mp_obj_t self_in, mp_obj_t raw_in, mp_obj_t out_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    adc_check_scale(self);
+
+    mp_buffer_info_t src;
+    mp_get_buffer_raise(raw_in, &src, MP_BUFFER_READ);
+    if (mp_binary_get_size('@', src.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError("raw must be an array of 16-bit items");
+    }
+    mp_buffer_info_t dst;
+    mp_get_buffer_raise(out_in, &dst, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', dst.typecode, NULL) != sizeof(int32_t)) {
+        mp_raise_ValueError("out must be an array of 32-bit items");
+    }
+
+    size_t count = MIN(src.len / sizeof(uint16_t), dst.len / sizeof(int32_t));
+    int32_t *out = dst.buf;
+    if (src.typecode == 'h') {
+        const int16_t *raw = src.buf;
+        for (size_t i = 0; i < count; i++) {
+            out[i] = adc_raw_to_uv(self, raw[i]);
+        }
+    } else {
+        const uint16_t *raw = src.buf;
+        for (size_t i = 0; i < count; i++) {
+            out[i] = adc_raw_to_uv(self, raw[i]);
+        }
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(count);
+}
+MP_DEFINE_CONST_FUN_OBJ_3(adc_uv_into_fun_obj, adc_uv_into_fun);
+
+// read_timed(buf, rate) fills buf, an array('H') or array('h'), with raw
+// samples taken at rate Hz in a single ADC sequence: the driver schedules the
+// extra samplings itself, so there is no per-sample Python overhead and the
+// spacing does not depend on the interpreter. The interval is rounded to
+// whole microseconds, and drivers that time it with the kernel clock round
+// it up to the next tick. Returns the number of samples.
+static mp_obj_t adc_read_timed_fun(mp_obj_t self_in, mp_obj_t buf_in, mp_obj_t rate_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(buf_in, &bufinfo, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', bufinfo.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError("buffer must be an array of 16-bit items");
+    }
+    size_t count = bufinfo.len / sizeof(uint16_t);
+    if (count == 0 || count > UINT16_MAX + 1) {
+        mp_raise_msg_varg(&mp_type_ValueError, "buffer must hold 1 to %d samples", UINT16_MAX + 1);
+    }
+
+    mp_int_t rate = mp_obj_get_int(rate_in);
+    if (rate <= 0 || rate > 1000000) {
+        mp_raise_ValueError("rate must be 1 to 1000000 Hz");
+    }
+
+    struct adc_sequence_options options = {
+        .interval_us = 1000000 / rate,
+        .callback = NULL,
+        .user_data = NULL,
+        .extra_samplings = count - 1,
+    };
+    struct adc_sequence sequence = {
+        .options = &options,
+        .buffer = bufinfo.buf,
+        .buffer_size = count * sizeof(uint16_t),
+    };
+
+    const struct adc_dt_spec *spec = self->spec;
+    adc_sequence_setup(self, &sequence);
+
+    int err = adc_read_dt(spec, &sequence);
+    if (err < 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, "ADC %s channel %d read failed (err=%d)", spec->dev->name, spec->channel_id, err);
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(count);
+}
+MP_DEFINE_CONST_FUN_OBJ_3(adc_read_timed_fun_obj, adc_read_timed_fun);
+
+// Runs from the scheduler: clears the latch first so that blocks arriving
+// while the callback runs can queue it again, then calls it.
+static mp_obj_t adc_bg_dispatch(mp_obj_t self_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    adc_bg_t *bg = self->bg;
+    if (bg == NULL) {
+        return mp_const_none;
+    }
+    bg->scheduled = false;
+    if (bg->callback != mp_const_none) {
+        mp_call_function_1(bg->callback, self_in);
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(adc_bg_dispatch_obj, adc_bg_dispatch);
+
+// Queues the callback whenever watermark or more blocks are waiting and it
+// is not queued already. A full scheduler queue leaves the latch clear, so
+// the next block retries.
+static void adc_bg_notify(adc_obj_t *self, uint32_t pending) {
+    adc_bg_t *bg = self->bg;
+    if (pending >= bg->watermark && bg->callback != mp_const_none && !bg->scheduled) {
+        bg->scheduled = mp_sched_schedule(MP_OBJ_FROM_PTR(&adc_bg_dispatch_obj), MP_OBJ_FROM_PTR(self));
+    }
+}
+
+// Background sampling thread: takes one timed block per ADC sequence into the
+// slot at head and publishes it. When Python has not drained the ring the
+// block is counted as an overflow and the slot is reused.
+static void adc_bg_entry(void *p1, void *p2, void *p3) {
+    adc_obj_t *self = p1;
+    adc_bg_t *bg = self->bg;
+
+    while (bg->active) {
+        size_t slot = bg->head % bg->slots;
+        bg->sequence.buffer = bg->ring + slot * bg->block;
+        uint32_t stamp = mp_hal_ticks_us();
+        int err = adc_read_dt(self->spec, &bg->sequence);
+        bg->sequence.calibrate = false;
+        if (err < 0) {
+            bg->overflows++;
+            k_sleep(K_MSEC(1));
+            continue;
+        }
+        bg->captured++;
+
+        uint32_t pending = bg->head - bg->tail;
+        if (pending >= bg->slots - 1) {
+            bg->overflows++;
+            adc_bg_notify(self, pending);
+            continue;
+        }
+        bg->stamps[slot] = stamp;
+        barrier_dmem_fence_full();
+        bg->head++;
+        adc_bg_notify(self, pending + 1);
+    }
+}
+
+// start(rate, block=256, blocks=8, callback=None, watermark=blocks // 2)
+// samples the channel continuously in a background thread, in blocks of
+// block samples taken at rate Hz, into a ring of blocks blocks on the heap.
+// callback(adc) is scheduled whenever watermark or more blocks are waiting,
+// again after each block while the backlog stays at or above it.
+// Only one ADC can run in the background at a time.
+static mp_obj_t adc_start_fun(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_rate, ARG_block, ARG_blocks, ARG_callback, ARG_watermark };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_rate, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_block, MP_ARG_INT, {.u_int = 256} },
+        { MP_QSTR_blocks, MP_ARG_INT, {.u_int = 8} },
+        { MP_QSTR_callback, MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_watermark, MP_ARG_INT, {.u_int = 0} },
+    };
+
+    adc_obj_t *self = MP_OBJ_TO_PTR(pos_args[0]);
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args - 1, pos_args + 1, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    adc_obj_t *owner = MP_STATE_PORT(adc_bg_obj);
+    if (owner != NULL && owner->bg != NULL && owner->bg->active) {
+        mp_raise_msg(&mp_type_OSError, "ADC background sampling active, call stop() first");
+    }
+
+    mp_int_t rate = args[ARG_rate].u_int;
+    if (rate <= 0 || rate > 1000000) {
+        mp_raise_ValueError("rate must be 1 to 1000000 Hz");
+    }
+    mp_int_t block = args[ARG_block].u_int;
+    if (block < 1 || block > UINT16_MAX + 1) {
+        mp_raise_msg_varg(&mp_type_ValueError, "block must be 1 to %d samples", UINT16_MAX + 1);
+    }
+    mp_int_t blocks = args[ARG_blocks].u_int;
+    if (blocks < 2) {
+        mp_raise_ValueError("blocks must be at least 2");
+    }
+    mp_int_t watermark = args[ARG_watermark].u_int;
+    if (watermark == 0) {
+        watermark = blocks / 2;
+    }
+    if (watermark < 1 || watermark > blocks) {
+        mp_raise_ValueError("watermark must be 1 to blocks");
+    }
+    mp_obj_t callback = args[ARG_callback].u_obj;
+    if (callback != mp_const_none && !mp_obj_is_callable(callback)) {
+        mp_raise_ValueError("callback must be callable");
+    }
+
+    adc_bg_t *bg = m_new(adc_bg_t, 1);
+    memset(bg, 0, sizeof(*bg));
+    bg->ring = m_new(uint16_t, (blocks + 1) * block);
+    bg->stamps = m_new(uint32_t, blocks + 1);
+    bg->block = block;
+    bg->slots = blocks + 1;
+    bg->watermark = watermark;
+    bg->callback = callback;
+    bg->options.interval_us = 1000000 / rate;
+    bg->options.extra_samplings = block - 1;
+    adc_sequence_setup(self, &bg->sequence);
+    bg->sequence.options = &bg->options;
+    bg->sequence.buffer_size = block * sizeof(uint16_t);
+
+    // Rooting the object keeps the ring alive while the thread fills it.
+    self->bg = bg;
+    MP_STATE_PORT(adc_bg_obj) = self;
+    bg->active = true;
+    k_thread_create(&bg_thread, bg_stack, K_THREAD_STACK_SIZEOF(bg_stack),
+                    adc_bg_entry, self, NULL, NULL, BG_PRIORITY, 0, K_NO_WAIT);
+    k_thread_name_set(&bg_thread, "adc_bg");
+
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_KW(adc_start_fun_obj, 1, adc_start_fun);
+
+// stop() ends background sampling once the block in progress is done.
+// Blocks already captured can still be read.
+static mp_obj_t adc_stop_fun(mp_obj_t self_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->bg == NULL || !self->bg->active) {
+        return mp_const_none;
+    }
+    self->bg->active = false;
+    k_thread_join(&bg_thread, K_FOREVER);
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_1(adc_stop_fun_obj, adc_stop_fun);
+
+// read_block(buf) moves the oldest captured block into buf, an array('H') or
+// array('h') of at least block items. Returns the time.ticks_us() value at
+// which the block's first sample was taken, or None if no block is waiting.
+static mp_obj_t adc_read_block_fun(mp_obj_t self_in, mp_obj_t buf_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    adc_bg_t *bg = self->bg;
+    if (bg == NULL) {
+        mp_raise_msg(&mp_type_OSError, "ADC not started, call start() first");
+    }
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(buf_in, &bufinfo, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', bufinfo.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError("buffer must be an array of 16-bit items");
+    }
+    if (bufinfo.len < bg->block * sizeof(uint16_t)) {
+        mp_raise_msg_varg(&mp_type_ValueError, "buffer must hold %d samples", (int)bg->block);
+    }
+
+    if (bg->head == bg->tail) {
+        return mp_const_none;
+    }
+    size_t slot = bg->tail % bg->slots;
+    memcpy(bufinfo.buf, bg->ring + slot * bg->block, bg->block * sizeof(uint16_t));
+    uint32_t stamp = bg->stamps[slot];
+    barrier_dmem_fence_full();
+    bg->tail++;
+
+    return mp_obj_new_int_from_uint(stamp & (MICROPY_PY_TIME_TICKS_PERIOD - 1));
+}
+MP_DEFINE_CONST_FUN_OBJ_2(adc_read_block_fun_obj, adc_read_block_fun);
+
+// stats() returns (captured, overflows, pending): blocks sampled since
+// start(), blocks lost because the ring was full or a read failed, and
+// blocks waiting to be read.
+static mp_obj_t adc_stats_fun(mp_obj_t self_in) {
+    adc_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    adc_bg_t *bg = self->bg;
+    mp_obj_t items[] = {
+        mp_obj_new_int_from_uint(bg ? bg->captured : 0),
+        mp_obj_new_int_from_uint(bg ? bg->overflows : 0),
+        MP_OBJ_NEW_SMALL_INT(bg ? bg->head - bg->tail : 0),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+MP_DEFINE_CONST_FUN_OBJ_1(adc_stats_fun_obj, adc_stats_fun);
+
 static const mp_rom_map_elem_t adc_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___del__), MP_ROM_PTR(&adc_stop_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_init), MP_ROM_PTR(&adc_init_fun_obj) },
     { MP_ROM_QSTR(MP_QSTR_read_u16), MP_ROM_PTR(&adc_read_u16_fun_obj) },
     { MP_ROM_QSTR(MP_QSTR_read_uv), MP_ROM_PTR(&adc_read_uv_fun_obj) },
     { MP_ROM_QSTR(MP_QSTR_read), MP_ROM_PTR(&adc_read_value_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_read_into), MP_ROM_PTR(&adc_read_into_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_read_timed), MP_ROM_PTR(&adc_read_timed_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_uv_into), MP_ROM_PTR(&adc_uv_into_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_start), MP_ROM_PTR(&adc_start_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_stop), MP_ROM_PTR(&adc_stop_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_read_block), MP_ROM_PTR(&adc_read_block_fun_obj) },
+    { MP_ROM_QSTR(MP_QSTR_stats), MP_ROM_PTR(&adc_stats_fun_obj) },
 };
 static MP_DEFINE_CONST_DICT(adc_locals_dict, adc_locals_dict_table);
 
@@ -193,9 +748,159 @@ MP_DEFINE_CONST_OBJ_TYPE(
     locals_dict, &adc_locals_dict
 );
 
+// ADCGroup: several channels of one ADC device sampled together in a single
+// hardware sequence, so a scan costs one adc_read() and the samples of one
+// scan are taken back to back.
+typedef struct _adc_group_obj_t {
+    mp_obj_base_t base;
+    const struct device *dev;
+    size_t count;
+    const struct adc_dt_spec *specs[NUM_CHANNELS];
+    // Drivers store a scan in ascending channel order; hw_index[i] is the
+    // position of the sample of the i-th channel given to the constructor.
+    uint8_t hw_index[NUM_CHANNELS];
+    struct adc_sequence sequence;
+    uint16_t scan[NUM_CHANNELS];
+} adc_group_obj_t;
+
+extern const mp_obj_type_t adc_group_type;
+
+static void adc_group_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
+    adc_group_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_printf(print, "ADCGroup(%s, [", self->dev->name);
+    for (size_t i = 0; i < self->count; i++) {
+        mp_printf(print, i == 0 ? "%d" : ", %d", self->specs[i]->channel_id);
+    }
+    mp_print_str(print, "])");
+}
+
+// ADCGroup(channels) takes a sequence of ADC objects or (adcblock, channel)
+// tuples, all on the same ADC device.
+static mp_obj_t adc_group_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
+    mp_arg_check_num(n_args, n_kw, 1, 1, false);
+
+    size_t count;
+    mp_obj_t *items;
+    mp_obj_get_array(args[0], &count, &items);
+    if (count == 0 || count > NUM_CHANNELS) {
+        mp_raise_msg_varg(&mp_type_ValueError, "ADCGroup needs 1 to %d channels", (int)NUM_CHANNELS);
+    }
+
+    adc_group_obj_t *self = mp_obj_malloc(adc_group_obj_t, &adc_group_type);
+    self->count = count;
+    uint32_t channels = 0;
+    adc_obj_t *first = NULL;
+    for (size_t i = 0; i < count; i++) {
+        adc_obj_t *adc = MP_OBJ_TO_PTR(adc_make_new(&adc_type, 1, 0, &items[i]));
+        const struct adc_dt_spec *spec = adc->spec;
+        if (i == 0) {
+            first = adc;
+            self->dev = spec->dev;
+        } else if (spec->dev != self->dev || adc->resolution != first->resolution) {
+            mp_raise_ValueError("ADCGroup channels must share one ADC device and resolution");
+        }
+        if (channels & BIT(spec->channel_id)) {
+            mp_raise_msg_varg(&mp_type_ValueError, "ADC channel %d used twice", spec->channel_id);
+        }
+        channels |= BIT(spec->channel_id);
+        self->specs[i] = spec;
+    }
+    for (size_t i = 0; i < count; i++) {
+        self->hw_index[i] = 0;
+        for (size_t j = 0; j < count; j++) {
+            if (self->specs[j]->channel_id < self->specs[i]->channel_id) {
+                self->hw_index[i]++;
+            }
+        }
+    }
+
+    // Build the sequence once, with the settings of the first channel; reads
+    // only point it at a buffer.
+    memset(&self->sequence, 0, sizeof(self->sequence));
+    adc_sequence_setup(first, &self->sequence);
+    self->sequence.channels = channels;
+
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// read_into(buf[, rate]) samples every channel of the group into buf, an
+// array('H') or array('h'), in the order the channels were given. Without a
+// rate one scan is taken. With a rate, buf is filled with as many whole scans
+// as fit, taken rate times a second in one sequence. Returns the number of
+// samples written.
+static mp_obj_t adc_group_read_into(size_t n_args, const mp_obj_t *args) {
+    adc_group_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[1], &bufinfo, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', bufinfo.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError("buffer must be an array of 16-bit items");
+    }
+    size_t scans = bufinfo.len / sizeof(uint16_t) / self->count;
+    if (scans == 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, "buffer must hold at least %d samples", (int)self->count);
+    }
+
+    struct adc_sequence_options options = {0};
+    struct adc_sequence *sequence = &self->sequence;
+    if (n_args > 2) {
+        mp_int_t rate = mp_obj_get_int(args[2]);
+        if (rate <= 0 || rate > 1000000) {
+            mp_raise_ValueError("rate must be 1 to 1000000 Hz");
+        }
+        scans = MIN(scans, UINT16_MAX + 1);
+        options.interval_us = 1000000 / rate;
+        options.extra_samplings = scans - 1;
+        sequence->options = &options;
+        sequence->buffer = bufinfo.buf;
+    } else {
+        scans = 1;
+        sequence->options = NULL;
+        sequence->buffer = self->scan;
+    }
+    sequence->buffer_size = scans * self->count * sizeof(uint16_t);
+
+    int err = adc_read(self->dev, sequence);
+    sequence->options = NULL;
+    sequence->calibrate = false;
+    if (err < 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, "ADC %s read failed (err=%d)", self->dev->name, err);
+    }
+
+    // Put each scan back into constructor order.
+    uint16_t *out = bufinfo.buf;
+    for (size_t s = 0; s < scans; s++) {
+        uint16_t *scan = out + s * self->count;
+        if (sequence->buffer != self->scan) {
+            memcpy(self->scan, scan, self->count * sizeof(uint16_t));
+        }
+        for (size_t i = 0; i < self->count; i++) {
+            scan[i] = self->scan[self->hw_index[i]];
+        }
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(scans * self->count);
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(adc_group_read_into_obj, 2, 3, adc_group_read_into);
+
+static const mp_rom_map_elem_t adc_group_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_read_into), MP_ROM_PTR(&adc_group_read_into_obj) },
+};
+static MP_DEFINE_CONST_DICT(adc_group_locals_dict, adc_group_locals_dict_table);
+
+MP_DEFINE_CONST_OBJ_TYPE(
+    adc_group_type,
+    MP_QSTR_ADCGroup,
+    MP_TYPE_FLAG_NONE,
+    make_new, adc_group_make_new,
+    print, adc_group_print,
+    locals_dict, &adc_group_locals_dict
+);
+
 static const mp_rom_map_elem_t adc_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_ADC) },
     { MP_ROM_QSTR(MP_QSTR_ADC), MP_ROM_PTR(&adc_type) },
+    { MP_ROM_QSTR(MP_QSTR_ADCGroup), MP_ROM_PTR(&adc_group_type) },
 };
 static MP_DEFINE_CONST_DICT(adc_module_globals, adc_module_globals_table);
 
@@ -205,3 +910,6 @@ const mp_obj_module_t adc_module = {
 };
 
 MP_REGISTER_MODULE(MP_QSTR_ADC, adc_module);
+
+// The ADC object sampling in the background, if any.
+MP_REGISTER_ROOT_POINTER(struct _adc_obj_t *adc_bg_obj);
@@ -0,0 +1,52 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#ifndef MICROPY_INCLUDED_ADCDMA_H
+#define MICROPY_INCLUDED_ADCDMA_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include "py/obj.h"
+
+// Backend interface of the ADCDMA module. adcdma_esp32.c drives the ESP-IDF
+// continuous (DMA) ADC, adcdma_sim.c generates a test signal for the unix
+// port. Backend functions raise on error.
+
+typedef struct _adcdma_backend_t adcdma_backend_t;
+
+// Sample rates the backend supports, in Hz.
+void adcdma_backend_rate_range(uint32_t *min_rate, uint32_t *max_rate);
+
+// Claim the ADC channel on pin with the given attenuation (0-3).
+adcdma_backend_t *adcdma_backend_open(mp_int_t pin, mp_int_t atten);
+
+// Fill out with count raw samples taken at rate Hz. Blocks until done.
+void adcdma_backend_read(adcdma_backend_t *backend, uint32_t rate, uint16_t *out, size_t count);
+
+// Release the channel. Safe to call more than once.
+void adcdma_backend_close(adcdma_backend_t *backend);
+
+#endif // MICROPY_INCLUDED_ADCDMA_H
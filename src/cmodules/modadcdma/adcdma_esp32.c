@@ -0,0 +1,126 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <string.h>
+#include "py/runtime.h"
+#include "py/mperrno.h"
+#include "esp_adc/adc_continuous.h"
+#include "adcdma.h"
+
+// ESP-IDF backend: one pattern entry for the pin's channel, read back in
+// conversion frames and unpacked into the caller's buffer.
+
+#define FRAME_BYTES 256
+#define POOL_BYTES 1024
+
+struct _adcdma_backend_t {
+    adc_continuous_handle_t handle;
+    adc_unit_t unit;
+    adc_channel_t channel;
+    adc_atten_t atten;
+    uint8_t frame[FRAME_BYTES];
+};
+
+static const adc_atten_t adcdma_attens[] = {
+    ADC_ATTEN_DB_0, ADC_ATTEN_DB_2_5, ADC_ATTEN_DB_6, ADC_ATTEN_DB_12,
+};
+
+static void adcdma_check(esp_err_t err) {
+    if (err == ESP_ERR_TIMEOUT) {
+        mp_raise_OSError(MP_ETIMEDOUT);
+    }
+    if (err != ESP_OK) {
+        mp_raise_msg_varg(&mp_type_OSError, MP_ERROR_TEXT("ADC continuous driver error: %s"), esp_err_to_name(err));
+    }
+}
+
+void adcdma_backend_rate_range(uint32_t *min_rate, uint32_t *max_rate) {
+    *min_rate = SOC_ADC_SAMPLE_FREQ_THRES_LOW;
+    *max_rate = SOC_ADC_SAMPLE_FREQ_THRES_HIGH;
+}
+
+adcdma_backend_t *adcdma_backend_open(mp_int_t pin, mp_int_t atten) {
+    adcdma_backend_t *backend = m_new_obj(adcdma_backend_t);
+    backend->handle = NULL;
+    if (adc_continuous_io_to_channel(pin, &backend->unit, &backend->channel) != ESP_OK) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("pin %d has no ADC channel"), (int)pin);
+    }
+    backend->atten = adcdma_attens[atten];
+
+    adc_continuous_handle_cfg_t handle_cfg = {
+        .max_store_buf_size = POOL_BYTES,
+        .conv_frame_size = FRAME_BYTES,
+    };
+    adcdma_check(adc_continuous_new_handle(&handle_cfg, &backend->handle));
+    return backend;
+}
+
+void adcdma_backend_read(adcdma_backend_t *backend, uint32_t rate, uint16_t *out, size_t count) {
+    adc_digi_pattern_config_t pattern = {
+        .atten = backend->atten,
+        .channel = backend->channel,
+        .unit = backend->unit,
+        .bit_width = SOC_ADC_DIGI_MAX_BITWIDTH,
+    };
+    adc_continuous_config_t config = {
+        .pattern_num = 1,
+        .adc_pattern = &pattern,
+        .sample_freq_hz = rate,
+        .conv_mode = backend->unit == ADC_UNIT_1 ? ADC_CONV_SINGLE_UNIT_1 : ADC_CONV_SINGLE_UNIT_2,
+        .format = ADC_DIGI_OUTPUT_FORMAT_TYPE2,
+    };
+    adcdma_check(adc_continuous_config(backend->handle, &config));
+    adcdma_check(adc_continuous_flush_pool(backend->handle));
+    adcdma_check(adc_continuous_start(backend->handle));
+
+    // Allow two frames' worth of time per read before giving up.
+    uint32_t frame_ms = (FRAME_BYTES / SOC_ADC_DIGI_RESULT_BYTES) * 1000 / rate;
+    uint32_t timeout_ms = 2 * frame_ms + 100;
+    esp_err_t err = ESP_OK;
+    size_t n = 0;
+    while (n < count) {
+        uint32_t got = 0;
+        err = adc_continuous_read(backend->handle, backend->frame, FRAME_BYTES, &got, timeout_ms);
+        if (err != ESP_OK) {
+            break;
+        }
+        for (uint32_t i = 0; i + SOC_ADC_DIGI_RESULT_BYTES <= got && n < count; i += SOC_ADC_DIGI_RESULT_BYTES) {
+            adc_digi_output_data_t *data = (adc_digi_output_data_t *)&backend->frame[i];
+            if (data->type2.channel == backend->channel) {
+                out[n++] = data->type2.data;
+            }
+        }
+    }
+    adc_continuous_stop(backend->handle);
+    adcdma_check(err);
+}
+
+void adcdma_backend_close(adcdma_backend_t *backend) {
+    if (backend->handle != NULL) {
+        adc_continuous_deinit(backend->handle);
+        backend->handle = NULL;
+    }
+}
@@ -0,0 +1,76 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <math.h>
+#include "py/runtime.h"
+#include "adcdma.h"
+
+// Simulated backend for the unix port. Each channel produces a 12-bit
+// sine wave of SIM_SIGNAL_HZ around mid-scale, continuous across reads, so
+// the sample rate and buffer handling can be checked without hardware:
+// a read of n samples at rate Hz holds n * SIM_SIGNAL_HZ / rate periods.
+// The amplitude grows with the attenuation, as a fixed input voltage would
+// read lower with more attenuation.
+
+#define SIM_SIGNAL_HZ 50
+#define SIM_MIDSCALE 2048
+
+struct _adcdma_backend_t {
+    mp_int_t pin;
+    mp_int_t atten;
+    double phase;
+    bool open;
+};
+
+void adcdma_backend_rate_range(uint32_t *min_rate, uint32_t *max_rate) {
+    *min_rate = 611;
+    *max_rate = 83333;
+}
+
+adcdma_backend_t *adcdma_backend_open(mp_int_t pin, mp_int_t atten) {
+    if (pin < 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("pin %d has no ADC channel"), (int)pin);
+    }
+    adcdma_backend_t *backend = m_new_obj(adcdma_backend_t);
+    backend->pin = pin;
+    backend->atten = atten;
+    backend->phase = 0;
+    backend->open = true;
+    return backend;
+}
+
+void adcdma_backend_read(adcdma_backend_t *backend, uint32_t rate, uint16_t *out, size_t count) {
+    double amplitude = 500 * (backend->atten + 1) - 1;
+    double step = 2 * M_PI * SIM_SIGNAL_HZ / rate;
+    for (size_t i = 0; i < count; i++) {
+        out[i] = (uint16_t)lround(SIM_MIDSCALE + amplitude * sin(backend->phase));
+        backend->phase = fmod(backend->phase + step, 2 * M_PI);
+    }
+}
+
+void adcdma_backend_close(adcdma_backend_t *backend) {
+    backend->open = false;
+}
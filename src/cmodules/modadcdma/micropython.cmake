@@ -0,0 +1,17 @@
+# Create an INTERFACE library for our C module.
+add_library(usermod_adcdma INTERFACE)
+
+# Add our source files to the lib. CMake builds are ESP-IDF builds, which
+# use the adc_continuous driver.
+target_sources(usermod_adcdma INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}/modadcdma.c
+    ${CMAKE_CURRENT_LIST_DIR}/adcdma_esp32.c
+)
+
+# Add the current directory as an include directory.
+target_include_directories(usermod_adcdma INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}
+)
+
+# Link our INTERFACE library to the usermod target.
+target_link_libraries(usermod INTERFACE usermod_adcdma)
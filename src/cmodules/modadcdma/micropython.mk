@@ -0,0 +1,8 @@
+# Make builds (the unix port) use the simulated backend, so the module can be
+# exercised without hardware.
+ADCDMA_MOD_DIR := $(USERMOD_DIR)
+
+SRC_USERMOD_C += $(ADCDMA_MOD_DIR)/modadcdma.c
+SRC_USERMOD_C += $(ADCDMA_MOD_DIR)/adcdma_sim.c
+
+CFLAGS_USERMOD += -I$(ADCDMA_MOD_DIR)
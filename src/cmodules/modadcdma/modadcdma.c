@@ -0,0 +1,154 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+#include "py/runtime.h"
+#include "py/obj.h"
+#include "py/binary.h"
+#include "adcdma.h"
+
+// ADCDMA: timed block sampling through a continuous (DMA) ADC driver, with
+// the same read_timed(buf, rate) call the Zephyr ADC module provides.
+
+typedef struct _adcdma_obj_t {
+    mp_obj_base_t base;
+    mp_int_t pin;
+    mp_int_t atten;
+    adcdma_backend_t *backend;
+} adcdma_obj_t;
+
+#define ATTN_0DB 0
+#define ATTN_2_5DB 1
+#define ATTN_6DB 2
+#define ATTN_11DB 3
+
+extern const mp_obj_type_t adcdma_type;
+
+static void adcdma_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
+    adcdma_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_printf(print, "ADCDMA(pin=%d, atten=%d)", (int)self->pin, (int)self->atten);
+}
+
+// ADCDMA(pin, atten=ATTN_11DB)
+static mp_obj_t adcdma_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *all_args) {
+    enum { ARG_pin, ARG_atten };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_pin, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_atten, MP_ARG_INT, {.u_int = ATTN_11DB} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all_kw_array(n_args, n_kw, all_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t atten = args[ARG_atten].u_int;
+    if (atten < ATTN_0DB || atten > ATTN_11DB) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid atten"));
+    }
+
+    adcdma_obj_t *self = mp_obj_malloc_with_finaliser(adcdma_obj_t, &adcdma_type);
+    self->pin = args[ARG_pin].u_int;
+    self->atten = atten;
+    self->backend = NULL;
+    self->backend = adcdma_backend_open(self->pin, atten);
+
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// read_timed(buf, rate) fills buf, an array('H') or array('h'), with raw
+// samples taken at rate Hz by the DMA engine. Returns the number of samples.
+static mp_obj_t adcdma_read_timed(mp_obj_t self_in, mp_obj_t buf_in, mp_obj_t rate_in) {
+    adcdma_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->backend == NULL) {
+        mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("ADCDMA deinitialised"));
+    }
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(buf_in, &bufinfo, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', bufinfo.typecode, NULL) != sizeof(uint16_t)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("buffer must be an array of 16-bit items"));
+    }
+    size_t count = bufinfo.len / sizeof(uint16_t);
+    if (count == 0) {
+        return MP_OBJ_NEW_SMALL_INT(0);
+    }
+
+    uint32_t min_rate;
+    uint32_t max_rate;
+    adcdma_backend_rate_range(&min_rate, &max_rate);
+    mp_int_t rate = mp_obj_get_int(rate_in);
+    if (rate < (mp_int_t)min_rate || rate > (mp_int_t)max_rate) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("rate must be %u to %u Hz"),
+                          (unsigned int)min_rate, (unsigned int)max_rate);
+    }
+
+    adcdma_backend_read(self->backend, rate, bufinfo.buf, count);
+
+    return MP_OBJ_NEW_SMALL_INT(count);
+}
+static MP_DEFINE_CONST_FUN_OBJ_3(adcdma_read_timed_obj, adcdma_read_timed);
+
+static mp_obj_t adcdma_deinit(mp_obj_t self_in) {
+    adcdma_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->backend != NULL) {
+        adcdma_backend_close(self->backend);
+        self->backend = NULL;
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(adcdma_deinit_obj, adcdma_deinit);
+
+static const mp_rom_map_elem_t adcdma_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___del__), MP_ROM_PTR(&adcdma_deinit_obj) },
+    { MP_ROM_QSTR(MP_QSTR_read_timed), MP_ROM_PTR(&adcdma_read_timed_obj) },
+    { MP_ROM_QSTR(MP_QSTR_deinit), MP_ROM_PTR(&adcdma_deinit_obj) },
+    { MP_ROM_QSTR(MP_QSTR_ATTN_0DB), MP_ROM_INT(ATTN_0DB) },
+    { MP_ROM_QSTR(MP_QSTR_ATTN_2_5DB), MP_ROM_INT(ATTN_2_5DB) },
+    { MP_ROM_QSTR(MP_QSTR_ATTN_6DB), MP_ROM_INT(ATTN_6DB) },
+    { MP_ROM_QSTR(MP_QSTR_ATTN_11DB), MP_ROM_INT(ATTN_11DB) },
+};
+static MP_DEFINE_CONST_DICT(adcdma_locals_dict, adcdma_locals_dict_table);
+
+MP_DEFINE_CONST_OBJ_TYPE(
+    adcdma_type,
+    MP_QSTR_ADCDMA,
+    MP_TYPE_FLAG_NONE,
+    make_new, adcdma_make_new,
+    print, adcdma_print,
+    locals_dict, &adcdma_locals_dict
+);
+
+static const mp_rom_map_elem_t adcdma_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_ADCDMA) },
+    { MP_ROM_QSTR(MP_QSTR_ADCDMA), MP_ROM_PTR(&adcdma_type) },
+};
+static MP_DEFINE_CONST_DICT(adcdma_module_globals, adcdma_module_globals_table);
+
+const mp_obj_module_t adcdma_module = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&adcdma_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR_ADCDMA, adcdma_module);
@@ -0,0 +1,225 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+#include "py/runtime.h"
+#include "py/obj.h"
+
+// IMA-ADPCM encoder. 16-bit PCM goes in, one 4-bit code per sample comes
+// out, two codes per byte with the first sample in the low nibble. The
+// stream carries no headers: a decoder starts from the same state the
+// encoder was constructed or reset with (0, 0 by default).
+
+static const int16_t step_table[89] = {
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17,
+    19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118,
+    130, 143, 157, 173, 190, 209, 230, 253, 279, 307,
+    337, 371, 408, 449, 494, 544, 598, 658, 724, 796,
+    876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+    2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358,
+    5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899,
+    15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767
+};
+
+static const int8_t index_table[16] = {
+    -1, -1, -1, -1, 2, 4, 6, 8,
+    -1, -1, -1, -1, 2, 4, 6, 8
+};
+
+#define MAX_INDEX 88
+
+typedef struct _adpcm_obj_t {
+    mp_obj_base_t base;
+    int32_t predictor;
+    int32_t index;
+} adpcm_obj_t;
+
+extern const mp_obj_type_t adpcm_type;
+
+static uint8_t adpcm_encode_sample(adpcm_obj_t *self, int32_t sample) {
+    int32_t step = step_table[self->index];
+    int32_t diff = sample - self->predictor;
+    uint8_t code = 0;
+
+    if (diff < 0) {
+        code = 8;
+        diff = -diff;
+    }
+
+    int32_t vpdiff = step >> 3;
+    if (diff >= step) {
+        code |= 4;
+        diff -= step;
+        vpdiff += step;
+    }
+    step >>= 1;
+    if (diff >= step) {
+        code |= 2;
+        diff -= step;
+        vpdiff += step;
+    }
+    step >>= 1;
+    if (diff >= step) {
+        code |= 1;
+        vpdiff += step;
+    }
+
+    if (code & 8) {
+        self->predictor -= vpdiff;
+    } else {
+        self->predictor += vpdiff;
+    }
+    if (self->predictor > INT16_MAX) {
+        self->predictor = INT16_MAX;
+    } else if (self->predictor < INT16_MIN) {
+        self->predictor = INT16_MIN;
+    }
+
+    self->index += index_table[code];
+    if (self->index < 0) {
+        self->index = 0;
+    } else if (self->index > MAX_INDEX) {
+        self->index = MAX_INDEX;
+    }
+
+    return code;
+}
+
+static void adpcm_set_state(adpcm_obj_t *self, mp_int_t predictor, mp_int_t index) {
+    if (predictor < INT16_MIN || predictor > INT16_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("predictor out of range"));
+    }
+    if (index < 0 || index > MAX_INDEX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("index out of range"));
+    }
+    self->predictor = predictor;
+    self->index = index;
+}
+
+static void adpcm_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
+    adpcm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_printf(print, "ADPCM(predictor=%d, index=%d)", (int)self->predictor, (int)self->index);
+}
+
+static mp_obj_t adpcm_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
+    mp_arg_check_num(n_args, n_kw, 0, 2, false);
+
+    adpcm_obj_t *self = mp_obj_malloc(adpcm_obj_t, &adpcm_type);
+    adpcm_set_state(self,
+                    n_args > 0 ? mp_obj_get_int(args[0]) : 0,
+                    n_args > 1 ? mp_obj_get_int(args[1]) : 0);
+
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// encode_into(src, dst) encodes the 16-bit little-endian samples in src into
+// dst and returns the number of bytes written. dst may be src itself, so a
+// block can be compressed in place in the buffer readinto() filled. An odd
+// sample count leaves the last high nibble zero.
+static mp_obj_t adpcm_encode_into(mp_obj_t self_in, mp_obj_t src_in, mp_obj_t dst_in) {
+    adpcm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+
+    mp_buffer_info_t src;
+    mp_get_buffer_raise(src_in, &src, MP_BUFFER_READ);
+    mp_buffer_info_t dst;
+    mp_get_buffer_raise(dst_in, &dst, MP_BUFFER_WRITE);
+
+    size_t count = src.len / sizeof(int16_t);
+    size_t out_len = (count + 1) / 2;
+    if (dst.len < out_len) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("buffer too small, need %u bytes"),
+                          (unsigned int)out_len);
+    }
+
+    // Samples are read byte-wise, src may be unaligned. Byte i is written
+    // only after samples 2i and 2i + 1 are read, which keeps in place safe.
+    const uint8_t *in = src.buf;
+    uint8_t *out = dst.buf;
+    for (size_t i = 0; i < count; i += 2) {
+        int16_t s0 = (int16_t)(in[2 * i] | (in[2 * i + 1] << 8));
+        uint8_t code = adpcm_encode_sample(self, s0);
+        if (i + 1 < count) {
+            int16_t s1 = (int16_t)(in[2 * i + 2] | (in[2 * i + 3] << 8));
+            code |= adpcm_encode_sample(self, s1) << 4;
+        }
+        out[i / 2] = code;
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(out_len);
+}
+static MP_DEFINE_CONST_FUN_OBJ_3(adpcm_encode_into_obj, adpcm_encode_into);
+
+// state() returns the (predictor, index) pair a decoder needs to resume the
+// stream from this point.
+static mp_obj_t adpcm_state(mp_obj_t self_in) {
+    adpcm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_obj_t items[] = {
+        MP_OBJ_NEW_SMALL_INT(self->predictor),
+        MP_OBJ_NEW_SMALL_INT(self->index),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(adpcm_state_obj, adpcm_state);
+
+static mp_obj_t adpcm_reset(size_t n_args, const mp_obj_t *args) {
+    adpcm_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+    adpcm_set_state(self,
+                    n_args > 1 ? mp_obj_get_int(args[1]) : 0,
+                    n_args > 2 ? mp_obj_get_int(args[2]) : 0);
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(adpcm_reset_obj, 1, 3, adpcm_reset);
+
+static const mp_rom_map_elem_t adpcm_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_encode_into), MP_ROM_PTR(&adpcm_encode_into_obj) },
+    { MP_ROM_QSTR(MP_QSTR_state), MP_ROM_PTR(&adpcm_state_obj) },
+    { MP_ROM_QSTR(MP_QSTR_reset), MP_ROM_PTR(&adpcm_reset_obj) },
+};
+static MP_DEFINE_CONST_DICT(adpcm_locals_dict, adpcm_locals_dict_table);
+
+MP_DEFINE_CONST_OBJ_TYPE(
+    adpcm_type,
+    MP_QSTR_ADPCM,
+    MP_TYPE_FLAG_NONE,
+    make_new, adpcm_make_new,
+    print, adpcm_print,
+    locals_dict, &adpcm_locals_dict
+);
+
+static const mp_rom_map_elem_t adpcm_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_ADPCM) },
+    { MP_ROM_QSTR(MP_QSTR_ADPCM), MP_ROM_PTR(&adpcm_type) },
+};
+static MP_DEFINE_CONST_DICT(adpcm_module_globals, adpcm_module_globals_table);
+
+const mp_obj_module_t adpcm_module = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&adpcm_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR_ADPCM, adpcm_module);
@@ -0,0 +1,292 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <math.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+#include "py/runtime.h"
+#include "py/obj.h"
+
+// Madgwick AHRS filter for the IMU stream of the Sense boards. Gyroscope and
+// accelerometer samples go in as raw 16-bit readings, straight from the
+// LSM6DSO driver's read_into() or read_fifo() arrays, and one gradient
+// descent step per sample updates the orientation quaternion (w, x, y, z).
+// The accelerometer is normalised, so its full-scale range does not matter;
+// the gyroscope sensitivity is given in udps/LSB like the driver's gyro_udps.
+
+#define DEG_TO_RAD 0.01745329252f
+#define RAD_TO_DEG 57.2957795131f
+
+typedef struct _ahrs_obj_t {
+    mp_obj_base_t base;
+    float q[4];
+    float beta;
+    float dt;
+    float gyro_scale;   // rad/s per LSB
+    mp_int_t rate;
+    mp_int_t gyro_udps;
+} ahrs_obj_t;
+
+extern const mp_obj_type_t ahrs_type;
+
+static void ahrs_step(ahrs_obj_t *self, float gx, float gy, float gz, float ax, float ay, float az) {
+    float q0 = self->q[0];
+    float q1 = self->q[1];
+    float q2 = self->q[2];
+    float q3 = self->q[3];
+
+    // Rate of change of the quaternion from the gyroscope
+    float qd0 = 0.5f * (-q1 * gx - q2 * gy - q3 * gz);
+    float qd1 = 0.5f * (q0 * gx + q2 * gz - q3 * gy);
+    float qd2 = 0.5f * (q0 * gy - q1 * gz + q3 * gx);
+    float qd3 = 0.5f * (q0 * gz + q1 * gy - q2 * gx);
+
+    // Corrective step towards gravity, skipped in free fall where the
+    // accelerometer has no direction to offer.
+    float norm = ax * ax + ay * ay + az * az;
+    if (norm > 0.0f) {
+        norm = 1.0f / sqrtf(norm);
+        ax *= norm;
+        ay *= norm;
+        az *= norm;
+
+        float q0q0 = q0 * q0;
+        float q1q1 = q1 * q1;
+        float q2q2 = q2 * q2;
+        float q3q3 = q3 * q3;
+        float s0 = 4.0f * q0 * q2q2 + 2.0f * q2 * ax + 4.0f * q0 * q1q1 - 2.0f * q1 * ay;
+        float s1 = 4.0f * q1 * q3q3 - 2.0f * q3 * ax + 4.0f * q0q0 * q1 - 2.0f * q0 * ay - 4.0f * q1
+                   + 8.0f * q1 * q1q1 + 8.0f * q1 * q2q2 + 4.0f * q1 * az;
+        float s2 = 4.0f * q0q0 * q2 + 2.0f * q0 * ax + 4.0f * q2 * q3q3 - 2.0f * q3 * ay - 4.0f * q2
+                   + 8.0f * q2 * q1q1 + 8.0f * q2 * q2q2 + 4.0f * q2 * az;
+        float s3 = 4.0f * q1q1 * q3 - 2.0f * q1 * ax + 4.0f * q2q2 * q3 - 2.0f * q2 * ay;
+
+        // The gradient vanishes when already aligned with gravity
+        norm = s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3;
+        if (norm > 0.0f) {
+            norm = self->beta / sqrtf(norm);
+            qd0 -= norm * s0;
+            qd1 -= norm * s1;
+            qd2 -= norm * s2;
+            qd3 -= norm * s3;
+        }
+    }
+
+    q0 += qd0 * self->dt;
+    q1 += qd1 * self->dt;
+    q2 += qd2 * self->dt;
+    q3 += qd3 * self->dt;
+
+    norm = 1.0f / sqrtf(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3);
+    self->q[0] = q0 * norm;
+    self->q[1] = q1 * norm;
+    self->q[2] = q2 * norm;
+    self->q[3] = q3 * norm;
+}
+
+static const int16_t *ahrs_get_samples(mp_obj_t obj, size_t *count) {
+    mp_buffer_info_t buf;
+    mp_get_buffer_raise(obj, &buf, MP_BUFFER_READ);
+    if (buf.typecode != 'h') {
+        mp_raise_ValueError(MP_ERROR_TEXT("samples must be an array('h')"));
+    }
+    *count = buf.len / sizeof(int16_t);
+    return buf.buf;
+}
+
+static void ahrs_reset_quaternion(ahrs_obj_t *self) {
+    self->q[0] = 1.0f;
+    self->q[1] = 0.0f;
+    self->q[2] = 0.0f;
+    self->q[3] = 0.0f;
+}
+
+static void ahrs_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
+    ahrs_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_printf(print, "AHRS(rate=%d, gyro_udps=%d)", (int)self->rate, (int)self->gyro_udps);
+}
+
+// AHRS(rate, gyro_udps=8750, beta=0.1) filters samples taken at rate Hz.
+// beta is the filter gain in rad/s: higher trusts the accelerometer more,
+// converging faster but passing more of its noise into the orientation.
+static mp_obj_t ahrs_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *all_args) {
+    enum { ARG_rate, ARG_gyro_udps, ARG_beta };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_rate, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_gyro_udps, MP_ARG_INT, {.u_int = 8750} },
+        { MP_QSTR_beta, MP_ARG_OBJ, {.u_obj = MP_OBJ_NULL} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all_kw_array(n_args, n_kw, all_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    if (args[ARG_rate].u_int <= 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("rate must be positive"));
+    }
+    if (args[ARG_gyro_udps].u_int <= 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("gyro_udps must be positive"));
+    }
+    float beta = 0.1f;
+    if (args[ARG_beta].u_obj != MP_OBJ_NULL) {
+        beta = mp_obj_get_float(args[ARG_beta].u_obj);
+        if (!(beta >= 0.0f)) {
+            mp_raise_ValueError(MP_ERROR_TEXT("beta must not be negative"));
+        }
+    }
+
+    ahrs_obj_t *self = mp_obj_malloc(ahrs_obj_t, &ahrs_type);
+    self->rate = args[ARG_rate].u_int;
+    self->gyro_udps = args[ARG_gyro_udps].u_int;
+    self->dt = 1.0f / (float)self->rate;
+    self->gyro_scale = (float)self->gyro_udps * 1e-6f * DEG_TO_RAD;
+    self->beta = beta;
+    ahrs_reset_quaternion(self);
+
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// update(gyro, accel) runs one filter step per sample and returns the number
+// of samples used. gyro and accel are array('h') objects with X, Y, Z per
+// sample, as filled by read_fifo(); the shorter one sets the count. With
+// update(samples) the array holds gyro X, Y, Z then accel X, Y, Z per
+// sample, the layout of read_into(). An optional n limits the count.
+static mp_obj_t ahrs_update(size_t n_args, const mp_obj_t *args) {
+    ahrs_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+
+    size_t g_len;
+    const int16_t *g = ahrs_get_samples(args[1], &g_len);
+    const int16_t *a;
+    size_t count;
+    size_t stride;
+    if (n_args > 2 && args[2] != mp_const_none) {
+        size_t a_len;
+        a = ahrs_get_samples(args[2], &a_len);
+        count = MIN(g_len, a_len) / 3;
+        stride = 3;
+    } else {
+        a = g + 3;
+        count = g_len / 6;
+        stride = 6;
+    }
+    if (n_args > 3) {
+        mp_int_t n = mp_obj_get_int(args[3]);
+        if (n < 0 || (size_t)n > count) {
+            mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("n must be 0 to %u"), (unsigned int)count);
+        }
+        count = n;
+    }
+
+    float scale = self->gyro_scale;
+    for (size_t i = 0; i < count; i++) {
+        ahrs_step(self, g[0] * scale, g[1] * scale, g[2] * scale, a[0], a[1], a[2]);
+        g += stride;
+        a += stride;
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(count);
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(ahrs_update_obj, 2, 4, ahrs_update);
+
+// quaternion([out]) returns the orientation as (w, x, y, z). With out, an
+// array('f') of 4 items, the quaternion is written into it instead so the
+// reading loop does not allocate.
+static mp_obj_t ahrs_quaternion(size_t n_args, const mp_obj_t *args) {
+    ahrs_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+    if (n_args > 1) {
+        mp_buffer_info_t out;
+        mp_get_buffer_raise(args[1], &out, MP_BUFFER_WRITE);
+        if (out.typecode != 'f' || out.len < sizeof(self->q)) {
+            mp_raise_ValueError(MP_ERROR_TEXT("out must be an array('f') of 4 items"));
+        }
+        memcpy(out.buf, self->q, sizeof(self->q));
+        return args[1];
+    }
+    mp_obj_t items[4];
+    for (size_t i = 0; i < 4; i++) {
+        items[i] = mp_obj_new_float(self->q[i]);
+    }
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(ahrs_quaternion_obj, 1, 2, ahrs_quaternion);
+
+// euler() returns (roll, pitch, yaw) in degrees.
+static mp_obj_t ahrs_euler(mp_obj_t self_in) {
+    ahrs_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    float q0 = self->q[0];
+    float q1 = self->q[1];
+    float q2 = self->q[2];
+    float q3 = self->q[3];
+    float sp = 2.0f * (q0 * q2 - q3 * q1);
+    if (sp > 1.0f) {
+        sp = 1.0f;
+    } else if (sp < -1.0f) {
+        sp = -1.0f;
+    }
+    mp_obj_t items[] = {
+        mp_obj_new_float(atan2f(2.0f * (q0 * q1 + q2 * q3), 1.0f - 2.0f * (q1 * q1 + q2 * q2)) * RAD_TO_DEG),
+        mp_obj_new_float(asinf(sp) * RAD_TO_DEG),
+        mp_obj_new_float(atan2f(2.0f * (q0 * q3 + q1 * q2), 1.0f - 2.0f * (q2 * q2 + q3 * q3)) * RAD_TO_DEG),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(ahrs_euler_obj, ahrs_euler);
+
+// reset() returns to the identity orientation.
+static mp_obj_t ahrs_reset(mp_obj_t self_in) {
+    ahrs_reset_quaternion(MP_OBJ_TO_PTR(self_in));
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(ahrs_reset_obj, ahrs_reset);
+
+static const mp_rom_map_elem_t ahrs_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_update), MP_ROM_PTR(&ahrs_update_obj) },
+    { MP_ROM_QSTR(MP_QSTR_quaternion), MP_ROM_PTR(&ahrs_quaternion_obj) },
+    { MP_ROM_QSTR(MP_QSTR_euler), MP_ROM_PTR(&ahrs_euler_obj) },
+    { MP_ROM_QSTR(MP_QSTR_reset), MP_ROM_PTR(&ahrs_reset_obj) },
+};
+static MP_DEFINE_CONST_DICT(ahrs_locals_dict, ahrs_locals_dict_table);
+
+MP_DEFINE_CONST_OBJ_TYPE(
+    ahrs_type,
+    MP_QSTR_AHRS,
+    MP_TYPE_FLAG_NONE,
+    make_new, ahrs_make_new,
+    print, ahrs_print,
+    locals_dict, &ahrs_locals_dict
+);
+
+static const mp_rom_map_elem_t ahrs_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_AHRS) },
+    { MP_ROM_QSTR(MP_QSTR_AHRS), MP_ROM_PTR(&ahrs_type) },
+};
+static MP_DEFINE_CONST_DICT(ahrs_module_globals, ahrs_module_globals_table);
+
+const mp_obj_module_t ahrs_module = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&ahrs_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR_AHRS, ahrs_module);
@@ -27,6 +27,7 @@
 #include <inttypes.h>
 #include <stddef.h>
 #include <stdint.h>
+#include <string.h>
 #include <zephyr/device.h>
 #include <zephyr/devicetree.h>
 #include <zephyr/kernel.h>
@@ -37,30 +38,311 @@
 #include "py/runtime.h"
 #include "py/obj.h"
 #include "py/objarray.h"
+#include "py/objtype.h"
+#include "py/stream.h"
 #include "zephyr_device.h" 
 
+// A filled slab block handed from the capture thread to Python.
+typedef struct _pdm_block_t {
+    void *buffer;
+    size_t size;
+    // Level of the processed samples, 16-bit streams only.
+    uint16_t rms;
+    uint16_t peak;
+    // Zero crossings of the first channel, in percent of its samples.
+    uint8_t zcr;
+} pdm_block_t;
+
+#define MAX_CHANNELS 16
+#define MAX_PREROLL 8
+
 typedef struct _pdm_obj_t {
     mp_obj_base_t base;
     const struct device *dev;
     uint8_t stream_id;
-    struct k_mem_slab *mem_slab;
+    // Slab pool and ready queue, sized by configure().
+    struct k_mem_slab mem_slab;
+    uint8_t *slab_buffer;
+    size_t slab_size;
+    struct k_msgq ready_queue;
+    pdm_block_t *queue_buffer;
+    uint16_t block_count;
     size_t block_size;
     uint32_t sample_rate;
     uint8_t sample_width;
     uint8_t num_channels;
-    bool active;
+    volatile bool active;
+    // Capture statistics, updated by the capture thread.
+    uint32_t captured;
+    uint32_t dropped;
+    uint32_t overruns;
+    // DSP front-end run by the capture thread on each 16-bit block.
+    bool dc_block;
+    int32_t gain;
+    uint8_t decimate;
+    int32_t dc_x[MAX_CHANNELS];
+    int32_t dc_y[MAX_CHANNELS];
+    // Level of the block most recently consumed by Python.
+    uint16_t last_rms;
+    uint16_t last_peak;
+    // Voice activity detection run by the capture thread, see vad(). While
+    // enabled, blocks only reach the ready queue once the level crosses the
+    // threshold; until then the last few are held back as pre-roll.
+    uint16_t vad_threshold;
+    uint8_t vad_zcr;
+    uint8_t vad_preroll;
+    uint16_t vad_hangover;
+    uint16_t vad_hold;
+    volatile bool vad_voiced;
+    uint32_t vad_triggers;
+    mp_obj_t vad_callback;
+    pdm_block_t preroll[MAX_PREROLL];
+    uint8_t preroll_head;
+    uint8_t preroll_len;
 } pdm_obj_t;
 
-#define MAX_BLOCK_SIZE 6400
-#define BLOCK_COUNT 4      
-K_MEM_SLAB_DEFINE_STATIC(mem_slab, MAX_BLOCK_SIZE, BLOCK_COUNT, 4);
+#define DEFAULT_BLOCK_COUNT 4
+
+// The driver double-buffers, so it always needs a free block to move on to.
+#define DRIVER_FREE_BLOCKS 1
+// Blocks held by the driver, and the smallest pool that leaves one for Python.
+#define DRIVER_BLOCKS 2
+#define MIN_BLOCK_COUNT (DRIVER_BLOCKS + DRIVER_FREE_BLOCKS)
+
+// Gain is Q12 fixed point, the DC blocker pole is 0.995 in Q15.
+#define GAIN_SHIFT 12
+#define GAIN_UNITY (1 << GAIN_SHIFT)
+#define MAX_GAIN 64
+#define DC_POLE 32604
+#define MAX_DECIMATE 16
+
+// Reads in VAD mode wait for voice in slices, so Ctrl-C and scheduled
+// callbacks still run while nothing is heard.
+#define VAD_WAIT_SLICE_MS 100
+
+#define CAPTURE_STACK_SIZE 1024
+#define CAPTURE_PRIORITY K_PRIO_COOP(CONFIG_NUM_COOP_PRIORITIES - 1)
+K_THREAD_STACK_DEFINE(capture_stack, CAPTURE_STACK_SIZE);
+static struct k_thread capture_thread;
 
 extern const mp_obj_type_t pdm_type;
 
+// Time in ms the driver takes to fill one block.
+static uint32_t pdm_block_ms(pdm_obj_t *self) {
+    uint32_t bytes_per_sec = self->sample_rate * self->num_channels * (self->sample_width / 8);
+    if (bytes_per_sec == 0) {
+        return 100;
+    }
+    return MAX(1, (uint32_t)((uint64_t)self->block_size * 1000 / bytes_per_sec));
+}
+
+// Integer square root of a 32-bit value.
+static uint32_t pdm_isqrt(uint32_t value) {
+    uint32_t root = 0;
+    uint32_t bit = 1UL << 30;
+    while (bit > value) {
+        bit >>= 2;
+    }
+    while (bit != 0) {
+        if (value >= root + bit) {
+            value -= root + bit;
+            root = (root >> 1) + bit;
+        } else {
+            root >>= 1;
+        }
+        bit >>= 2;
+    }
+    return root;
+}
+
+// Bytes of processed data produced from one block.
+static size_t pdm_output_size(pdm_obj_t *self) {
+    size_t frame_size = (self->sample_width / 8) * self->num_channels;
+    if (self->sample_width != 16 || frame_size == 0) {
+        return self->block_size;
+    }
+    return (self->block_size / frame_size / self->decimate) * frame_size;
+}
+
+// Run the DSP front-end over a 16-bit block in place: DC blocking, then
+// decimation by averaging, then Q12 gain on the decimated sample, then
+// measure the RMS and peak of the result. Sets the processed size and level
+// on the block.
+static void pdm_process_block(pdm_obj_t *self, pdm_block_t *block) {
+    int16_t *samples = block->buffer;
+    size_t channels = self->num_channels;
+    size_t decimate = self->decimate;
+    size_t out_frames = block->size / (channels * sizeof(int16_t)) / decimate;
+    uint64_t sum_sq = 0;
+    uint32_t peak = 0;
+    uint32_t crossings = 0;
+    int32_t prev = 0;
+
+    // Output index never passes the input index, so this works in place.
+    for (size_t f = 0; f < out_frames; f++) {
+        for (size_t c = 0; c < channels; c++) {
+            int32_t acc = 0;
+            for (size_t d = 0; d < decimate; d++) {
+                int32_t x = samples[(f * decimate + d) * channels + c];
+                if (self->dc_block) {
+                    int32_t y = x - self->dc_x[c] + (int32_t)(((int64_t)DC_POLE * self->dc_y[c]) >> 15);
+                    self->dc_x[c] = x;
+                    self->dc_y[c] = y;
+                    x = y;
+                }
+                acc += x;
+            }
+            int32_t v = acc / (int32_t)decimate;
+            if (self->gain != GAIN_UNITY) {
+                v = (int32_t)(((int64_t)v * self->gain) >> GAIN_SHIFT);
+            }
+            v = CLAMP(v, INT16_MIN, INT16_MAX);
+            samples[f * channels + c] = v;
+            sum_sq += (uint32_t)(v * v);
+            peak = MAX(peak, (uint32_t)(v < 0 ? -v : v));
+            if (c == 0) {
+                if (f > 0 && (v < 0) != (prev < 0)) {
+                    crossings++;
+                }
+                prev = v;
+            }
+        }
+    }
+
+    size_t count = out_frames * channels;
+    block->size = count * sizeof(int16_t);
+    block->rms = count ? pdm_isqrt((uint32_t)(sum_sq / count)) : 0;
+    block->peak = MIN(peak, UINT16_MAX);
+    block->zcr = out_frames ? crossings * 100 / out_frames : 0;
+}
+
+// VAD runs on the levels measured by the DSP front-end, so it needs a 16-bit
+// stream.
+static bool pdm_vad_enabled(pdm_obj_t *self) {
+    return self->vad_threshold > 0 && self->sample_width == 16;
+}
+
+// Queue a block for Python. If Python fell behind, the oldest queued blocks
+// are dropped to keep a free block for the driver.
+static void pdm_queue_block(pdm_obj_t *self, pdm_block_t *block) {
+    pdm_block_t old;
+    while (k_mem_slab_num_free_get(&self->mem_slab) < DRIVER_FREE_BLOCKS &&
+           k_msgq_get(&self->ready_queue, &old, K_NO_WAIT) == 0) {
+        k_mem_slab_free(&self->mem_slab, old.buffer);
+        self->dropped++;
+    }
+    if (k_mem_slab_num_free_get(&self->mem_slab) < DRIVER_FREE_BLOCKS ||
+        k_msgq_put(&self->ready_queue, block, K_NO_WAIT) != 0) {
+        k_mem_slab_free(&self->mem_slab, block->buffer);
+        self->dropped++;
+    }
+}
+
+// Return the pre-roll blocks to the slab.
+static void pdm_free_preroll(pdm_obj_t *self) {
+    while (self->preroll_len > 0) {
+        k_mem_slab_free(&self->mem_slab, self->preroll[self->preroll_head].buffer);
+        self->preroll_head = (self->preroll_head + 1) % MAX_PREROLL;
+        self->preroll_len--;
+    }
+}
+
+// Voice activity detection on a processed block. A block is voiced when its
+// RMS reaches the threshold and its zero-crossing rate stays below the limit,
+// which rejects hiss. Capture stays open for hangover blocks after the last
+// voiced one. While closed, blocks go to the pre-roll ring instead of the
+// ready queue, so Python only wakes up for sound.
+static void pdm_vad_block(pdm_obj_t *self, pdm_block_t *block) {
+    bool voiced = block->rms >= self->vad_threshold && block->zcr <= self->vad_zcr;
+
+    if (voiced) {
+        self->vad_hold = self->vad_hangover;
+        if (!self->vad_voiced) {
+            // Opening: release the pre-roll first, oldest block first.
+            while (self->preroll_len > 0) {
+                pdm_queue_block(self, &self->preroll[self->preroll_head]);
+                self->preroll_head = (self->preroll_head + 1) % MAX_PREROLL;
+                self->preroll_len--;
+            }
+            self->vad_voiced = true;
+            self->vad_triggers++;
+            if (self->vad_callback != mp_const_none) {
+                mp_sched_schedule(self->vad_callback, MP_OBJ_FROM_PTR(self));
+            }
+        }
+    } else if (self->vad_voiced) {
+        if (self->vad_hold > 0) {
+            self->vad_hold--;
+        } else {
+            self->vad_voiced = false;
+        }
+    }
+
+    if (self->vad_voiced) {
+        pdm_queue_block(self, block);
+        return;
+    }
+
+    if (self->vad_preroll == 0) {
+        k_mem_slab_free(&self->mem_slab, block->buffer);
+        return;
+    }
+    if (self->preroll_len == self->vad_preroll) {
+        k_mem_slab_free(&self->mem_slab, self->preroll[self->preroll_head].buffer);
+        self->preroll_head = (self->preroll_head + 1) % MAX_PREROLL;
+        self->preroll_len--;
+    }
+    self->preroll[(self->preroll_head + self->preroll_len) % MAX_PREROLL] = *block;
+    self->preroll_len++;
+}
+
+// Capture thread: drains the driver as soon as each block is released so the
+// DMIC never stalls while Python is busy. If Python falls behind, the oldest
+// pending block is dropped to keep a free block for the driver.
+static void pdm_capture_entry(void *p1, void *p2, void *p3) {
+    pdm_obj_t *self = p1;
+    int32_t timeout = 2 * pdm_block_ms(self) + 100;
+
+    while (self->active) {
+        void *buffer;
+        size_t size;
+
+        int ret = dmic_read(self->dev, self->stream_id, &buffer, &size, timeout);
+        if (!self->active) {
+            if (ret == 0) {
+                k_mem_slab_free(&self->mem_slab, buffer);
+            }
+            break;
+        }
+        if (ret != 0) {
+            // The driver stops itself when it runs out of blocks, restart it.
+            self->overruns++;
+            dmic_trigger(self->dev, DMIC_TRIGGER_STOP);
+            dmic_trigger(self->dev, DMIC_TRIGGER_START);
+            continue;
+        }
+        self->captured++;
+
+        pdm_block_t block = {
+            .buffer = buffer,
+            .size = size,
+        };
+        if (self->sample_width == 16) {
+            pdm_process_block(self, &block);
+        }
+        if (pdm_vad_enabled(self)) {
+            pdm_vad_block(self, &block);
+        } else {
+            pdm_queue_block(self, &block);
+        }
+    }
+}
+
 static void pdm_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
     pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
-    mp_printf(print, "PDM(device=%s, stream=%d, rate=%u, width=%u, channels=%u)",
-              self->dev->name, self->stream_id, self->sample_rate, self->sample_width, self->num_channels);
+    mp_printf(print, "PDM(device=%s, stream=%d, rate=%u, width=%u, channels=%u, block_size=%u, block_count=%u)",
+              self->dev->name, self->stream_id, self->sample_rate, self->sample_width, self->num_channels,
+              (unsigned int)self->block_size, self->block_count);
 }
 
 static mp_obj_t pdm_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
@@ -78,7 +360,10 @@ static mp_obj_t pdm_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_
     pdm_obj_t *self = mp_obj_malloc_with_finaliser(pdm_obj_t, &pdm_type);
     self->dev = dev;
     self->active = false;
-    self->mem_slab = &mem_slab;
+    self->slab_buffer = NULL;
+    self->slab_size = 0;
+    self->queue_buffer = NULL;
+    self->block_count = 0;
 
     if (n_args > 1) {
         self->stream_id = mp_obj_get_int(args[1]);
@@ -90,40 +375,108 @@ static mp_obj_t pdm_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_
     self->sample_width = 16;
     self->num_channels = 1;
     self->block_size = (self->sample_width / 8) * (self->sample_rate / 10) * self->num_channels;
+    self->captured = 0;
+    self->dropped = 0;
+    self->overruns = 0;
+    self->dc_block = false;
+    self->gain = GAIN_UNITY;
+    self->decimate = 1;
+    self->last_rms = 0;
+    self->last_peak = 0;
+    self->vad_threshold = 0;
+    self->vad_zcr = 100;
+    self->vad_preroll = 0;
+    self->vad_hangover = 0;
+    self->vad_hold = 0;
+    self->vad_voiced = false;
+    self->vad_triggers = 0;
+    self->vad_callback = mp_const_none;
+    self->preroll_head = 0;
+    self->preroll_len = 0;
     
     return MP_OBJ_FROM_PTR(self);
 }
 
 static mp_obj_t pdm_configure(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
-    enum { ARG_rate, ARG_width, ARG_channels, ARG_block_size };
+    enum { ARG_rate, ARG_width, ARG_channels, ARG_block_size, ARG_block_count };
     static const mp_arg_t allowed_args[] = {
         { MP_QSTR_rate, MP_ARG_INT, {.u_int = 16000} },
         { MP_QSTR_width, MP_ARG_INT, {.u_int = 16} },
         { MP_QSTR_channels, MP_ARG_INT, {.u_int = 1} },
         { MP_QSTR_block_size, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_block_count, MP_ARG_INT, {.u_int = DEFAULT_BLOCK_COUNT} },
     };
     
     pdm_obj_t *self = MP_OBJ_TO_PTR(pos_args[0]);
     mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
     mp_arg_parse_all(n_args - 1, pos_args + 1, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
     
-    self->sample_rate = args[ARG_rate].u_int;
-    self->sample_width = args[ARG_width].u_int;
-    self->num_channels = args[ARG_channels].u_int;
+    pdm_obj_t *owner = MP_STATE_PORT(pdm_obj);
+    if (owner != NULL && owner->active) {
+        mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("PDM active, call stop() first"));
+    }
+    
+    // Pre-roll blocks are held out of the pool, see vad().
+    mp_int_t block_count = args[ARG_block_count].u_int;
+    if (block_count < MIN_BLOCK_COUNT + self->vad_preroll || block_count > UINT16_MAX) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("block_count must be at least %d"),
+                          MIN_BLOCK_COUNT + self->vad_preroll);
+    }
+    
+    // Validate everything before touching self, so a rejected call leaves
+    // the previous configuration intact.
+    mp_int_t rate = args[ARG_rate].u_int;
+    mp_int_t width = args[ARG_width].u_int;
+    mp_int_t channels = args[ARG_channels].u_int;
+    mp_int_t block_size = args[ARG_block_size].u_int;
     
-    if (args[ARG_block_size].u_int == 0) {
-        self->block_size = (self->sample_width / 8) * (self->sample_rate / 10) * self->num_channels;
-    } else {
-        self->block_size = args[ARG_block_size].u_int;
+    if (rate <= 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid rate"));
     }
     
+    if (width != 16 && width != 24 && width != 32) {
+        mp_raise_ValueError(MP_ERROR_TEXT("width must be 16, 24 or 32"));
+    }
+    
+    if (channels < 1 || channels > MAX_CHANNELS) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("channels must be 1 to %d"), MAX_CHANNELS);
+    }
+    
+    mp_int_t frame_size = (width / 8) * channels;
+    if (block_size == 0) {
+        block_size = frame_size * (rate / 10);
+    }
+    if (block_size <= 0 || block_size % frame_size != 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("block_size must be a multiple of the frame size"));
+    }
+    
+    self->sample_rate = rate;
+    self->sample_width = width;
+    self->num_channels = channels;
+    self->block_size = block_size;
+    
+    // Size the slab pool to match. The memory comes from the MicroPython heap
+    // and is kept alive by this object, which stays rooted while it owns the
+    // driver. Reuse the current pool when its shape is unchanged.
+    size_t slab_size = ROUND_UP(self->block_size, sizeof(void *));
+    if (self->slab_buffer == NULL || self->slab_size != slab_size || self->block_count != block_count) {
+        // Leave the pool marked invalid if an allocation fails.
+        self->block_count = 0;
+        self->slab_buffer = m_new(uint8_t, slab_size * block_count);
+        self->queue_buffer = m_new(pdm_block_t, block_count);
+        self->slab_size = slab_size;
+        self->block_count = block_count;
+    }
+    k_mem_slab_init(&self->mem_slab, self->slab_buffer, self->slab_size, self->block_count);
+    k_msgq_init(&self->ready_queue, (char *)self->queue_buffer, sizeof(pdm_block_t), self->block_count);
+    
     struct dmic_cfg config = {0};
     
     struct pcm_stream_cfg stream_cfg = {
         .pcm_rate = self->sample_rate,
         .pcm_width = self->sample_width,
         .block_size = self->block_size,
-        .mem_slab = self->mem_slab,
+        .mem_slab = &self->mem_slab,
     };
     config.streams = &stream_cfg;
     
@@ -183,10 +536,33 @@ static mp_obj_t pdm_configure(size_t n_args, const mp_obj_t *pos_args, mp_map_t
         mp_raise_msg_varg(&mp_type_OSError, "PDM configure failed: %s (errno %d)", err_msg, -ret);
     }
     
-    return mp_const_none;
+    MP_STATE_PORT(pdm_obj) = self;
+    
+    // Report the buffering latency in ms: how far Python can fall behind
+    // before blocks are dropped.
+    return MP_OBJ_NEW_SMALL_INT((self->block_count - DRIVER_BLOCKS) * pdm_block_ms(self));
 }
 static MP_DEFINE_CONST_FUN_OBJ_KW(pdm_configure_obj, 1, pdm_configure);
 
+// Return every block still queued for Python, and anything the driver has
+// left in its own queue, to the slab.
+static void pdm_free_pending(pdm_obj_t *self) {
+    pdm_free_preroll(self);
+
+    pdm_block_t block;
+    while (k_msgq_get(&self->ready_queue, &block, K_NO_WAIT) == 0) {
+        k_mem_slab_free(&self->mem_slab, block.buffer);
+    }
+
+    void *buffer;
+    size_t size;
+    while (dmic_read(self->dev, self->stream_id, &buffer, &size, 0) == 0) {
+        k_mem_slab_free(&self->mem_slab, buffer);
+    }
+}
+
+// start() begins continuous capture: the DMIC keeps running and the capture
+// thread queues blocks until stop(), so reads in between are gap-free.
 static mp_obj_t pdm_start(mp_obj_t self_in) {
     pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
     
@@ -194,12 +570,31 @@ static mp_obj_t pdm_start(mp_obj_t self_in) {
         return mp_const_none; 
     }
     
+    // The driver uses the slab pool of the object that configured it last.
+    if (MP_STATE_PORT(pdm_obj) != self) {
+        mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("PDM not configured, call configure() first"));
+    }
+    
+    pdm_free_pending(self);
+    self->captured = 0;
+    self->dropped = 0;
+    self->overruns = 0;
+    self->vad_voiced = false;
+    self->vad_hold = 0;
+    self->vad_triggers = 0;
+    memset(self->dc_x, 0, sizeof(self->dc_x));
+    memset(self->dc_y, 0, sizeof(self->dc_y));
+    
     int ret = dmic_trigger(self->dev, DMIC_TRIGGER_START);
     if (ret != 0) {
         mp_raise_OSError(-ret);
     }
     
     self->active = true;
+    k_thread_create(&capture_thread, capture_stack, K_THREAD_STACK_SIZEOF(capture_stack),
+                    pdm_capture_entry, self, NULL, NULL, CAPTURE_PRIORITY, 0, K_NO_WAIT);
+    k_thread_name_set(&capture_thread, "pdm_capture");
+    
     return mp_const_none;
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(pdm_start_obj, pdm_start);
@@ -211,53 +606,369 @@ static mp_obj_t pdm_stop(mp_obj_t self_in) {
         return mp_const_none; 
     }
     
+    self->active = false;
     int ret = dmic_trigger(self->dev, DMIC_TRIGGER_STOP);
+    k_thread_join(&capture_thread, K_FOREVER);
+    pdm_free_pending(self);
+    
     if (ret != 0) {
         mp_raise_OSError(-ret);
     }
     
-    self->active = false;
     return mp_const_none;
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(pdm_stop_obj, pdm_stop);
 
-static mp_obj_t pdm_read(mp_obj_t self_in) {
+// stats() returns (captured, dropped, overruns) since the last start():
+// blocks delivered by the driver, blocks discarded because Python fell
+// behind, and driver stalls that needed a restart.
+static mp_obj_t pdm_stats(mp_obj_t self_in) {
     pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
-    
+    mp_obj_t items[] = {
+        mp_obj_new_int_from_uint(self->captured),
+        mp_obj_new_int_from_uint(self->dropped),
+        mp_obj_new_int_from_uint(self->overruns),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(pdm_stats_obj, pdm_stats);
+
+// any() returns the number of captured blocks waiting to be read.
+static mp_obj_t pdm_any(mp_obj_t self_in) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->block_count == 0) {
+        return MP_OBJ_NEW_SMALL_INT(0);
+    }
+    return MP_OBJ_NEW_SMALL_INT(k_msgq_num_used_get(&self->ready_queue));
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(pdm_any_obj, pdm_any);
+
+// Wait for the next captured block. Returns false on timeout, otherwise the
+// caller owns the slab block and must free it. With VAD enabled there is no
+// timeout: the wait lasts until voice is detected or the capture stops.
+static bool pdm_read_block(pdm_obj_t *self, pdm_block_t *block) {
     if (!self->active) {
         mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("PDM not active, call start() first"));
     }
-    
-    void *buffer;
-    size_t size;
-    int ret;
-    
-    ret = dmic_read(self->dev, self->stream_id, &buffer, &size, 100);
-    if (ret != 0) {
-        if (ret == -EAGAIN) {
-            return mp_obj_new_bytearray(0, NULL);
+
+    if (pdm_vad_enabled(self)) {
+        while (k_msgq_get(&self->ready_queue, block, K_MSEC(VAD_WAIT_SLICE_MS)) != 0) {
+            mp_handle_pending(true);
+            if (!self->active || !pdm_vad_enabled(self)) {
+                return false;
+            }
         }
-        mp_raise_OSError(-ret);
+    } else if (k_msgq_get(&self->ready_queue, block, K_MSEC(2 * pdm_block_ms(self))) != 0) {
+        return false;
     }
-    uint8_t *copy = m_new(uint8_t, size);
-    if (copy == NULL) {
-        k_mem_slab_free(self->mem_slab, buffer);
-        mp_raise_OSError(ENOMEM);
+    self->last_rms = block->rms;
+    self->last_peak = block->peak;
+    return true;
+}
+
+static mp_obj_t pdm_read(mp_obj_t self_in) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+
+    pdm_block_t block;
+
+    if (!pdm_read_block(self, &block)) {
+        return mp_obj_new_bytearray(0, NULL);
     }
-    
-    memcpy(copy, buffer, size);
-    
-    k_mem_slab_free(self->mem_slab, buffer);
-    
-    return mp_obj_new_bytearray(size, copy);
+
+    // mp_obj_new_bytearray() copies the data, so the slab block can be
+    // released straight away.
+    mp_obj_t data = mp_obj_new_bytearray(block.size, block.buffer);
+    k_mem_slab_free(&self->mem_slab, block.buffer);
+
+    return data;
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(pdm_read_obj, pdm_read);
 
+// readinto(buf[, offset]) copies one block straight from the slab into a
+// caller-owned buffer (bytearray, array or memoryview) without touching the
+// heap. Returns the number of bytes written, or 0 on timeout.
+static mp_obj_t pdm_readinto(size_t n_args, const mp_obj_t *args) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(args[0]);
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[1], &bufinfo, MP_BUFFER_WRITE);
+
+    size_t offset = 0;
+    if (n_args > 2) {
+        offset = mp_obj_get_int(args[2]);
+        if (offset > bufinfo.len) {
+            mp_raise_ValueError(MP_ERROR_TEXT("offset out of range"));
+        }
+    }
+
+    // Check the space up front so a block is never dropped on a short buffer.
+    size_t needed = pdm_output_size(self);
+    if (bufinfo.len - offset < needed) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("buffer too small, need %u bytes"),
+                          (unsigned int)needed);
+    }
+
+    pdm_block_t block;
+
+    if (!pdm_read_block(self, &block)) {
+        return MP_OBJ_NEW_SMALL_INT(0);
+    }
+
+    size_t size = MIN(block.size, bufinfo.len - offset);
+    memcpy((uint8_t *)bufinfo.buf + offset, block.buffer, size);
+    k_mem_slab_free(&self->mem_slab, block.buffer);
+
+    return MP_OBJ_NEW_SMALL_INT(size);
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(pdm_readinto_obj, 2, 3, pdm_readinto);
+
+// readinto_channels(bufs) reads one block and de-interleaves it, writing the
+// samples of channel i into bufs[i]. A None entry skips that channel.
+// Returns the number of samples written per channel, or 0 on timeout.
+static mp_obj_t pdm_readinto_channels(mp_obj_t self_in, mp_obj_t bufs_in) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+
+    size_t n_bufs;
+    mp_obj_t *bufs;
+    mp_obj_get_array(bufs_in, &n_bufs, &bufs);
+    if (n_bufs != self->num_channels) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("need %d buffers, one per channel"), self->num_channels);
+    }
+
+    size_t channels = self->num_channels;
+    size_t sample_size = self->sample_width / 8;
+    size_t frame_size = sample_size * channels;
+    size_t needed = pdm_output_size(self) / channels;
+
+    // Check every buffer up front so a block is never dropped on a short one.
+    uint8_t *out[MAX_CHANNELS];
+    for (size_t c = 0; c < channels; c++) {
+        out[c] = NULL;
+        if (bufs[c] == mp_const_none) {
+            continue;
+        }
+        mp_buffer_info_t bufinfo;
+        mp_get_buffer_raise(bufs[c], &bufinfo, MP_BUFFER_WRITE);
+        if (bufinfo.len < needed) {
+            mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("buffer too small, need %u bytes"),
+                              (unsigned int)needed);
+        }
+        out[c] = bufinfo.buf;
+    }
+
+    pdm_block_t block;
+
+    if (!pdm_read_block(self, &block)) {
+        return MP_OBJ_NEW_SMALL_INT(0);
+    }
+
+    size_t frames = block.size / frame_size;
+    const uint8_t *in = block.buffer;
+    for (size_t c = 0; c < channels; c++) {
+        uint8_t *dst = out[c];
+        if (dst == NULL) {
+            continue;
+        }
+        const uint8_t *src = in + c * sample_size;
+        for (size_t f = 0; f < frames; f++) {
+            memcpy(dst, src, sample_size);
+            dst += sample_size;
+            src += frame_size;
+        }
+    }
+    k_mem_slab_free(&self->mem_slab, block.buffer);
+
+    return MP_OBJ_NEW_SMALL_INT(frames);
+}
+static MP_DEFINE_CONST_FUN_OBJ_2(pdm_readinto_channels_obj, pdm_readinto_channels);
+
+static mp_obj_t pdm_level_tuple(pdm_obj_t *self) {
+    mp_obj_t items[] = {
+        MP_OBJ_NEW_SMALL_INT(self->last_rms),
+        MP_OBJ_NEW_SMALL_INT(self->last_peak),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+
+// measure() consumes the next block without copying its samples and returns
+// its (rms, peak) level, or None on timeout.
+static mp_obj_t pdm_measure(mp_obj_t self_in) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+
+    pdm_block_t block;
+
+    if (!pdm_read_block(self, &block)) {
+        return mp_const_none;
+    }
+    k_mem_slab_free(&self->mem_slab, block.buffer);
+
+    return pdm_level_tuple(self);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(pdm_measure_obj, pdm_measure);
+
+// level() returns the (rms, peak) level of the last block read.
+static mp_obj_t pdm_level(mp_obj_t self_in) {
+    return pdm_level_tuple(MP_OBJ_TO_PTR(self_in));
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(pdm_level_obj, pdm_level);
+
+// dsp(dc_block=False, gain=1.0, decimate=1) sets up the processing applied
+// to 16-bit blocks by the capture thread, before they reach Python.
+static mp_obj_t pdm_dsp(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_dc_block, ARG_gain, ARG_decimate };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_dc_block, MP_ARG_BOOL, {.u_bool = false} },
+        { MP_QSTR_gain, MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_decimate, MP_ARG_INT, {.u_int = 1} },
+    };
+
+    pdm_obj_t *self = MP_OBJ_TO_PTR(pos_args[0]);
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args - 1, pos_args + 1, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    if (self->sample_width != 16) {
+        mp_raise_ValueError(MP_ERROR_TEXT("DSP needs 16-bit samples"));
+    }
+
+    int32_t gain = GAIN_UNITY;
+    if (args[ARG_gain].u_obj != mp_const_none) {
+        mp_float_t value = mp_obj_get_float(args[ARG_gain].u_obj);
+        if (value < 0 || value > MAX_GAIN) {
+            mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("gain must be 0 to %d"), MAX_GAIN);
+        }
+        gain = (int32_t)(value * GAIN_UNITY + MICROPY_FLOAT_CONST(0.5));
+    }
+
+    mp_int_t decimate = args[ARG_decimate].u_int;
+    if (decimate < 1 || decimate > MAX_DECIMATE) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("decimate must be 1 to %d"), MAX_DECIMATE);
+    }
+    if (self->active && decimate != self->decimate) {
+        mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("PDM active, call stop() first"));
+    }
+
+    self->dc_block = args[ARG_dc_block].u_bool;
+    self->gain = gain;
+    self->decimate = decimate;
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(pdm_dsp_obj, 1, pdm_dsp);
+
+// vad(threshold=0, zcr=100, preroll=0, hangover=0, callback=None) sets up
+// voice activity detection on 16-bit blocks. threshold is the block RMS that
+// opens capture, after the DSP front-end; 0 disables detection. zcr is the
+// highest zero-crossing rate in percent still counted as voice. preroll
+// blocks from before the trigger are delivered ahead of it, and capture
+// stays open for hangover blocks after the last voiced one. callback(pdm) is
+// scheduled each time capture opens. Reads block until voice is heard.
+static mp_obj_t pdm_vad(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_threshold, ARG_zcr, ARG_preroll, ARG_hangover, ARG_callback };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_threshold, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_zcr, MP_ARG_INT, {.u_int = 100} },
+        { MP_QSTR_preroll, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_hangover, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_callback, MP_ARG_OBJ, {.u_rom_obj = MP_ROM_NONE} },
+    };
+
+    pdm_obj_t *self = MP_OBJ_TO_PTR(pos_args[0]);
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args - 1, pos_args + 1, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    if (self->sample_width != 16) {
+        mp_raise_ValueError(MP_ERROR_TEXT("VAD needs 16-bit samples"));
+    }
+
+    mp_int_t threshold = args[ARG_threshold].u_int;
+    if (threshold < 0 || threshold > INT16_MAX) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("threshold must be 0 to %d"), INT16_MAX);
+    }
+    mp_int_t zcr = args[ARG_zcr].u_int;
+    if (zcr < 0 || zcr > 100) {
+        mp_raise_ValueError(MP_ERROR_TEXT("zcr must be 0 to 100"));
+    }
+    mp_int_t preroll = args[ARG_preroll].u_int;
+    if (preroll < 0 || preroll > MAX_PREROLL) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("preroll must be 0 to %d"), MAX_PREROLL);
+    }
+    if (self->block_count != 0 && self->block_count < MIN_BLOCK_COUNT + preroll) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("preroll needs block_count of at least %d"),
+                          MIN_BLOCK_COUNT + preroll);
+    }
+    mp_int_t hangover = args[ARG_hangover].u_int;
+    if (hangover < 0 || hangover > UINT16_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("hangover out of range"));
+    }
+    mp_obj_t callback = args[ARG_callback].u_obj;
+    if (callback != mp_const_none && !mp_obj_is_callable(callback)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("callback must be callable"));
+    }
+    if (self->active && (preroll != self->vad_preroll || (threshold == 0) != (self->vad_threshold == 0))) {
+        mp_raise_msg(&mp_type_OSError, MP_ERROR_TEXT("PDM active, call stop() first"));
+    }
+
+    self->vad_zcr = zcr;
+    self->vad_preroll = preroll;
+    self->vad_hangover = hangover;
+    self->vad_callback = callback;
+    self->vad_threshold = threshold;
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(pdm_vad_obj, 1, pdm_vad);
+
+// voice() returns (voiced, triggers): whether VAD capture is currently open,
+// and how many times it has opened since start().
+static mp_obj_t pdm_voice(mp_obj_t self_in) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_obj_t items[] = {
+        mp_obj_new_bool(self->vad_voiced),
+        mp_obj_new_int_from_uint(self->vad_triggers),
+    };
+    return mp_obj_new_tuple(MP_ARRAY_SIZE(items), items);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(pdm_voice_obj, pdm_voice);
+
+// Stream protocol, so a PDM object can be polled by select and asyncio: it
+// is readable while captured blocks are waiting. A Python subclass such as
+// XiaoPDM inherits this protocol but is passed in as its own instance, so
+// take the native PDM object out of it first.
+static mp_uint_t pdm_ioctl(mp_obj_t self_in, mp_uint_t request, uintptr_t arg, int *errcode) {
+    pdm_obj_t *self = MP_OBJ_TO_PTR(mp_obj_cast_to_native_base(self_in, MP_OBJ_FROM_PTR(&pdm_type)));
+    mp_uint_t ret;
+
+    if (request == MP_STREAM_POLL) {
+        ret = 0;
+        if ((arg & MP_STREAM_POLL_RD) && self->active && k_msgq_num_used_get(&self->ready_queue) > 0) {
+            ret |= MP_STREAM_POLL_RD;
+        }
+    } else {
+        *errcode = MP_EINVAL;
+        ret = MP_STREAM_ERROR;
+    }
+    return ret;
+}
+
+static const mp_stream_p_t pdm_stream_p = {
+    .ioctl = pdm_ioctl,
+};
+
 static const mp_rom_map_elem_t pdm_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___del__), MP_ROM_PTR(&pdm_stop_obj) },
     { MP_ROM_QSTR(MP_QSTR_configure), MP_ROM_PTR(&pdm_configure_obj) },
     { MP_ROM_QSTR(MP_QSTR_start), MP_ROM_PTR(&pdm_start_obj) },
     { MP_ROM_QSTR(MP_QSTR_stop), MP_ROM_PTR(&pdm_stop_obj) },
     { MP_ROM_QSTR(MP_QSTR_read), MP_ROM_PTR(&pdm_read_obj) },
+    { MP_ROM_QSTR(MP_QSTR_readinto), MP_ROM_PTR(&pdm_readinto_obj) },
+    { MP_ROM_QSTR(MP_QSTR_readinto_channels), MP_ROM_PTR(&pdm_readinto_channels_obj) },
+    { MP_ROM_QSTR(MP_QSTR_any), MP_ROM_PTR(&pdm_any_obj) },
+    { MP_ROM_QSTR(MP_QSTR_stats), MP_ROM_PTR(&pdm_stats_obj) },
+    { MP_ROM_QSTR(MP_QSTR_dsp), MP_ROM_PTR(&pdm_dsp_obj) },
+    { MP_ROM_QSTR(MP_QSTR_measure), MP_ROM_PTR(&pdm_measure_obj) },
+    { MP_ROM_QSTR(MP_QSTR_level), MP_ROM_PTR(&pdm_level_obj) },
+    { MP_ROM_QSTR(MP_QSTR_vad), MP_ROM_PTR(&pdm_vad_obj) },
+    { MP_ROM_QSTR(MP_QSTR_voice), MP_ROM_PTR(&pdm_voice_obj) },
 };
 static MP_DEFINE_CONST_DICT(pdm_locals_dict, pdm_locals_dict_table);
 
@@ -267,6 +978,7 @@ MP_DEFINE_CONST_OBJ_TYPE(
     MP_TYPE_FLAG_NONE,
     make_new, pdm_make_new,
     print, pdm_print,
+    protocol, &pdm_stream_p,
     locals_dict, &pdm_locals_dict
 );
 
@@ -281,4 +993,7 @@ const mp_obj_module_t pdm_module = {
     .globals = (mp_obj_dict_t *)&pdm_module_globals,
 };
 
-MP_REGISTER_MODULE(MP_QSTR_PDM, pdm_module);
\ No newline at end of file
+MP_REGISTER_MODULE(MP_QSTR_PDM, pdm_module);
+
+// The PDM object the driver is currently configured with.
+MP_REGISTER_ROOT_POINTER(struct _pdm_obj_t *pdm_obj);
\ No newline at end of file
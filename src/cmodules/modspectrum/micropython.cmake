@@ -0,0 +1,15 @@
+# Create an INTERFACE library for our C module.
+add_library(usermod_spectrum INTERFACE)
+
+# Add our source files to the lib
+target_sources(usermod_spectrum INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}/modspectrum.c
+)
+
+# Add the current directory as an include directory.
+target_include_directories(usermod_spectrum INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}
+)
+
+# Link our INTERFACE library to the usermod target.
+target_link_libraries(usermod INTERFACE usermod_spectrum)
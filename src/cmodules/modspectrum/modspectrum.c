@@ -0,0 +1,333 @@
+/*
+ * This file is part of the micropython-seeed-boards project, https://github.com/Seeed-Studio/micropython-seeed-boards/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2025 Seeed Technology Co., Ltd.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <math.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+#include "py/runtime.h"
+#include "py/obj.h"
+#include "py/binary.h"
+
+// Fixed-point spectral features for 16-bit audio frames.
+//
+// An n-point real FFT is computed as an n/2-point complex FFT over the
+// even/odd sample pairs followed by a split step. The complex FFT is radix-2
+// on Q15 data and halves the values at every stage, so it cannot overflow;
+// each bin therefore holds the DFT of the windowed frame divided by n/2 and
+// the power is |X[k]|^2 on that scale, at most 32767^2.
+// Window, twiddle and mel tables are built once in the constructor, the
+// per-frame calls do not allocate.
+
+#define MIN_SIZE 16
+#define MAX_SIZE 4096
+#define MAX_BANDS 64
+#define Q15_ONE 32767
+#define NO_BAND 0xFF
+
+typedef struct _spectrum_obj_t {
+    mp_obj_base_t base;
+    uint16_t size;
+    uint8_t bands;
+    uint32_t rate;
+    int16_t *window;
+    int16_t *cos_table;
+    int16_t *sin_table;
+    int16_t *re;
+    int16_t *im;
+    uint32_t *power;
+    // Mel filterbank: bin k lies between mel points band_of[k] and
+    // band_of[k] + 1, at fractional position band_weight[k] in Q15.
+    uint8_t *band_of;
+    uint16_t *band_weight;
+} spectrum_obj_t;
+
+extern const mp_obj_type_t spectrum_type;
+
+static float spectrum_hz_to_mel(float hz) {
+    return 2595.0f * log10f(1.0f + hz / 700.0f);
+}
+
+static float spectrum_mel_to_hz(float mel) {
+    return 700.0f * (powf(10.0f, mel / 2595.0f) - 1.0f);
+}
+
+static void spectrum_init_bands(spectrum_obj_t *self) {
+    size_t bins = self->size / 2;
+    float points[MAX_BANDS + 2];
+    float mel_max = spectrum_hz_to_mel(self->rate / 2.0f);
+    for (size_t i = 0; i < self->bands + 2u; i++) {
+        float hz = spectrum_mel_to_hz(mel_max * i / (self->bands + 1));
+        points[i] = hz * self->size / self->rate;
+    }
+
+    size_t j = 0;
+    for (size_t k = 0; k < bins; k++) {
+        while (j < self->bands + 1u && k >= points[j + 1]) {
+            j++;
+        }
+        if (k < points[0] || j >= self->bands + 1u || points[j + 1] <= points[j]) {
+            self->band_of[k] = NO_BAND;
+            self->band_weight[k] = 0;
+            continue;
+        }
+        self->band_of[k] = j;
+        self->band_weight[k] = (uint16_t)((k - points[j]) / (points[j + 1] - points[j]) * 32768.0f);
+    }
+}
+
+static void spectrum_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t kind) {
+    spectrum_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_printf(print, "Spectrum(size=%u, bands=%u, rate=%u)", self->size, self->bands, (unsigned int)self->rate);
+}
+
+// Spectrum(size, bands=0, rate=16000)
+static mp_obj_t spectrum_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *all_args) {
+    enum { ARG_size, ARG_bands, ARG_rate };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_size, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_bands, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_rate, MP_ARG_INT, {.u_int = 16000} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all_kw_array(n_args, n_kw, all_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t size = args[ARG_size].u_int;
+    if (size < MIN_SIZE || size > MAX_SIZE || (size & (size - 1)) != 0) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("size must be a power of 2 from %d to %d"),
+                          MIN_SIZE, MAX_SIZE);
+    }
+    mp_int_t bands = args[ARG_bands].u_int;
+    if (bands < 0 || bands > MAX_BANDS) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("bands must be 0 to %d"), MAX_BANDS);
+    }
+    if (args[ARG_rate].u_int <= 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("rate must be positive"));
+    }
+
+    spectrum_obj_t *self = mp_obj_malloc(spectrum_obj_t, &spectrum_type);
+    self->size = size;
+    self->bands = bands;
+    self->rate = args[ARG_rate].u_int;
+
+    size_t half = size / 2;
+    self->window = m_new(int16_t, size);
+    self->cos_table = m_new(int16_t, half);
+    self->sin_table = m_new(int16_t, half);
+    self->re = m_new(int16_t, half);
+    self->im = m_new(int16_t, half);
+    self->power = m_new(uint32_t, half);
+
+    // Periodic Hann window and twiddles e^(-2*pi*i*k/size), both Q15.
+    const float two_pi = 6.28318530718f;
+    for (size_t i = 0; i < (size_t)size; i++) {
+        self->window[i] = (int16_t)(Q15_ONE * (0.5f - 0.5f * cosf(two_pi * i / size)) + 0.5f);
+    }
+    for (size_t k = 0; k < half; k++) {
+        self->cos_table[k] = (int16_t)lroundf(Q15_ONE * cosf(two_pi * k / size));
+        self->sin_table[k] = (int16_t)lroundf(Q15_ONE * sinf(two_pi * k / size));
+    }
+
+    self->band_of = NULL;
+    self->band_weight = NULL;
+    if (bands > 0) {
+        self->band_of = m_new(uint8_t, half);
+        self->band_weight = m_new(uint16_t, half);
+        spectrum_init_bands(self);
+    }
+
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// In-place radix-2 complex FFT of size/2 points on self->re/im, scaled by
+// 1/2 per stage.
+static void spectrum_fft(spectrum_obj_t *self) {
+    size_t n = self->size / 2;
+    int16_t *re = self->re;
+    int16_t *im = self->im;
+
+    for (size_t i = 1, j = 0; i < n; i++) {
+        size_t bit = n >> 1;
+        for (; j & bit; bit >>= 1) {
+            j ^= bit;
+        }
+        j ^= bit;
+        if (i < j) {
+            int16_t t = re[i];
+            re[i] = re[j];
+            re[j] = t;
+            t = im[i];
+            im[i] = im[j];
+            im[j] = t;
+        }
+    }
+
+    for (size_t len = 2; len <= n; len <<= 1) {
+        size_t half = len / 2;
+        size_t step = self->size / len;
+        for (size_t i = 0; i < n; i += len) {
+            for (size_t j = 0; j < half; j++) {
+                int32_t wr = self->cos_table[j * step];
+                int32_t wi = -self->sin_table[j * step];
+                size_t a = i + j;
+                size_t b = a + half;
+                int32_t tr = (re[b] * wr - im[b] * wi) >> 15;
+                int32_t ti = (re[b] * wi + im[b] * wr) >> 15;
+                int32_t ur = re[a];
+                int32_t ui = im[a];
+                re[a] = (ur + tr) >> 1;
+                im[a] = (ui + ti) >> 1;
+                re[b] = (ur - tr) >> 1;
+                im[b] = (ui - ti) >> 1;
+            }
+        }
+    }
+}
+
+// Window one frame, run the real FFT and leave the power of bins
+// 0 .. size/2 - 1 in self->power.
+static void spectrum_compute(spectrum_obj_t *self, mp_obj_t samples_in) {
+    mp_buffer_info_t src;
+    mp_get_buffer_raise(samples_in, &src, MP_BUFFER_READ);
+    if (src.len < self->size * sizeof(int16_t)) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("need %u samples"), self->size);
+    }
+
+    // Pack even samples into re and odd samples into im.
+    const uint8_t *in = src.buf;
+    size_t half = self->size / 2;
+    for (size_t k = 0; k < half; k++) {
+        int16_t x0 = (int16_t)(in[4 * k] | (in[4 * k + 1] << 8));
+        int16_t x1 = (int16_t)(in[4 * k + 2] | (in[4 * k + 3] << 8));
+        self->re[k] = (x0 * self->window[2 * k]) >> 15;
+        self->im[k] = (x1 * self->window[2 * k + 1]) >> 15;
+    }
+
+    spectrum_fft(self);
+
+    // Split the packed spectrum Z into the real-input spectrum X:
+    // X[k] = (Z[k] + conj(Z[m])) / 2 - i * W^k * (Z[k] - conj(Z[m])) / 2
+    // with m = half - k, Z[half] = Z[0].
+    for (size_t k = 0; k < half; k++) {
+        size_t m = k == 0 ? 0 : half - k;
+        int32_t er = (self->re[k] + self->re[m]) >> 1;
+        int32_t ei = (self->im[k] - self->im[m]) >> 1;
+        int32_t or_ = (self->im[k] + self->im[m]) >> 1;
+        int32_t oi = (self->re[m] - self->re[k]) >> 1;
+        int32_t wr = self->cos_table[k];
+        int32_t wi = -self->sin_table[k];
+        int32_t xr = er + ((or_ * wr - oi * wi) >> 15);
+        int32_t xi = ei + ((or_ * wi + oi * wr) >> 15);
+        self->power[k] = (uint32_t)(xr * xr) + (uint32_t)(xi * xi);
+    }
+}
+
+static uint32_t *spectrum_get_output(mp_obj_t out_in, size_t count) {
+    mp_buffer_info_t dst;
+    mp_get_buffer_raise(out_in, &dst, MP_BUFFER_WRITE);
+    if (mp_binary_get_size('@', dst.typecode, NULL) != sizeof(uint32_t)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("output must be a 32-bit array"));
+    }
+    if (dst.len < count * sizeof(uint32_t)) {
+        mp_raise_msg_varg(&mp_type_ValueError, MP_ERROR_TEXT("output needs %u items"), (unsigned int)count);
+    }
+    return dst.buf;
+}
+
+// power_into(samples, out) computes the windowed power spectrum of the first
+// size samples (16-bit) into out, an array('I') of size/2 bins.
+static mp_obj_t spectrum_power_into(mp_obj_t self_in, mp_obj_t samples_in, mp_obj_t out_in) {
+    spectrum_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    uint32_t *out = spectrum_get_output(out_in, self->size / 2);
+    spectrum_compute(self, samples_in);
+    memcpy(out, self->power, self->size / 2 * sizeof(uint32_t));
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_3(spectrum_power_into_obj, spectrum_power_into);
+
+// bands_into(samples, out) computes the mel band energies of the first size
+// samples into out, an array('I') with one item per band.
+static mp_obj_t spectrum_bands_into(mp_obj_t self_in, mp_obj_t samples_in, mp_obj_t out_in) {
+    spectrum_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->bands == 0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("no bands configured"));
+    }
+    uint32_t *out = spectrum_get_output(out_in, self->bands);
+    spectrum_compute(self, samples_in);
+
+    // Each bin feeds the rising edge of one triangle and the falling edge of
+    // the previous one.
+    uint64_t energy[MAX_BANDS];
+    memset(energy, 0, self->bands * sizeof(uint64_t));
+    for (size_t k = 0; k < self->size / 2u; k++) {
+        size_t j = self->band_of[k];
+        if (j == NO_BAND) {
+            continue;
+        }
+        uint64_t p = self->power[k];
+        uint32_t w = self->band_weight[k];
+        if (j < self->bands) {
+            energy[j] += p * w;
+        }
+        if (j > 0) {
+            energy[j - 1] += p * (32768 - w);
+        }
+    }
+    for (size_t b = 0; b < self->bands; b++) {
+        uint64_t e = energy[b] >> 15;
+        out[b] = e > UINT32_MAX ? UINT32_MAX : (uint32_t)e;
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_3(spectrum_bands_into_obj, spectrum_bands_into);
+
+static const mp_rom_map_elem_t spectrum_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_power_into), MP_ROM_PTR(&spectrum_power_into_obj) },
+    { MP_ROM_QSTR(MP_QSTR_bands_into), MP_ROM_PTR(&spectrum_bands_into_obj) },
+};
+static MP_DEFINE_CONST_DICT(spectrum_locals_dict, spectrum_locals_dict_table);
+
+MP_DEFINE_CONST_OBJ_TYPE(
+    spectrum_type,
+    MP_QSTR_Spectrum,
+    MP_TYPE_FLAG_NONE,
+    make_new, spectrum_make_new,
+    print, spectrum_print,
+    locals_dict, &spectrum_locals_dict
+);
+
+static const mp_rom_map_elem_t spectrum_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_Spectrum) },
+    { MP_ROM_QSTR(MP_QSTR_Spectrum), MP_ROM_PTR(&spectrum_type) },
+};
+static MP_DEFINE_CONST_DICT(spectrum_module_globals, spectrum_module_globals_table);
+
+const mp_obj_module_t spectrum_module = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&spectrum_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR_Spectrum, spectrum_module);
@@ -0,0 +1,80 @@
+"""
+Check the ADCDMA module against its simulated backend on the unix port.
+
+Build the unix port with the module, then run this script with it:
+
+    make -C lib/micropython/ports/unix USER_C_MODULES=$PWD/src/cmodules
+    lib/micropython/ports/unix/build-standard/micropython tools/adcdma/check_sim.py
+
+The simulated backend produces a 50 Hz sine around mid-scale, continuous
+across reads, so a read of n samples at rate Hz must contain n * 50 / rate
+periods. Runs under MicroPython, so only its builtins are used.
+"""
+import sys
+from array import array
+from ADCDMA import ADCDMA
+
+SIGNAL_HZ = 50
+MIDSCALE = 2048
+
+
+def rising_crossings(samples, prev):
+    count = 0
+    for s in samples:
+        if prev < MIDSCALE <= s:
+            count += 1
+        prev = s
+    return count, prev
+
+
+def check(rate, n, reads):
+    adc = ADCDMA(0)
+    buf = array("H", bytes(n * 2))
+    crossings = 0
+    prev = MIDSCALE
+    for _ in range(reads):
+        if adc.read_timed(buf, rate) != n:
+            print("MISMATCH: short read at %d Hz" % rate)
+            return False
+        c, prev = rising_crossings(buf, prev)
+        crossings += c
+    adc.deinit()
+    expected = n * reads * SIGNAL_HZ // rate
+    if abs(crossings - expected) > 1:
+        print("MISMATCH: %d periods at %d Hz, expected %d" % (crossings, rate, expected))
+        return False
+    print("OK: %d Hz, %d reads of %d samples, %d periods" % (rate, reads, n, crossings))
+    return True
+
+
+# XiaoADC passes the attenuation of its machine.ADC to ADCDMA, so the full
+# scale of timed reads follows it: the simulated amplitude is set by atten.
+def check_atten(atten):
+    adc = ADCDMA(0, atten=atten)
+    buf = array("H", bytes(400))
+    adc.read_timed(buf, 1000)
+    adc.deinit()
+    if max(buf) - MIDSCALE != 500 * (atten + 1) - 1:
+        print("MISMATCH: atten %d not applied, peak %d" % (atten, max(buf)))
+        return False
+    return True
+
+
+def main():
+    ok = True
+    for rate, n, reads in ((1000, 100, 20), (16000, 1600, 4), (80000, 4000, 5)):
+        ok = check(rate, n, reads) and ok
+    for atten in (ADCDMA.ATTN_0DB, ADCDMA.ATTN_6DB, ADCDMA.ATTN_11DB):
+        ok = check_atten(atten) and ok
+    try:
+        ADCDMA(0).read_timed(array("H", bytes(2)), 10)
+        print("MISMATCH: rate below the minimum accepted")
+        ok = False
+    except ValueError:
+        pass
+    if not ok:
+        sys.exit("ADCDMA check failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Host-side IMA-ADPCM reference codec for recordings made with the ADPCM module.
+
+The stream format matches ADPCM.encode_into() on the device: one 4-bit code
+per 16-bit sample, two codes per byte with the first sample in the low
+nibble, no block headers, and the codec state starting at predictor 0,
+index 0.
+
+Commands:
+- decode: ADPCM stream -> 16-bit PCM WAV.
+- encode: 16-bit mono PCM WAV -> ADPCM stream, using the reference encoder.
+- verify: encode a PCM WAV with the reference encoder and compare it
+  bit-exact against a stream recorded on the device.
+"""
+from __future__ import annotations
+import argparse
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+STEP_TABLE = (
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17,
+    19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118,
+    130, 143, 157, 173, 190, 209, 230, 253, 279, 307,
+    337, 371, 408, 449, 494, 544, 598, 658, 724, 796,
+    876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+    2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358,
+    5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899,
+    15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767,
+)
+
+INDEX_TABLE = (-1, -1, -1, -1, 2, 4, 6, 8, -1, -1, -1, -1, 2, 4, 6, 8)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return low if value < low else high if value > high else value
+
+
+def _vpdiff(step: int, code: int) -> int:
+    diff = step >> 3
+    if code & 4:
+        diff += step
+    if code & 2:
+        diff += step >> 1
+    if code & 1:
+        diff += step >> 2
+    return diff
+
+
+class Encoder:
+    def __init__(self, predictor: int = 0, index: int = 0) -> None:
+        self.predictor = predictor
+        self.index = index
+
+    def encode_sample(self, sample: int) -> int:
+        step = STEP_TABLE[self.index]
+        diff = sample - self.predictor
+        code = 0
+        if diff < 0:
+            code = 8
+            diff = -diff
+        if diff >= step:
+            code |= 4
+            diff -= step
+        if diff >= step >> 1:
+            code |= 2
+            diff -= step >> 1
+        if diff >= step >> 2:
+            code |= 1
+        delta = _vpdiff(step, code)
+        self.predictor = _clamp(self.predictor - delta if code & 8 else self.predictor + delta, -32768, 32767)
+        self.index = _clamp(self.index + INDEX_TABLE[code], 0, 88)
+        return code
+
+    def encode(self, samples: array) -> bytes:
+        out = bytearray((len(samples) + 1) // 2)
+        for i in range(0, len(samples), 2):
+            code = self.encode_sample(samples[i])
+            if i + 1 < len(samples):
+                code |= self.encode_sample(samples[i + 1]) << 4
+            out[i // 2] = code
+        return bytes(out)
+
+
+class Decoder:
+    def __init__(self, predictor: int = 0, index: int = 0) -> None:
+        self.predictor = predictor
+        self.index = index
+
+    def decode_code(self, code: int) -> int:
+        delta = _vpdiff(STEP_TABLE[self.index], code)
+        self.predictor = _clamp(self.predictor - delta if code & 8 else self.predictor + delta, -32768, 32767)
+        self.index = _clamp(self.index + INDEX_TABLE[code], 0, 88)
+        return self.predictor
+
+    def decode(self, data: bytes) -> array:
+        out = array("h")
+        for byte in data:
+            out.append(self.decode_code(byte & 0x0F))
+            out.append(self.decode_code(byte >> 4))
+        return out
+
+
+def read_pcm_wav(path: Path) -> tuple[array, int]:
+    with wave.open(str(path), "rb") as w:
+        if w.getsampwidth() != 2 or w.getnchannels() != 1:
+            sys.exit(f"ERROR: '{path}' must be 16-bit mono PCM.")
+        samples = array("h", w.readframes(w.getnframes()))
+        if sys.byteorder == "big":
+            samples.byteswap()
+        return samples, w.getframerate()
+
+
+def write_pcm_wav(path: Path, samples: array, rate: int) -> None:
+    if sys.byteorder == "big":
+        samples = array("h", samples)
+        samples.byteswap()
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def cmd_decode(args: argparse.Namespace) -> None:
+    samples = Decoder(args.predictor, args.index).decode(Path(args.input).read_bytes())
+    write_pcm_wav(Path(args.output), samples, args.rate)
+    print(f"Decoded {len(samples)} samples to {args.output}")
+
+
+def cmd_encode(args: argparse.Namespace) -> None:
+    samples, _ = read_pcm_wav(Path(args.input))
+    Path(args.output).write_bytes(Encoder(args.predictor, args.index).encode(samples))
+    print(f"Encoded {len(samples)} samples to {args.output}")
+
+
+def cmd_verify(args: argparse.Namespace) -> None:
+    samples, _ = read_pcm_wav(Path(args.pcm))
+    expected = Encoder(args.predictor, args.index).encode(samples)
+    actual = Path(args.adpcm).read_bytes()
+    if len(actual) != len(expected):
+        sys.exit(f"MISMATCH: length {len(actual)} bytes, expected {len(expected)}")
+    for offset, (a, e) in enumerate(zip(actual, expected)):
+        if a != e:
+            sys.exit(f"MISMATCH: first difference at byte {offset} (sample {offset * 2}): 0x{a:02X} != 0x{e:02X}")
+    print(f"OK: {len(actual)} bytes ({len(samples)} samples) match the reference encoder")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="IMA-ADPCM reference codec")
+    parser.add_argument("--predictor", type=int, default=0, help="initial predictor (default: 0)")
+    parser.add_argument("--index", type=int, default=0, help="initial step index (default: 0)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("decode", help="decode an ADPCM stream to a PCM WAV file")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--rate", type=int, default=16000, help="sample rate of the WAV file (default: 16000)")
+    p.set_defaults(func=cmd_decode)
+
+    p = sub.add_parser("encode", help="encode a 16-bit mono PCM WAV file")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.set_defaults(func=cmd_encode)
+
+    p = sub.add_parser("verify", help="check a device stream bit-exact against the reference encoder")
+    p.add_argument("pcm", help="16-bit mono PCM WAV of the same audio")
+    p.add_argument("adpcm", help="ADPCM stream recorded on the device")
+    p.set_defaults(func=cmd_verify)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Host-side Madgwick AHRS reference for the AHRS module.
+
+The filter matches AHRS.update() on the device: raw 16-bit gyro and accel
+samples, the gyro scaled by its udps/LSB sensitivity, one gradient descent
+step per sample, starting from the identity quaternion. The device works in
+single precision, so its quaternions agree with this reference to about
+1e-4 rather than bit-exact.
+
+Logs are CSV with a header. Each row holds gx, gy, gz, ax, ay, az as raw
+LSM6DSO readings, optionally followed by the true orientation w, x, y, z.
+
+Commands:
+- simulate: write a log of a known motion with sensor noise and gyro bias.
+- run: filter a log with the reference, report the error against the true
+  orientation when the log has one, and optionally write the quaternions.
+- verify: compare quaternions computed on the device against the reference.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import math
+import random
+import sys
+from pathlib import Path
+
+SAMPLE_FIELDS = ("gx", "gy", "gz", "ax", "ay", "az")
+TRUTH_FIELDS = ("w", "x", "y", "z")
+
+Quat = tuple[float, float, float, float]
+Sample = tuple[int, int, int, int, int, int]
+
+
+class Madgwick:
+    def __init__(self, rate: int, gyro_udps: int = 8750, beta: float = 0.1) -> None:
+        self.dt = 1.0 / rate
+        self.gyro_scale = gyro_udps * 1e-6 * math.pi / 180.0
+        self.beta = beta
+        self.q: Quat = (1.0, 0.0, 0.0, 0.0)
+
+    def update(self, sample: Sample) -> Quat:
+        q0, q1, q2, q3 = self.q
+        gx, gy, gz = (v * self.gyro_scale for v in sample[:3])
+        ax, ay, az = sample[3:]
+
+        qd0 = 0.5 * (-q1 * gx - q2 * gy - q3 * gz)
+        qd1 = 0.5 * (q0 * gx + q2 * gz - q3 * gy)
+        qd2 = 0.5 * (q0 * gy - q1 * gz + q3 * gx)
+        qd3 = 0.5 * (q0 * gz + q1 * gy - q2 * gx)
+
+        norm = ax * ax + ay * ay + az * az
+        if norm > 0:
+            norm = 1.0 / math.sqrt(norm)
+            ax *= norm
+            ay *= norm
+            az *= norm
+            q0q0, q1q1, q2q2, q3q3 = q0 * q0, q1 * q1, q2 * q2, q3 * q3
+            s0 = 4 * q0 * q2q2 + 2 * q2 * ax + 4 * q0 * q1q1 - 2 * q1 * ay
+            s1 = (4 * q1 * q3q3 - 2 * q3 * ax + 4 * q0q0 * q1 - 2 * q0 * ay - 4 * q1
+                  + 8 * q1 * q1q1 + 8 * q1 * q2q2 + 4 * q1 * az)
+            s2 = (4 * q0q0 * q2 + 2 * q0 * ax + 4 * q2 * q3q3 - 2 * q3 * ay - 4 * q2
+                  + 8 * q2 * q1q1 + 8 * q2 * q2q2 + 4 * q2 * az)
+            s3 = 4 * q1q1 * q3 - 2 * q1 * ax + 4 * q2q2 * q3 - 2 * q2 * ay
+            norm = s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3
+            if norm > 0:
+                norm = self.beta / math.sqrt(norm)
+                qd0 -= norm * s0
+                qd1 -= norm * s1
+                qd2 -= norm * s2
+                qd3 -= norm * s3
+
+        q0 += qd0 * self.dt
+        q1 += qd1 * self.dt
+        q2 += qd2 * self.dt
+        q3 += qd3 * self.dt
+        norm = 1.0 / math.sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3)
+        self.q = (q0 * norm, q1 * norm, q2 * norm, q3 * norm)
+        return self.q
+
+
+def quat_mul(a: Quat, b: Quat) -> Quat:
+    return (
+        a[0] * b[0] - a[1] * b[1] - a[2] * b[2] - a[3] * b[3],
+        a[0] * b[1] + a[1] * b[0] + a[2] * b[3] - a[3] * b[2],
+        a[0] * b[2] - a[1] * b[3] + a[2] * b[0] + a[3] * b[1],
+        a[0] * b[3] + a[1] * b[2] - a[2] * b[1] + a[3] * b[0],
+    )
+
+
+def quat_conj(q: Quat) -> Quat:
+    return (q[0], -q[1], -q[2], -q[3])
+
+
+def quat_from_euler(roll: float, pitch: float, yaw: float) -> Quat:
+    cr, sr = math.cos(roll / 2), math.sin(roll / 2)
+    cp, sp = math.cos(pitch / 2), math.sin(pitch / 2)
+    cy, sy = math.cos(yaw / 2), math.sin(yaw / 2)
+    return (
+        cr * cp * cy + sr * sp * sy,
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+    )
+
+
+def euler(q: Quat) -> tuple[float, float, float]:
+    """(roll, pitch, yaw) in degrees, as AHRS.euler() returns them."""
+    q0, q1, q2, q3 = q
+    sp = max(-1.0, min(1.0, 2 * (q0 * q2 - q3 * q1)))
+    return (
+        math.degrees(math.atan2(2 * (q0 * q1 + q2 * q3), 1 - 2 * (q1 * q1 + q2 * q2))),
+        math.degrees(math.asin(sp)),
+        math.degrees(math.atan2(2 * (q0 * q3 + q1 * q2), 1 - 2 * (q2 * q2 + q3 * q3))),
+    )
+
+
+def tilt_error(q: Quat, truth: Quat) -> float:
+    """Angle in degrees between the gravity directions the two orientations imply."""
+    def down(p: Quat) -> tuple[float, float, float]:
+        v = quat_mul(quat_mul(quat_conj(p), (0.0, 0.0, 0.0, 1.0)), p)
+        return v[1], v[2], v[3]
+    a, b = down(q), down(truth)
+    dot = max(-1.0, min(1.0, a[0] * b[0] + a[1] * b[1] + a[2] * b[2]))
+    return math.degrees(math.acos(dot))
+
+
+def simulate(rate: int, seconds: float, gyro_udps: int, accel_ug: int,
+             noise: float, bias: float, seed: int) -> list[tuple[Sample, Quat]]:
+    """Sinusoidal motion on all three axes, starting level at the identity."""
+    rng = random.Random(seed)
+    dt = 1.0 / rate
+
+    def truth(t: float) -> Quat:
+        return quat_from_euler(
+            math.radians(40) * math.sin(2 * math.pi * 0.3 * t),
+            math.radians(25) * math.sin(2 * math.pi * 0.17 * t),
+            math.radians(90) * math.sin(2 * math.pi * 0.05 * t),
+        )
+
+    gyro_lsb = gyro_udps * 1e-6 * math.pi / 180.0   # rad/s per LSB
+    accel_lsb = accel_ug * 1e-6                     # g per LSB
+    gyro_bias = [rng.gauss(0.0, bias) for _ in range(3)]
+
+    def raw(value: float, lsb: float, sigma: float) -> int:
+        return max(-32768, min(32767, round(value / lsb + rng.gauss(0.0, sigma))))
+
+    rows: list[tuple[Sample, Quat]] = []
+    for i in range(round(seconds * rate)):
+        t = i * dt
+        q = truth(t)
+        # Body rate from the change of orientation over one sample
+        d = quat_mul(quat_conj(truth(t - dt / 2)), truth(t + dt / 2))
+        omega = (2 * d[1] / dt, 2 * d[2] / dt, 2 * d[3] / dt)
+        g = quat_mul(quat_mul(quat_conj(q), (0.0, 0.0, 0.0, 1.0)), q)
+        sample = (
+            raw(omega[0], gyro_lsb, noise) + round(gyro_bias[0]),
+            raw(omega[1], gyro_lsb, noise) + round(gyro_bias[1]),
+            raw(omega[2], gyro_lsb, noise) + round(gyro_bias[2]),
+            raw(g[1], accel_lsb, noise),
+            raw(g[2], accel_lsb, noise),
+            raw(g[3], accel_lsb, noise),
+        )
+        rows.append((sample, q))
+    return rows
+
+
+def read_log(path: Path) -> tuple[list[Sample], list[Quat]]:
+    samples: list[Sample] = []
+    truth: list[Quat] = []
+    with path.open(newline="") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        if not all(name in fields for name in SAMPLE_FIELDS):
+            raise ValueError("%s: header must include %s" % (path, ",".join(SAMPLE_FIELDS)))
+        has_truth = all(name in fields for name in TRUTH_FIELDS)
+        for row in reader:
+            samples.append(tuple(int(row[name]) for name in SAMPLE_FIELDS))
+            if has_truth:
+                truth.append(tuple(float(row[name]) for name in TRUTH_FIELDS))
+    return samples, truth
+
+
+def read_quaternions(path: Path) -> list[Quat]:
+    quats: list[Quat] = []
+    with path.open(newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0] in TRUTH_FIELDS:
+                continue
+            if len(row) != 4:
+                raise ValueError("%s: expected w,x,y,z per row" % path)
+            quats.append(tuple(float(v) for v in row))
+    return quats
+
+
+def write_quaternions(path: Path, quats: list[Quat]) -> None:
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(TRUTH_FIELDS)
+        for q in quats:
+            writer.writerow(["%.6f" % v for v in q])
+
+
+def run_filter(samples: list[Sample], args: argparse.Namespace) -> list[Quat]:
+    ahrs = Madgwick(args.rate, args.gyro_udps, args.beta)
+    return [ahrs.update(s) for s in samples]
+
+
+def cmd_simulate(args: argparse.Namespace) -> None:
+    rows = simulate(args.rate, args.seconds, args.gyro_udps, args.accel_ug,
+                    args.noise, args.bias, args.seed)
+    with args.log.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SAMPLE_FIELDS + TRUTH_FIELDS)
+        for sample, q in rows:
+            writer.writerow(list(sample) + ["%.6f" % v for v in q])
+    print("Wrote %d samples (%.1f s at %d Hz) to %s" % (len(rows), args.seconds, args.rate, args.log))
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    samples, truth = read_log(args.log)
+    quats = run_filter(samples, args)
+    if args.out:
+        write_quaternions(args.out, quats)
+    if quats:
+        print("final: roll %.2f pitch %.2f yaw %.2f" % euler(quats[-1]))
+    if not truth:
+        return
+    # Skip the first second while the filter converges from the identity
+    skip = min(args.rate, len(quats) // 2)
+    errors = [tilt_error(q, t) for q, t in zip(quats[skip:], truth[skip:])]
+    rms = math.sqrt(sum(e * e for e in errors) / len(errors)) if errors else 0.0
+    worst = max(errors, default=0.0)
+    print("tilt error: rms %.3f deg, max %.3f deg over %d samples" % (rms, worst, len(errors)))
+    if args.max_error is not None and worst > args.max_error:
+        sys.exit("Tilt error exceeds %.3f deg" % args.max_error)
+
+
+def cmd_verify(args: argparse.Namespace) -> None:
+    samples, _ = read_log(args.log)
+    device = read_quaternions(args.device)
+    if len(device) > len(samples):
+        raise ValueError("%s has more quaternions than %s has samples" % (args.device, args.log))
+    reference = run_filter(samples[:len(device)], args)
+    worst = 0.0
+    worst_index = 0
+    for i, (d, r) in enumerate(zip(device, reference)):
+        # q and -q are the same orientation
+        sign = 1.0 if sum(a * b for a, b in zip(d, r)) >= 0 else -1.0
+        diff = max(abs(a - sign * b) for a, b in zip(d, r))
+        if diff > worst:
+            worst, worst_index = diff, i
+    print("Compared %d quaternions, max difference %.2e at sample %d" % (len(device), worst, worst_index))
+    if worst > args.tolerance:
+        sys.exit("Difference exceeds tolerance %.1e" % args.tolerance)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def filter_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--rate", type=int, default=416, help="sample rate in Hz (default: 416)")
+        p.add_argument("--gyro-udps", type=int, default=8750,
+                       help="gyro sensitivity in udps/LSB (default: 8750, 250 dps)")
+        p.add_argument("--beta", type=float, default=0.1, help="filter gain (default: 0.1)")
+
+    p = sub.add_parser("simulate", help="write a log of a known motion")
+    p.add_argument("log", type=Path)
+    p.add_argument("--rate", type=int, default=416, help="sample rate in Hz (default: 416)")
+    p.add_argument("--seconds", type=float, default=20.0, help="duration (default: 20)")
+    p.add_argument("--gyro-udps", type=int, default=8750,
+                   help="gyro sensitivity in udps/LSB (default: 8750, 250 dps)")
+    p.add_argument("--accel-ug", type=int, default=61, help="accel sensitivity in ug/LSB (default: 61, 2g)")
+    p.add_argument("--noise", type=float, default=8.0, help="sensor noise in LSB rms (default: 8)")
+    p.add_argument("--bias", type=float, default=20.0, help="gyro bias spread in LSB (default: 20)")
+    p.add_argument("--seed", type=int, default=1)
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("run", help="filter a log with the reference")
+    p.add_argument("log", type=Path)
+    p.add_argument("--out", type=Path, help="write w,x,y,z per sample to this CSV")
+    p.add_argument("--max-error", type=float, help="fail if the tilt error exceeds this many degrees")
+    filter_args(p)
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("verify", help="compare device quaternions against the reference")
+    p.add_argument("log", type=Path)
+    p.add_argument("device", type=Path, help="w,x,y,z per sample computed on the device")
+    p.add_argument("--tolerance", type=float, default=1e-3, help="max component difference (default: 1e-3)")
+    filter_args(p)
+    p.set_defaults(func=cmd_verify)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        sys.exit("Error: %s" % e)
+
+
+if __name__ == "__main__":
+    main()
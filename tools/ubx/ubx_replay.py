@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Host-side replay and check for example/boards/ubx.py.
+
+Commands:
+- synth: write a byte stream of UBX NAV-PVT or CASIC NAV-PV frames for a
+  short drive. The stream includes NMEA text before the switch to binary,
+  ACK frames, and one frame with a corrupted payload byte.
+- replay: feed a recorded stream through UBXReader or CASICReader in
+  UART-sized chunks. Report frames, checksum errors, the last solution and
+  the throughput, and optionally write one CSV row per record. With
+  --check every frame is also decoded by an independent whole-buffer
+  parser here, and the records must match.
+
+Record a stream from a receiver on Linux with, for example:
+  stty -F /dev/ttyUSB0 115200 raw && cat /dev/ttyUSB0 > drive.bin
+"""
+from __future__ import annotations
+import argparse
+import csv
+import math
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "example" / "boards"))
+import ubx  # noqa: E402
+
+NMEA_PREAMBLE = (
+    ubx.pcas("GNGGA,031415.000,2232.4321,N,11356.0700,E,1,09,1.02,35.2,M,-3.5,M,,")
+    + ubx.pcas("GNRMC,031415.000,A,2232.4321,N,11356.0700,E,0.000,0.00,181026,,,A,V")
+)
+
+
+def pvt_payload(i: int, lat: float, lon: float, speed: float, heading: float) -> bytes:
+    payload = bytearray(ubx.NavPVT.SIZE)
+    struct.pack_into(
+        ubx.NavPVT.FORMAT, payload, 0,
+        i * 100, 2026, 10, 18, 3, 14, 15 + i // 10, 0x37, 25, 0, 3, 0x01, 0xEA, 11,
+        round(lon * 1e7), round(lat * 1e7), 35200 + i, 38700 + i, 1500, 2300,
+        round(speed * 1000 * math.cos(math.radians(heading))),
+        round(speed * 1000 * math.sin(math.radians(heading))), 0,
+        round(speed * 1000), round(heading * 1e5), 300, 250000, 102)
+    return bytes(payload)
+
+
+def pv_payload(i: int, lat: float, lon: float, speed: float, heading: float) -> bytes:
+    payload = bytearray(ubx.NavPV.SIZE)
+    struct.pack_into("<IBBBBBBBxfddffffffffffff", payload, 0,
+                     i * 100, 7, 7, 0x03, 11, 7, 4, 0, 1.02, lon, lat, 35.2, -3.5, 1.5, 2.3,
+                     speed * math.cos(math.radians(heading)),
+                     speed * math.sin(math.radians(heading)), 0.0, speed, speed,
+                     heading, 0.3, 2.5)
+    return bytes(payload)
+
+
+def synth(protocol: str, seconds: float, rate: int) -> bytes:
+    out = bytearray(NMEA_PREAMBLE)
+    if protocol == "ubx":
+        out += ubx.ubx_frame(ubx.UBX_ACK_ACK, bytes(ubx.UBX_CFG_MSG))
+    else:
+        out += ubx.casic_frame(ubx.CASIC_ACK_ACK, bytes(ubx.CASIC_CFG_MSG) + b"\x00\x00")
+    count = round(seconds * rate)
+    for i in range(count):
+        heading = (40 + 1.5 * i / rate) % 360
+        lat = 22.5405 + 2e-5 * i / rate
+        lon = 113.9345 + 3e-5 * i / rate
+        speed = 1.6 + 0.2 * math.sin(i / 25)
+        if protocol == "ubx":
+            frame = ubx.ubx_frame(ubx.UBX_NAV_PVT, pvt_payload(i, lat, lon, speed, heading))
+        else:
+            frame = ubx.casic_frame(ubx.CASIC_NAV_PV, pv_payload(i, lat, lon, speed, heading))
+        if i == count // 2:
+            frame[20] ^= 0x10
+        out += frame
+    return bytes(out)
+
+
+def reference_records(data: bytes, protocol: str) -> list[tuple]:
+    """Whole-buffer decode with bytes.find and struct, independent of ubx.py."""
+    records = []
+    sync = ubx.UBX_SYNC if protocol == "ubx" else ubx.CASIC_SYNC
+    i = data.find(sync)
+    while 0 <= i and i + 6 <= len(data):
+        if protocol == "ubx":
+            cls, msg_id, length = struct.unpack_from("<BBH", data, i + 2)
+            end = i + 6 + length + 2
+            body = data[i + 2:end - 2]
+            a = b = 0
+            for c in body:
+                a = (a + c) & 0xFF
+                b = (b + a) & 0xFF
+            ok = end <= len(data) and bytes((a, b)) == data[end - 2:end]
+            wanted = (cls, msg_id) == ubx.UBX_NAV_PVT and length == ubx.NavPVT.SIZE
+            if ok and wanted:
+                v = struct.unpack_from(ubx.NavPVT.FORMAT, data, i + 6)
+                records.append((v[15], v[14], v[13], v[10]))
+        else:
+            length, cls, msg_id = struct.unpack_from("<HBB", data, i + 2)
+            end = i + 6 + length + 4
+            total = (msg_id << 24) + (cls << 16) + length
+            if length % 4 == 0 and end <= len(data):
+                total += sum(struct.unpack_from("<%dI" % (length // 4), data, i + 6))
+            ok = (length % 4 == 0 and end <= len(data)
+                  and struct.unpack_from("<I", data, end - 4)[0] == total & 0xFFFFFFFF)
+            wanted = (cls, msg_id) == ubx.CASIC_NAV_PV and length == ubx.NavPV.SIZE
+            if ok and wanted:
+                lon, lat = struct.unpack_from("<dd", data, i + 6 + 16)
+                records.append((round(lat * 1e7), round(lon * 1e7), data[i + 6 + 7], data[i + 6 + 4]))
+        i = data.find(sync, end if ok else i + 2)
+    return records
+
+
+def replay(data: bytes, protocol: str, chunk: int) -> tuple[ubx._FrameReader, list[tuple]]:
+    records = []
+
+    def on_record(reader: ubx._FrameReader) -> None:
+        if protocol == "ubx":
+            rec = reader.pvt
+            records.append((rec.lat, rec.lon, rec.num_sv, rec.fix_type))
+        else:
+            rec = reader.pv
+            records.append((rec.lat, rec.lon, rec.num_sv, rec.pos_valid))
+
+    if protocol == "ubx":
+        reader = ubx.UBXReader(callback=on_record)
+    else:
+        reader = ubx.CASICReader(callback=on_record)
+    buf = bytearray(chunk)
+    for start in range(0, len(data), chunk):
+        n = min(chunk, len(data) - start)
+        buf[:n] = data[start:start + n]
+        reader.feed(buf, n)
+    return reader, records
+
+
+def cmd_synth(args: argparse.Namespace) -> None:
+    data = synth(args.protocol, args.seconds, args.rate)
+    args.output.write_bytes(data)
+    print("Wrote %d bytes of %s at %d Hz to %s" % (len(data), args.protocol.upper(), args.rate, args.output))
+
+
+def cmd_replay(args: argparse.Namespace) -> None:
+    data = args.input.read_bytes()
+    start = time.perf_counter()
+    reader, records = replay(data, args.protocol, args.chunk)
+    elapsed = time.perf_counter() - start
+    print("%s: %d bytes, %d frames, %d records, %d checksum errors, %d overflows, %d acks, %d naks" %
+          (args.input.name, len(data), reader.frames, len(records), reader.checksum_errors,
+           reader.overflows, reader.acks, reader.naks))
+    print("%.0f bytes/s, %.0f records/s" % (len(data) / elapsed, len(records) / elapsed))
+    if records:
+        lat, lon, num_sv, fix = records[-1]
+        print("last: %.7f, %.7f, %d satellites, fix %d" % (lat / 1e7, lon / 1e7, num_sv, fix))
+    if args.csv:
+        with args.csv.open("w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("lat_e7", "lon_e7", "num_sv", "fix"))
+            writer.writerows(records)
+    if args.check:
+        expected = reference_records(data, args.protocol)
+        if expected != records:
+            message = "Mismatch: reader decoded %d records, reference %d" % (len(records), len(expected))
+            for got, want in zip(records, expected):
+                if got != want:
+                    message += "\n  first difference: %s != %s" % (got, want)
+                    break
+            sys.exit(message)
+        print("Check: %d records match the reference decode" % len(expected))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay UBX/CASIC byte streams through boards/ubx.py")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("synth", help="write a synthetic binary stream")
+    p.add_argument("output", type=Path)
+    p.add_argument("--protocol", choices=("ubx", "casic"), default="ubx")
+    p.add_argument("--seconds", type=float, default=60.0, help="duration (default: 60)")
+    p.add_argument("--rate", type=int, default=10, help="solutions per second (default: 10)")
+    p.set_defaults(func=cmd_synth)
+
+    p = sub.add_parser("replay", help="parse a recorded stream")
+    p.add_argument("input", type=Path)
+    p.add_argument("--protocol", choices=("ubx", "casic"), default="ubx")
+    p.add_argument("--chunk", type=int, default=64, help="bytes per UART read (default: 64)")
+    p.add_argument("--csv", type=Path, help="write lat, lon, satellites and fix per record")
+    p.add_argument("--check", action="store_true", help="compare against an independent decode")
+    p.set_defaults(func=cmd_replay)
+
+    args = parser.parse_args()
+    if getattr(args, "chunk", 1) <= 0:
+        sys.exit("Error: --chunk must be positive")
+    try:
+        args.func(args)
+    except OSError as e:
+        sys.exit("Error: %s" % e)
+
+
+if __name__ == "__main__":
+    main()